@@ -11,3 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+import time
+
+# When the ``app`` package started to be imported, before ``app.main`` loads the
+# server dependencies. Reported by the startup profile (app/core/startup_profile.py)
+IMPORT_STARTED = time.monotonic()
@@ -0,0 +1,114 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+``batch_call`` meta-tool.
+
+Agents executing a plan of many cheap lookups pay one streamable-HTTP round
+trip per ``tools/call``. ``batch_call`` takes a list of tool invocations and
+runs them concurrently in one request, at most
+``MCP_SERVER_BATCH_MAX_CONCURRENCY`` at a time. Every invocation goes through
+the server middleware, so per-tool and per-tag concurrency limits (see
+app/core/concurrency.py) and drain accounting apply to each of them. Results
+and errors are returned in the order of the invocations; one failing
+invocation does not fail the batch.
+"""
+
+import asyncio
+import logging
+from typing import Annotated, Any, Optional
+
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+from pydantic import BaseModel, Field
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+BATCH_TOOL_NAME = "batch_call"
+
+
+class ToolInvocation(BaseModel):
+    """One tool call of a batch."""
+
+    name: str = Field(description="Name of the tool to call")
+    arguments: dict[str, Any] = Field(
+        default_factory=dict, description="Arguments of the tool"
+    )
+
+
+async def _invoke(
+    mcp: FastMCP, invocation: ToolInvocation, semaphore: asyncio.Semaphore
+) -> dict[str, Any]:
+    outcome: dict[str, Any] = {"name": invocation.name}
+    if invocation.name == BATCH_TOOL_NAME:
+        return {**outcome, "is_error": True, "error": "batch_call cannot be nested"}
+    async with semaphore:
+        try:
+            result = await mcp.call_tool(invocation.name, invocation.arguments)
+        except Exception as e:
+            return {**outcome, "is_error": True, "error": str(e)}
+    return {
+        **outcome,
+        "is_error": bool(result.is_error),
+        "content": [
+            content.model_dump(mode="json", exclude_none=True)
+            for content in result.content
+        ],
+        "structured_content": result.structured_content,
+    }
+
+
+def register_batch_tool(mcp: FastMCP, config: Optional[UserAppConfig] = None) -> None:
+    """Register the ``batch_call`` tool, unless disabled."""
+    config = config or get_user_config()
+    if not config.mcp_server_batch_tool_enabled:
+        return
+    max_calls = config.mcp_server_batch_max_calls
+    max_concurrency = config.mcp_server_batch_max_concurrency
+
+    @mcp.tool(name=BATCH_TOOL_NAME, tags={"batch"})
+    async def batch_call(
+        calls: Annotated[
+            list[ToolInvocation],
+            Field(description="Tool invocations to run", min_length=1),
+        ],
+        ctx: Context,
+    ) -> ToolResult:
+        """
+        Call several tools in one request and return their results in order.
+
+        Use it to run independent tool calls of a plan concurrently instead of
+        one at a time. Each result has the tool name, is_error, and either the
+        content and structured_content of the tool result or an error message.
+        """
+        if len(calls) > max_calls:
+            raise ToolError(
+                f"A batch can hold at most {max_calls} calls, got {len(calls)}"
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(
+            *(_invoke(ctx.fastmcp, invocation, semaphore) for invocation in calls)
+        )
+        failed = sum(result["is_error"] for result in results)
+        logger.debug("Batch of %s tool calls, %s failed", len(results), failed)
+        return ToolResult(
+            structured_content={
+                "results": results,
+                "succeeded": len(results) - failed,
+                "failed": failed,
+            }
+        )
@@ -0,0 +1,292 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-tool and per-tag concurrency limits for tool calls.
+
+Limits are declared with the ``concurrency_limit`` decorator, applied under
+``dr_mcp_tool``, or in ``MCP_SERVER_TOOL_CONCURRENCY_LIMITS`` as a comma
+separated list of ``<tool>=<limit>`` and ``tag:<tag>=<limit>`` entries, which
+take precedence over the decorator::
+
+    MCP_SERVER_TOOL_CONCURRENCY_LIMITS="predict=4,tag:deployment=16"
+
+A call takes a slot of its tool limit and of the limit of each of its tags.
+When no slot is free the call waits in a queue of at most
+``MCP_SERVER_TOOL_QUEUE_SIZE`` calls per limit, for at most
+``MCP_SERVER_TOOL_QUEUE_TIMEOUT`` seconds. Calls arriving on a full queue, or
+still waiting at the deadline, fail fast with a ``ToolError`` telling the client
+when to retry. Slots, queue depth and wait times are tracked in ``stats()`` and
+exported as OpenTelemetry metrics.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, TypeVar
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TAG_PREFIX = "tag:"
+TOOL_PREFIX = "tool:"
+
+# Limits declared with the concurrency_limit decorator, by tool name
+_declared_limits: dict[str, int] = {}
+
+
+def concurrency_limit(limit: int, name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Run at most ``limit`` calls of the decorated tool at a time.
+
+    Args:
+        limit: maximum number of concurrent calls
+        name: tool name, defaults to the function name
+    """
+    if limit < 1:
+        raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+
+    def decorator(func: F) -> F:
+        _declared_limits[name or func.__name__] = limit
+        return func
+
+    return decorator
+
+
+def parse_concurrency_limits(spec: str) -> dict[str, int]:
+    """Parse ``MCP_SERVER_TOOL_CONCURRENCY_LIMITS`` into limits by limiter key."""
+    limits: dict[str, int] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        target, sep, value = entry.rpartition("=")
+        target = target.strip()
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = 0
+        if not sep or not target or limit < 1:
+            raise ValueError(
+                f"Invalid MCP_SERVER_TOOL_CONCURRENCY_LIMITS entry {entry!r}, "
+                "expected '<tool>=<limit>' or 'tag:<tag>=<limit>' with a limit >= 1"
+            )
+        if not target.startswith(TAG_PREFIX) and not target.startswith(TOOL_PREFIX):
+            target = TOOL_PREFIX + target
+        limits[target] = limit
+    return limits
+
+
+@dataclass
+class LimiterStats:
+    """Usage of one concurrency limit."""
+
+    limit: int
+    queue_size: int
+    in_flight: int = 0
+    waiting: int = 0
+    admitted: int = 0
+    # Calls that had to wait for a slot
+    queued: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    total_wait_seconds: float = 0.0
+    # Moving average of the time a slot is held
+    average_call_seconds: float = 0.0
+
+
+class ConcurrencyLimiter:
+    """Semaphore with a bounded wait queue."""
+
+    def __init__(
+        self,
+        key: str,
+        limit: int,
+        queue_size: int,
+        on_wait: Optional[Callable[[float, str], None]] = None,
+    ) -> None:
+        self.key = key
+        self._semaphore = asyncio.Semaphore(limit)
+        self._stats = LimiterStats(limit=limit, queue_size=queue_size)
+        self._on_wait = on_wait
+
+    @property
+    def stats(self) -> LimiterStats:
+        return self._stats
+
+    def retry_after(self) -> int:
+        """Seconds after which a slot is expected to be free."""
+        stats = self._stats
+        backlog = (stats.waiting + 1) / stats.limit
+        return max(1, math.ceil(backlog * stats.average_call_seconds))
+
+    @asynccontextmanager
+    async def slot(self, tool: str, deadline: float) -> AsyncIterator[None]:
+        """Hold a slot for the enclosed call of ``tool``, waiting until ``deadline``."""
+        stats = self._stats
+        if self._semaphore.locked():
+            if stats.waiting >= stats.queue_size:
+                stats.rejected += 1
+                logger.debug("Rejected a call of %s, %s is at capacity", tool, self.key)
+                raise ToolError(
+                    f"Tool '{tool}' is at capacity ({self.key} allows {stats.limit} "
+                    f"concurrent calls and {stats.queue_size} queued), "
+                    f"retry after {self.retry_after()}s"
+                )
+            stats.queued += 1
+            stats.waiting += 1
+            started = time.monotonic()
+            try:
+                await asyncio.wait_for(
+                    self._semaphore.acquire(), max(0.0, deadline - started)
+                )
+            except asyncio.TimeoutError:
+                stats.timed_out += 1
+                raise ToolError(
+                    f"Tool '{tool}' timed out waiting for a slot of {self.key}, "
+                    f"retry after {self.retry_after()}s"
+                ) from None
+            finally:
+                stats.waiting -= 1
+                waited = time.monotonic() - started
+                stats.total_wait_seconds += waited
+                if self._on_wait is not None:
+                    self._on_wait(waited, self.key)
+        else:
+            await self._semaphore.acquire()
+        stats.admitted += 1
+        stats.in_flight += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            self._semaphore.release()
+            elapsed = time.monotonic() - started
+            if stats.average_call_seconds:
+                stats.average_call_seconds += 0.2 * (
+                    elapsed - stats.average_call_seconds
+                )
+            else:
+                stats.average_call_seconds = elapsed
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    """Admission control of ``tools/call`` requests."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        config = config or get_user_config()
+        self._limits = parse_concurrency_limits(
+            config.mcp_server_tool_concurrency_limits
+        )
+        self._queue_size = config.mcp_server_tool_queue_size
+        self._queue_timeout = config.mcp_server_tool_queue_timeout
+        self._limiters: dict[str, ConcurrencyLimiter] = {}
+        self._has_tag_limits = any(key.startswith(TAG_PREFIX) for key in self._limits)
+        meter = metrics.get_meter(__name__)
+        self._wait_time = meter.create_histogram(
+            "mcp.tool_concurrency.wait_time",
+            unit="s",
+            description="Time queued tool calls waited for a slot, per limit",
+        )
+        self._register_gauges(meter)
+
+    @property
+    def limiters(self) -> dict[str, ConcurrencyLimiter]:
+        return self._limiters
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the usage of each limit that has been hit."""
+        return {key: asdict(limiter.stats) for key, limiter in self._limiters.items()}
+
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        name = context.message.name
+        limiters = await self._limiters_for(name, context)
+        if not limiters:
+            return await call_next(context)
+        deadline = time.monotonic() + self._queue_timeout
+        async with AsyncExitStack() as stack:
+            for limiter in limiters:
+                await stack.enter_async_context(limiter.slot(name, deadline))
+            return await call_next(context)
+
+    async def _limiters_for(
+        self, name: str, context: MiddlewareContext[Any]
+    ) -> list[ConcurrencyLimiter]:
+        keys = []
+        tool_key = TOOL_PREFIX + name
+        tool_limit = self._limits.get(tool_key, _declared_limits.get(name))
+        if tool_limit is not None:
+            keys.append((tool_key, tool_limit))
+        if self._has_tag_limits and context.fastmcp_context is not None:
+            tool = await context.fastmcp_context.fastmcp.get_tool(name)
+            for tag in sorted(tool.tags if tool is not None else ()):
+                tag_limit = self._limits.get(TAG_PREFIX + tag)
+                if tag_limit is not None:
+                    keys.append((TAG_PREFIX + tag, tag_limit))
+        # Slots are always taken in the same order so calls cannot deadlock
+        return [self._limiter(key, limit) for key, limit in sorted(keys)]
+
+    def _limiter(self, key: str, limit: int) -> ConcurrencyLimiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = ConcurrencyLimiter(
+                key, limit, self._queue_size, on_wait=self._record_wait
+            )
+        return limiter
+
+    def _record_wait(self, seconds: float, key: str) -> None:
+        self._wait_time.record(seconds, {"mcp.concurrency.limit": key})
+
+    def _observe(self, field: str) -> Iterable[Observation]:
+        return [
+            Observation(getattr(limiter.stats, field), {"mcp.concurrency.limit": key})
+            for key, limiter in self._limiters.items()
+        ]
+
+    def _register_gauges(self, meter: metrics.Meter) -> None:
+        meter.create_observable_gauge(
+            "mcp.tool_concurrency.in_flight",
+            callbacks=[lambda _: self._observe("in_flight")],
+            description="Tool calls holding a slot, per limit",
+        )
+        meter.create_observable_gauge(
+            "mcp.tool_concurrency.queue_depth",
+            callbacks=[lambda _: self._observe("waiting")],
+            description="Tool calls waiting for a slot, per limit",
+        )
+        meter.create_observable_counter(
+            "mcp.tool_concurrency.rejected",
+            callbacks=[lambda _: self._observe("rejected")],
+            description="Tool calls rejected on a full queue, per limit",
+        )
+        meter.create_observable_counter(
+            "mcp.tool_concurrency.timed_out",
+            callbacks=[lambda _: self._observe("timed_out")],
+            description="Tool calls that timed out waiting for a slot, per limit",
+        )
@@ -0,0 +1,417 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Proxy engine of deployment tools.
+
+The tools that the datarobot_genai library registers for deployments open a
+new HTTP session for every call, so each call pays DNS resolution and TCP/TLS
+setup to the prediction server. The deployment tools registered by the
+incremental discovery (app/core/tool_discovery.py) call their deployment
+through ``DeploymentProxy`` instead:
+
+- Requests go through the shared pooled client (app/core/http_client.py). Its
+  keep-alive connections to a prediction server are reused by every
+  deployment the server hosts, multiplexed over HTTP/2 with
+  ``MCP_SERVER_HTTP_CLIENT_HTTP2``.
+- Connect and read timeouts are configurable.
+- Transport errors and 429/502/503/504 responses are retried with full-jitter
+  exponential backoff.
+- Each deployment has a circuit breaker. After
+  ``MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_THRESHOLD`` consecutive failed calls,
+  calls fail fast for ``MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_RESET`` seconds.
+  Then one trial call decides whether the circuit closes again.
+- With ``MCP_SERVER_PREDICTION_BATCHING_ENABLED``, concurrent CSV row
+  predictions are sent together (app/core/prediction_batch.py).
+
+The upstream latency of every attempt is recorded per tool in the
+``mcp.deployment_proxy.upstream_duration`` histogram. The p50 and p99 of the
+last calls are exported as gauges and returned by ``stats()``.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import urljoin
+
+import httpx
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.dynamic_tools.register import register_external_tool
+from datarobot_genai.drmcp.core.mcp_instance import register_tools
+from datarobot_genai.drmcpbase.dynamic_tools.external_tool import (
+    REQUEST_RETRYABLE_STATUS_CODES,
+    ExternalToolRegistrationConfig,
+    get_outbound_headers,
+)
+from datarobot_genai.drmcpbase.dynamic_tools.schema import (
+    create_input_schema_pydantic_model,
+)
+from datarobot_genai.drmcpbase.dynamic_tools.utils import (
+    format_response_as_tool_result,
+)
+from fastmcp.exceptions import ToolError
+from fastmcp.tools import Tool, ToolResult
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+
+from app.core.feature_metadata import get_feature_metadata_cache
+from app.core.http_client import get_http_client_pool
+from app.core.prediction_batch import (
+    PredictionBatcher,
+    get_prediction_batcher,
+    is_row_prediction,
+)
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+# Upstream latencies kept per tool for the percentiles
+LATENCY_WINDOW = 1024
+# Longest delay between two attempts
+MAX_BACKOFF_SECONDS = 10.0
+# Model that served a prediction, set by DataRobot prediction servers
+MODEL_ID_HEADER = "X-DataRobot-Model-Id"
+
+
+class CircuitBreaker:
+    """Fail fast while a deployment keeps failing."""
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._trial_in_flight or self.retry_after() == 0:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        """Seconds until a trial call is let through, 0 if calls are allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._trial_in_flight or self.retry_after() > 0:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record(self, succeeded: bool) -> None:
+        self._trial_in_flight = False
+        if succeeded:
+            self._failures = 0
+            self._opened_at = None
+            return
+        self._failures += 1
+        if self._threshold and (
+            self._opened_at is not None or self._failures >= self._threshold
+        ):
+            self._opened_at = time.monotonic()
+
+
+@dataclass
+class UpstreamStats:
+    """Calls of one tool to its deployment."""
+
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    # Calls refused by an open circuit
+    rejected: int = 0
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW)
+    )
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class DeploymentProxy:
+    """Send deployment tool requests over pooled connections, with resilience."""
+
+    def __init__(
+        self,
+        config: Optional[UserAppConfig] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        config = config or get_user_config()
+        self._client = client
+        self._timeout = httpx.Timeout(
+            config.mcp_server_deployment_proxy_timeout,
+            connect=config.mcp_server_deployment_proxy_connect_timeout,
+        )
+        self._retries = config.mcp_server_deployment_proxy_retries
+        self._backoff = config.mcp_server_deployment_proxy_backoff
+        self._breaker_threshold = config.mcp_server_deployment_proxy_breaker_threshold
+        self._breaker_reset = config.mcp_server_deployment_proxy_breaker_reset
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._stats: dict[str, UpstreamStats] = {}
+        self._duration: Optional[metrics.Histogram] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client_pool().client
+
+    def _breaker(self, deployment_id: str) -> CircuitBreaker:
+        breaker = self._breakers.get(deployment_id)
+        if breaker is None:
+            breaker = self._breakers[deployment_id] = CircuitBreaker(
+                self._breaker_threshold, self._breaker_reset
+            )
+        return breaker
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Full jitter, so retries of concurrent calls do not arrive together
+        return random.uniform(0, min(MAX_BACKOFF_SECONDS, self._backoff * 2**attempt))
+
+    async def request(
+        self, tool_name: str, deployment_id: str, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request to ``deployment_id`` and return the response, body read.
+
+        Raises:
+            ToolError: the circuit of the deployment is open, or the request
+                failed with a transport error after the retries
+        """
+        self._register_instruments()
+        stats = self._stats.setdefault(tool_name, UpstreamStats())
+        breaker = self._breaker(deployment_id)
+        if not breaker.allow():
+            stats.rejected += 1
+            raise ToolError(
+                f"Deployment {deployment_id} is failing, calls are suspended for "
+                f"{breaker.retry_after():.0f}s"
+            )
+        stats.calls += 1
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(
+                    method, url, timeout=self._timeout, **kwargs
+                )
+                error: Optional[Exception] = None
+            except httpx.TransportError as e:
+                error = e
+            elapsed = time.perf_counter() - started
+            stats.latencies.append(elapsed)
+            if self._duration is not None:
+                self._duration.record(elapsed, {"tool": tool_name})
+
+            retryable = (
+                error is not None
+                or response.status_code in REQUEST_RETRYABLE_STATUS_CODES
+            )
+            if not retryable or attempt >= self._retries:
+                break
+            attempt += 1
+            stats.retries += 1
+            delay = self._backoff_delay(attempt - 1)
+            logger.debug(
+                "Retrying %s of deployment %s in %.3fs (%s)",
+                tool_name,
+                deployment_id,
+                delay,
+                error or response.status_code,
+            )
+            await asyncio.sleep(delay)
+
+        breaker.record(not retryable)
+        if not retryable:
+            model_id = response.headers.get(MODEL_ID_HEADER)
+            if model_id:
+                get_feature_metadata_cache().observe_model(deployment_id, model_id)
+            return response
+        stats.failures += 1
+        if error is not None:
+            raise ToolError(
+                f"Request to deployment {deployment_id} failed: {error!r}"
+            ) from error
+        return response
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the upstream calls and latency percentiles, per tool."""
+        return {
+            tool_name: {
+                "calls": stats.calls,
+                "failures": stats.failures,
+                "retries": stats.retries,
+                "rejected": stats.rejected,
+                "p50_seconds": stats.percentile(0.5),
+                "p99_seconds": stats.percentile(0.99),
+            }
+            for tool_name, stats in self._stats.items()
+        }
+
+    def circuits(self) -> dict[str, str]:
+        """Return the state of the circuit of every deployment called."""
+        return {
+            deployment_id: breaker.state
+            for deployment_id, breaker in self._breakers.items()
+        }
+
+    def _observe(self, q: float) -> Iterable[Observation]:
+        observations = []
+        for tool_name, stats in self._stats.items():
+            value = stats.percentile(q)
+            if value is not None:
+                observations.append(Observation(value, {"tool": tool_name}))
+        return observations
+
+    def _register_instruments(self) -> None:
+        if self._duration is not None:
+            return
+        meter = metrics.get_meter(__name__)
+        self._duration = meter.create_histogram(
+            "mcp.deployment_proxy.upstream_duration",
+            unit="s",
+            description="Duration of the requests of deployment tools, per attempt",
+        )
+        meter.create_observable_gauge(
+            "mcp.deployment_proxy.upstream_p50",
+            callbacks=[lambda _: self._observe(0.5)],
+            unit="s",
+            description="Median upstream latency of the last calls, per tool",
+        )
+        meter.create_observable_gauge(
+            "mcp.deployment_proxy.upstream_p99",
+            callbacks=[lambda _: self._observe(0.99)],
+            unit="s",
+            description="99th percentile upstream latency of the last calls, per tool",
+        )
+
+
+def deployment_tool_callable(
+    spec: ExternalToolRegistrationConfig,
+    deployment_id: str,
+    proxy: DeploymentProxy,
+    allow_empty: bool = False,
+    batcher: Optional[PredictionBatcher] = None,
+) -> Any:
+    """
+    Build the function of a deployment tool calling it through ``proxy``.
+
+    Same input schema, request and result as the library's external tools.
+    With ``batcher``, CSV row predictions are batched with concurrent calls.
+    """
+    input_model = create_input_schema_pydantic_model(
+        input_schema=spec.input_schema, allow_empty=allow_empty
+    )
+
+    async def call_deployment(inputs: input_model) -> ToolResult:  # type: ignore[valid-type]
+        request_input = inputs.model_dump()  # type: ignore[attr-defined]
+        url = urljoin(
+            spec.base_url, spec.endpoint.format(**request_input.get("path_params", {}))
+        )
+        data = request_input.get("data")
+        method = spec.method.upper()
+        headers = await get_outbound_headers(spec)
+        if batcher is not None and is_row_prediction(method, url, headers, data):
+            response = await batcher.submit(
+                proxy,
+                spec.name,
+                deployment_id,
+                url,
+                headers,
+                request_input.get("query_params"),
+                data,
+            )
+        else:
+            response = await proxy.request(
+                spec.name,
+                deployment_id,
+                method,
+                url,
+                params=request_input.get("query_params"),
+                # httpx sends str and bytes bodies as content, mappings as a form
+                content=data if isinstance(data, (str, bytes)) else None,
+                data=None if isinstance(data, (str, bytes)) else data,
+                json=request_input.get("json"),
+                headers=headers,
+            )
+        charset = response.charset_encoding or "utf-8"
+        if response.status_code >= 400:
+            error_body = response.content.decode(charset, errors="replace")
+            logger.warning(
+                "Deployment tool request failed with status %s",
+                response.status_code,
+                extra={"url": url, "error_body": error_body},
+            )
+            raise ToolError(
+                f"HTTP {response.status_code} error from deployment: {error_body}"
+            )
+        content_type = response.headers.get("content-type", "application/octet-stream")
+        result: ToolResult = format_response_as_tool_result(
+            data=response.content,
+            content_type=content_type.split(";")[0].strip(),
+            charset=charset,
+        )
+        return result
+
+    return call_deployment
+
+
+async def register_deployment_tool(
+    config: ExternalToolRegistrationConfig, deployment_id: str
+) -> Tool:
+    """Register the tool of ``deployment_id``, through the proxy engine if enabled."""
+    if not get_user_config().mcp_server_deployment_proxy_enabled:
+        tool: Tool = await register_external_tool(config, deployment_id=deployment_id)
+        return tool
+    batcher = get_prediction_batcher()
+    tool = await register_tools(
+        fn=deployment_tool_callable(
+            config,
+            deployment_id,
+            get_deployment_proxy(),
+            allow_empty=get_config().tool_registration_allow_empty_schema,
+            batcher=batcher if batcher.enabled else None,
+        ),
+        name=config.name,
+        title=config.title,
+        description=config.description,
+        tags=config.tags,
+        deployment_id=deployment_id,
+    )
+    return tool
+
+
+# Global deployment proxy instance
+_deployment_proxy: Optional[DeploymentProxy] = None
+
+
+def get_deployment_proxy() -> DeploymentProxy:
+    """Get the global deployment proxy engine."""
+    global _deployment_proxy
+    if _deployment_proxy is None:
+        _deployment_proxy = DeploymentProxy()
+    return _deployment_proxy
@@ -0,0 +1,249 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Graceful drain of in-flight tool calls on shutdown.
+
+On SIGTERM uvicorn immediately closes the streaming responses of the requests
+in progress, cutting off long-running ``tools/call`` executions. The drain
+manager intercepts SIGTERM (and the first Ctrl+C) before uvicorn does:
+
+1. new MCP sessions are refused and ``/readyz`` answers 503, so that load
+   balancers stop routing traffic to the server;
+2. the in-flight tool calls, counted by ``ToolCallDrainMiddleware``, are given
+   up to ``MCP_SERVER_DRAIN_TIMEOUT`` seconds to finish;
+3. the signal is then handed to uvicorn, which stops serving, and the
+   ``ServerLifecycle`` shutdown hooks run.
+
+A second Ctrl+C skips the wait.
+"""
+
+import asyncio
+import functools
+import logging
+import signal
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any, Optional
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from app.core.warmup import get_warmup_manager
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC server error returned to clients opening a session while draining
+SERVER_SHUTTING_DOWN = -32000
+
+
+class DrainManager:
+    """In-flight tool call accounting and drain state of this server process."""
+
+    def __init__(self) -> None:
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._draining = False
+        self._drain_started: Optional[float] = None
+        self._waited_on = 0
+        self._completed = 0
+        self._cancelled = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    @contextmanager
+    def track_call(self) -> Iterator[None]:
+        """Count the enclosed tool call as in flight."""
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        except asyncio.CancelledError:
+            if self._draining:
+                self._cancelled += 1
+            raise
+        else:
+            if self._draining:
+                self._completed += 1
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    def begin(self) -> None:
+        """Start draining: refuse new sessions and report the server unready."""
+        if self._draining:
+            return
+        self._draining = True
+        self._drain_started = time.monotonic()
+        self._waited_on = self._in_flight
+        get_warmup_manager().mark_draining()
+        logger.info(
+            "Draining MCP server, waiting for %s in-flight tool call(s)",
+            self._in_flight,
+        )
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the in-flight calls, True if none is left."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "draining": self._draining,
+            "in_flight": self._in_flight,
+            "waited_on": self._waited_on,
+            "completed": self._completed,
+            "cancelled": self._cancelled,
+            "drain_seconds": (
+                round(time.monotonic() - self._drain_started, 3)
+                if self._drain_started is not None
+                else None
+            ),
+        }
+
+    def log_report(self) -> None:
+        """Log the outcome of the drain, called before the shutdown hooks run."""
+        if not self._draining:
+            return
+        report = self.report()
+        if report["cancelled"] or report["in_flight"]:
+            logger.warning(
+                "Drain deadline exceeded after %ss: %s tool call(s) completed, "
+                "%s cancelled",
+                report["drain_seconds"],
+                report["completed"],
+                report["cancelled"] + report["in_flight"],
+            )
+        else:
+            logger.info(
+                "Drained %s in-flight tool call(s) in %ss",
+                report["waited_on"],
+                report["drain_seconds"],
+            )
+
+    def install_signal_handlers(self, timeout: float) -> None:
+        """
+        Drain for up to ``timeout`` seconds on SIGTERM or SIGINT, then stop serving.
+
+        Must be called from the serving event loop once uvicorn has installed its
+        signal handlers: they are wrapped, and uvicorn restores the handlers it
+        replaced when it stops serving.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(signum)
+            if not callable(previous):
+                continue
+            signal.signal(
+                signum,
+                functools.partial(self._handle_signal, loop, timeout, previous),
+            )
+
+    def _handle_signal(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        timeout: float,
+        previous: Callable[[int, Optional[FrameType]], Any],
+        signum: int,
+        frame: Optional[FrameType],
+    ) -> None:
+        if self._draining:
+            # Second signal: stop waiting for the in-flight calls
+            previous(signum, frame)
+            return
+        self.begin()
+        loop.call_soon_threadsafe(
+            loop.create_task, self._drain(timeout, previous, signum, frame)
+        )
+
+    async def _drain(
+        self,
+        timeout: float,
+        previous: Callable[[int, Optional[FrameType]], Any],
+        signum: int,
+        frame: Optional[FrameType],
+    ) -> None:
+        if not await self.wait(timeout):
+            logger.warning(
+                "Drain deadline of %ss reached with %s tool call(s) still running",
+                timeout,
+                self._in_flight,
+            )
+        previous(signum, frame)
+
+
+class ToolCallDrainMiddleware(Middleware):
+    """Track in-flight tool calls and refuse new sessions while draining."""
+
+    def __init__(self, drain_manager: DrainManager) -> None:
+        self._drain_manager = drain_manager
+
+    async def on_initialize(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        if self._drain_manager.draining:
+            raise McpError(
+                ErrorData(
+                    code=SERVER_SHUTTING_DOWN,
+                    message="Server is shutting down, retry on another instance",
+                )
+            )
+        return await call_next(context)
+
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        with self._drain_manager.track_call():
+            return await call_next(context)
+
+
+def handle_sigterm(signum: int, frame: Optional[FrameType]) -> None:
+    """
+    Handle SIGTERM outside of the drain.
+
+    Before the server is serving, stop it like Ctrl+C. uvicorn re-raises the
+    signal that stopped it once it has drained: that one is ignored, so that
+    serving ends normally and the ``ServerLifecycle`` shutdown hooks run.
+    """
+    if not get_drain_manager().draining:
+        raise KeyboardInterrupt
+
+
+# Global drain manager instance
+_drain_manager: Optional[DrainManager] = None
+
+
+def get_drain_manager() -> DrainManager:
+    """Get the global drain manager."""
+    global _drain_manager
+    if _drain_manager is None:
+        _drain_manager = DrainManager()
+    return _drain_manager
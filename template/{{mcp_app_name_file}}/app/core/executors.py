@@ -0,0 +1,238 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Offload blocking tool code to managed executors.
+
+Synchronous code (the ``datarobot`` SDK, pandas, ...) called from an async tool
+blocks the event loop serving every session. Write such tools as plain
+functions and decorate them with ``run_in_executor``, under ``dr_mcp_tool``::
+
+    @dr_mcp_tool(tags={"user"})
+    @run_in_executor("thread")
+    def list_projects(limit: int = 10) -> ToolResult:
+        projects = dr.Project.list()[:limit]
+        ...
+
+``"thread"`` runs the function in a shared thread pool, with a copy of the
+caller's context variables, so the OpenTelemetry span and the request
+credentials are available. ``"process"`` runs it in a shared pool of spawned
+processes, for CPU bound code holding the GIL: arguments and results must be
+picklable, and the function is imported again by module and name in the
+worker process, where only the OpenTelemetry trace context is propagated.
+
+The pools are created on first use, sized from ``MCP_SERVER_EXECUTOR_THREADS``
+and ``MCP_SERVER_EXECUTOR_PROCESSES``, and shut down in
+``ServerLifecycle.pre_server_shutdown``.
+"""
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import inspect
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Literal, Optional
+
+from opentelemetry import context as otel_context
+from opentelemetry import metrics, propagate
+from opentelemetry.metrics import Observation
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+ExecutorKind = Literal["thread", "process"]
+
+
+@dataclass
+class ExecutorStats:
+    """Usage of one executor."""
+
+    max_workers: int
+    # Submitted calls not finished yet, running or queued
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+
+
+class ExecutorManager:
+    """Owner of the shared thread and process pools of this server process."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        self._config = config
+        self._executors: dict[str, Executor] = {}
+        self._stats: dict[str, ExecutorStats] = {}
+        self._gauges_registered = False
+
+    def executor(self, kind: ExecutorKind) -> Executor:
+        """Return the pool of ``kind``, creating it on first use."""
+        executor = self._executors.get(kind)
+        if executor is not None:
+            return executor
+        config = self._config or get_user_config()
+        if kind == "thread":
+            max_workers = config.mcp_server_executor_threads
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="mcp-tool"
+            )
+        elif kind == "process":
+            max_workers = config.mcp_server_executor_processes or os.cpu_count() or 1
+            # Forking a process running an event loop and threads is unsafe
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            raise ValueError(f"Unknown executor {kind!r}, use 'thread' or 'process'")
+        self._executors[kind] = executor
+        self._stats[kind] = ExecutorStats(max_workers=max_workers)
+        self._register_gauges()
+        logger.info("Started the %s executor with %s workers", kind, max_workers)
+        return executor
+
+    async def run(
+        self, kind: ExecutorKind, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` in the pool of ``kind``."""
+        executor = self.executor(kind)
+        if kind == "thread":
+            call = functools.partial(
+                contextvars.copy_context().run, func, *args, **kwargs
+            )
+        else:
+            carrier: dict[str, str] = {}
+            propagate.inject(carrier)
+            call = functools.partial(
+                _call_in_process,
+                func.__module__,
+                func.__qualname__,
+                carrier,
+                args,
+                kwargs,
+            )
+        stats = self._stats[kind]
+        stats.in_flight += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor, call)
+        except BaseException:
+            stats.failed += 1
+            raise
+        else:
+            stats.completed += 1
+            return result
+        finally:
+            stats.in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Shut the pools down, cancelling the calls that have not started."""
+        for kind, executor in self._executors.items():
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info("Shut down the %s executor", kind)
+        self._executors.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the usage of each started executor."""
+        return {kind: asdict(stats) for kind, stats in self._stats.items()}
+
+    def _observe(self, field: str) -> Iterable[Observation]:
+        return [
+            Observation(getattr(stats, field), {"mcp.executor": kind})
+            for kind, stats in self._stats.items()
+        ]
+
+    def _register_gauges(self) -> None:
+        if self._gauges_registered:
+            return
+        self._gauges_registered = True
+        meter = metrics.get_meter(__name__)
+        meter.create_observable_gauge(
+            "mcp.executor.in_flight",
+            callbacks=[lambda _: self._observe("in_flight")],
+            description="Offloaded tool calls running or queued, per executor",
+        )
+        meter.create_observable_counter(
+            "mcp.executor.completed",
+            callbacks=[lambda _: self._observe("completed")],
+            description="Offloaded tool calls completed, per executor",
+        )
+
+
+def _call_in_process(
+    module: str,
+    qualname: str,
+    carrier: dict[str, str],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Entry point of the process pool workers."""
+    target: Any = importlib.import_module(module)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    # The module attribute is the registered tool, call the undecorated function
+    func = inspect.unwrap(target)
+    token = otel_context.attach(propagate.extract(carrier))
+    try:
+        return func(*args, **kwargs)
+    finally:
+        otel_context.detach(token)
+
+
+def run_in_executor(
+    executor: ExecutorKind = "thread",
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Run a synchronous tool in a managed executor instead of the event loop.
+
+    Args:
+        executor: "thread" for blocking I/O, "process" for CPU bound code
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Unknown executor {executor!r}, use 'thread' or 'process'")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(
+                f"run_in_executor requires a synchronous function, got {func!r}"
+            )
+        if executor == "process" and "<locals>" in func.__qualname__:
+            raise TypeError(
+                f"{func.__qualname__} must be defined at module level "
+                "to run in the process executor"
+            )
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await get_executor_manager().run(executor, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Global executor manager instance
+_executor_manager: Optional[ExecutorManager] = None
+
+
+def get_executor_manager() -> ExecutorManager:
+    """Get the global executor manager."""
+    global _executor_manager
+    if _executor_manager is None:
+        _executor_manager = ExecutorManager()
+    return _executor_manager
@@ -0,0 +1,306 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache of deployment feature metadata.
+
+The deployment info tools of ``datarobot-genai`` (see
+docs/deployment_info_tools.md) all start from ``deployment_get_info``, which
+fetches the deployment, its features and capabilities, its project and its
+model: five DataRobot requests. An agent preparing a prediction calls
+``deployment_get_info``, ``deployment_get_features``,
+``deployment_generate_prediction_sample`` and
+``deployment_validate_prediction_data`` in turn, each fetching the same
+metadata again.
+
+``register_feature_metadata_cache`` wraps ``deployment_get_info`` so these
+tools share one fetch per deployment:
+
+- Entries are keyed by the caller's DataRobot token and the deployment id, so
+  a caller only gets metadata it fetched with its own credentials.
+- An entry records the id of the deployed model. Once older than
+  ``MCP_SERVER_FEATURE_METADATA_CHECK_INTERVAL`` seconds, it is only reused
+  after one request confirms the deployment still serves that model. When a
+  prediction response of the deployment proxy (app/core/deployment_proxy.py)
+  reports another model, the entries of the deployment are dropped at once.
+  ``deployment_get_info`` does not report the model, so an entry loaded on a
+  cold miss records the first model it is checked or observed with, and a
+  cold miss costs no more requests than the tool itself.
+- Entries expire after ``MCP_SERVER_FEATURE_METADATA_TTL`` seconds, the least
+  recently used are evicted beyond ``MCP_SERVER_FEATURE_METADATA_MAX_ENTRIES``.
+- Concurrent calls for the same entry share a single fetch. Errors are not
+  cached.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import importlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+import datarobot as dr
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.tool_config import ToolType, is_tool_enabled
+from datarobot_genai.drtools.core.clients.datarobot import (
+    get_datarobot_access_token,
+    request_user_dr_sdk,
+)
+from datarobot_genai.drtools.core.tool_metadata import _TOOL_REGISTRY
+from opentelemetry import metrics
+
+from app.core.executors import get_executor_manager
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+DEPLOYMENT_INFO_MODULE = "datarobot_genai.drtools.predictive.deployment_info"
+
+_meter = metrics.get_meter(__name__)
+_lookups_counter = _meter.create_counter(
+    "mcp.feature_metadata.lookups",
+    description="Deployment feature metadata lookups, by result",
+)
+
+Loader = Callable[[], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class FeatureMetadataStats:
+    hits: int = 0
+    misses: int = 0
+    # Lookups that joined a fetch already in progress
+    shared: int = 0
+    # Entries reused after confirming the deployed model
+    checks: int = 0
+    # Entries dropped because the deployment serves another model
+    invalidations: int = 0
+
+
+@dataclass
+class _Entry:
+    # None until the entry is first checked or observed
+    model_id: Optional[str]
+    value: dict[str, Any]
+    loaded_at: float
+    checked_at: float
+
+
+def _current_model_id(deployment_id: str) -> Optional[str]:
+    """Fetch the id of the model the deployment serves, blocking."""
+    with request_user_dr_sdk(headers_auth_only=True):
+        deployment = dr.Deployment.get(deployment_id)
+    return deployment.model["id"] if deployment.model else None
+
+
+class FeatureMetadataCache:
+    """Deployment feature metadata, by caller and deployment."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        config = config or get_user_config()
+        self.enabled = config.mcp_server_feature_metadata_cache_enabled
+        self._ttl = config.mcp_server_feature_metadata_ttl
+        self._check_interval = config.mcp_server_feature_metadata_check_interval
+        self._max_entries = config.mcp_server_feature_metadata_max_entries
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._in_flight: dict[tuple[str, str], asyncio.Future[dict[str, Any]]] = {}
+        self._stats = FeatureMetadataStats()
+
+    async def get(self, deployment_id: str, load: Loader) -> dict[str, Any]:
+        """Return the metadata of ``deployment_id``, calling ``load`` if needed."""
+        try:
+            token = get_datarobot_access_token(headers_auth_only=True)
+        except Exception:
+            # No caller credentials, let the tool report it
+            return await load()
+        key = (hashlib.sha256(token.encode()).hexdigest()[:32], deployment_id)
+
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry.loaded_at >= self._ttl:
+            del self._entries[key]
+            entry = None
+        if entry is not None and now - entry.checked_at < self._check_interval:
+            self._entries.move_to_end(key)
+            self._count("hit")
+            return copy.deepcopy(entry.value)
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._count("shared")
+            return copy.deepcopy(await asyncio.shield(pending))
+
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            value = await self._refresh(key, entry, load)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Joined lookups re-raise it, don't log it as never retrieved
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._in_flight[key]
+        return copy.deepcopy(value)
+
+    async def _refresh(
+        self, key: tuple[str, str], entry: Optional[_Entry], load: Loader
+    ) -> dict[str, Any]:
+        deployment_id = key[1]
+        model_id = None
+        if entry is not None:
+            model_id = await get_executor_manager().run(
+                "thread", _current_model_id, deployment_id
+            )
+            if entry.model_id in (None, model_id):
+                entry.model_id = model_id
+                entry.checked_at = time.monotonic()
+                # Put back if dropped meanwhile, the model is confirmed
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self._count("check")
+                return entry.value
+            self._count("invalidation")
+            logger.info(
+                "Deployment %s now serves model %s, refetching its features",
+                deployment_id,
+                model_id,
+            )
+        self._count("miss")
+        now = time.monotonic()
+        value = await load()
+        self._entries[key] = _Entry(model_id, value, now, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def observe_model(self, deployment_id: str, model_id: str) -> None:
+        """Drop the entries of ``deployment_id`` if it now serves ``model_id``."""
+        stale = []
+        for key, entry in self._entries.items():
+            if key[1] != deployment_id:
+                continue
+            if entry.model_id is None:
+                entry.model_id = model_id
+            elif entry.model_id != model_id:
+                stale.append(key)
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._count("invalidation")
+            logger.info(
+                "Deployment %s now serves model %s, dropped its feature metadata",
+                deployment_id,
+                model_id,
+            )
+
+    def invalidate(self, deployment_id: str) -> None:
+        """Drop the entries of ``deployment_id``."""
+        for key in [key for key in self._entries if key[1] == deployment_id]:
+            del self._entries[key]
+
+    def _count(self, result: str) -> None:
+        field = {
+            "hit": "hits",
+            "miss": "misses",
+            "shared": "shared",
+            "check": "checks",
+            "invalidation": "invalidations",
+        }[result]
+        setattr(self._stats, field, getattr(self._stats, field) + 1)
+        _lookups_counter.add(1, {"result": result})
+
+    def stats(self) -> dict[str, Any]:
+        return asdict(self._stats) | {"entries": len(self._entries)}
+
+    def wrap(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+        """Cache ``func(deployment_id=...)``, keeping its name and signature."""
+
+        @functools.wraps(func)
+        async def cached(*args: Any, **kwargs: Any) -> Any:
+            deployment_id = kwargs.get("deployment_id")
+            if args or set(kwargs) != {"deployment_id"} or not deployment_id:
+                return await func(*args, **kwargs)
+            return await self.get(deployment_id, lambda: func(**kwargs))
+
+        cached._feature_metadata_cache = self  # type: ignore[attr-defined]
+        return cached
+
+
+def register_feature_metadata_cache(
+    config: Optional[UserAppConfig] = None,
+) -> Optional[FeatureMetadataCache]:
+    """
+    Wrap ``deployment_get_info`` with the cache, unless disabled.
+
+    Call before the predictive tools are registered: the tool and the
+    functions calling it inside ``datarobot-genai`` both use the cache.
+    """
+    cache = get_feature_metadata_cache(config)
+    if not cache.enabled or not is_tool_enabled(ToolType.PREDICTIVE, get_config()):
+        return None
+    replace_deployment_info_tool(
+        "deployment_get_info", cache.wrap, "_feature_metadata_cache"
+    )
+    return cache
+
+
+def replace_deployment_info_tool(
+    name: str,
+    wrap: Callable[[Callable[..., Any]], Callable[..., Any]],
+    marker: str,
+) -> None:
+    """
+    Replace the ``name`` deployment info tool with ``wrap(tool)``.
+
+    ``wrap`` must mark what it returns with the ``marker`` attribute, so a tool
+    is only replaced once.
+    """
+    module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+    wrapper = getattr(module, name)
+    if hasattr(wrapper, marker):
+        return
+    # The tool_metadata decorator registers the undecorated function as the
+    # tool and binds the module name to a wrapper used by the other tools
+    for i, (func, metadata) in enumerate(_TOOL_REGISTRY):
+        if func is wrapper.__wrapped__:
+            _TOOL_REGISTRY[i] = (wrap(func), metadata)
+    setattr(module, name, wrap(wrapper))
+
+
+# Global feature metadata cache instance
+_feature_metadata_cache: Optional[FeatureMetadataCache] = None
+
+
+def get_feature_metadata_cache(
+    config: Optional[UserAppConfig] = None,
+) -> FeatureMetadataCache:
+    """Get the global feature metadata cache."""
+    global _feature_metadata_cache
+    if _feature_metadata_cache is None:
+        _feature_metadata_cache = FeatureMetadataCache(config)
+    return _feature_metadata_cache
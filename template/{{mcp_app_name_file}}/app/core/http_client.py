@@ -0,0 +1,285 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared pooled async HTTP client.
+
+A single ``httpx.AsyncClient`` per server process, created in
+``ServerLifecycle.pre_server_start`` and closed in ``pre_server_shutdown``, so
+tools reuse keep-alive connections (and their TLS sessions) instead of opening
+a new session per call. Tools get it through the ``get_http_client``
+dependency accessor::
+
+    from fastmcp.dependencies import Depends
+
+    @dr_mcp_tool()
+    async def my_tool(
+        query: str, client: httpx.AsyncClient = Depends(get_http_client)
+    ) -> ToolResult:
+        response = await client.get("https://example.com", params={"q": query})
+
+Connections are limited per host on top of httpx's global pool limits, and the
+per-host pool usage (in flight, waiting, saturation) is tracked in ``stats()``
+and exported as OpenTelemetry gauges.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+import httpx
+from datarobot_genai.drtools.core.credentials import get_credentials
+from fastmcp import FastMCP
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostPoolStats:
+    """Connection usage of one host."""
+
+    limit: int
+    in_flight: int = 0
+    waiting: int = 0
+    requests: int = 0
+    # Requests that had to wait for a free connection slot
+    saturated_requests: int = 0
+    total_wait_seconds: float = 0.0
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport limiting the number of concurrent requests per host."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host_limit: int):
+        self._transport = transport
+        self._per_host_limit = per_host_limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, HostPoolStats] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._per_host_limit)
+            self._stats[host] = HostPoolStats(limit=self._per_host_limit)
+        stats = self._stats[host]
+        stats.requests += 1
+        if semaphore.locked():
+            stats.saturated_requests += 1
+        stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+            stats.total_wait_seconds += time.perf_counter() - started
+        stats.in_flight += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            stats.in_flight -= 1
+            semaphore.release()
+            raise
+        if response.is_closed:
+            # Body already loaded in memory (e.g. mocked or cached responses)
+            stats.in_flight -= 1
+            semaphore.release()
+        else:
+            # Keep the slot until the body has been read and the connection released
+            response.stream = _ReleasingStream(response.stream, stats, semaphore)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> dict[str, HostPoolStats]:
+        return dict(self._stats)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(
+        self, stream: Any, stats: HostPoolStats, semaphore: asyncio.Semaphore
+    ) -> None:
+        self._stream = stream
+        self._stats = stats
+        self._semaphore = semaphore
+        self._released = False
+
+    async def __aiter__(self) -> Any:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._stats.in_flight -= 1
+                self._semaphore.release()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientPool:
+    """Owner of the shared ``httpx.AsyncClient`` of this server process."""
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[HostLimitedTransport] = None
+        self._gauges_registered = False
+
+    @property
+    def started(self) -> bool:
+        return self._client is not None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError(
+                "The shared HTTP client is not started, it is only available "
+                "while the server is running"
+            )
+        return self._client
+
+    def start(self, config: Optional[UserAppConfig] = None) -> httpx.AsyncClient:
+        """Create the client; connections are opened lazily on first use."""
+        if self._client is not None:
+            return self._client
+        config = config or get_user_config()
+        http2 = config.mcp_server_http_client_http2
+        if http2 and not _http2_available():
+            logger.warning(
+                "MCP_SERVER_HTTP_CLIENT_HTTP2=true but the 'h2' package is not "
+                "installed, falling back to HTTP/1.1. "
+                "Install it with the 'http2' extra."
+            )
+            http2 = False
+        limits = httpx.Limits(
+            max_connections=config.mcp_server_http_client_max_connections,
+            max_keepalive_connections=(
+                config.mcp_server_http_client_max_keepalive_connections
+            ),
+            keepalive_expiry=config.mcp_server_http_client_keepalive_expiry,
+        )
+        self._transport = HostLimitedTransport(
+            httpx.AsyncHTTPTransport(http2=http2, limits=limits),
+            per_host_limit=config.mcp_server_http_client_max_connections_per_host,
+        )
+        self._client = httpx.AsyncClient(
+            transport=self._transport,
+            timeout=config.mcp_server_http_client_timeout,
+        )
+        self._register_gauges()
+        logger.info(
+            "Shared HTTP client started (http2=%s, max_connections=%s, per host=%s)",
+            http2,
+            limits.max_connections,
+            config.mcp_server_http_client_max_connections_per_host,
+        )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client and all pooled connections."""
+        if self._client is None:
+            return
+        await self._client.aclose()
+        self._client = None
+        self._transport = None
+        logger.info("Shared HTTP client closed")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the per-host pool usage."""
+        if self._transport is None:
+            return {}
+        return {host: asdict(s) for host, s in self._transport.stats().items()}
+
+    def _observe(self, field: str) -> Iterable[Observation]:
+        if self._transport is None:
+            return []
+        return [
+            Observation(getattr(stats, field), {"http.host": host})
+            for host, stats in self._transport.stats().items()
+        ]
+
+    def _register_gauges(self) -> None:
+        if self._gauges_registered:
+            return
+        self._gauges_registered = True
+        meter = metrics.get_meter(__name__)
+        meter.create_observable_gauge(
+            "mcp.http_client.in_flight",
+            callbacks=[lambda _: self._observe("in_flight")],
+            description="Requests holding a connection slot, per host",
+        )
+        meter.create_observable_gauge(
+            "mcp.http_client.waiting",
+            callbacks=[lambda _: self._observe("waiting")],
+            description="Requests waiting for a connection slot, per host",
+        )
+        meter.create_observable_counter(
+            "mcp.http_client.saturated_requests",
+            callbacks=[lambda _: self._observe("saturated_requests")],
+            description="Requests that had to wait for a connection slot, per host",
+        )
+
+
+# Global shared HTTP client pool
+_http_client_pool: Optional[HttpClientPool] = None
+
+
+def get_http_client_pool() -> HttpClientPool:
+    """Get the global shared HTTP client pool."""
+    global _http_client_pool
+    if _http_client_pool is None:
+        _http_client_pool = HttpClientPool()
+    return _http_client_pool
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client (use with ``Depends`` in tools).
+
+    A coroutine on purpose: ``Depends`` enters the async context managers
+    returned by synchronous factories, which would close the shared client at
+    the end of the call.
+    """
+    return get_http_client_pool().client
+
+
+async def prime_http_client(mcp: FastMCP) -> None:
+    """Warm-up task opening a pooled keep-alive connection to DataRobot."""
+    pool = get_http_client_pool()
+    if not pool.started:
+        return
+    credentials = get_credentials().datarobot
+    endpoint = credentials.datarobot_endpoint.rstrip("/")
+    response = await pool.client.get(
+        f"{endpoint}/version/",
+        headers={"Authorization": f"Bearer {credentials.datarobot_api_token}"},
+    )
+    response.raise_for_status()
@@ -0,0 +1,429 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazy loading of tool modules.
+
+Eagerly importing every tool module (native integrations and ``app/tools``)
+dominates cold start. In lazy mode the server registers lightweight
+placeholder tools from a precomputed manifest instead: the placeholders expose
+the real name, description and JSON schemas, and the module implementing a
+tool is only imported by the first ``tools/call`` that needs it.
+
+The manifest is generated at build time with
+``dev_tools/tool_manifest/cli.py generate`` (``task generate-tool-manifest``),
+or with ``python -m app.core.lazy_tools`` where the dev dependencies are not
+installed (Docker image build).
+"""
+
+import asyncio
+import glob
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from datarobot_genai.drmcp import MCPServerConfig
+from datarobot_genai.drmcp.core.drtools_registry import load_drtools_registry
+from datarobot_genai.drmcp.core.tool_config import TOOL_CONFIGS, is_tool_enabled
+from fastmcp import FastMCP
+from fastmcp.tools import Tool, ToolResult
+from mcp.types import ToolAnnotations
+from pydantic import ConfigDict, Field
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 2
+
+_DRTOOLS_PACKAGE_PREFIX = "datarobot_genai.drtools."
+
+_APP_DIR = Path(__file__).resolve().parent.parent
+
+
+def get_default_manifest_path() -> str:
+    """Return the path of the manifest generated by ``task generate-tool-manifest``."""
+    return str(_APP_DIR / "tool_manifest.json")
+
+
+def get_user_tool_directories() -> list[tuple[str, str]]:
+    """Return the (directory, package_prefix) tuples of the user tool modules."""
+    return [(str(_APP_DIR / "tools"), "app.tools")]
+
+
+@dataclass
+class ToolModule:
+    """A module that registers tools when imported."""
+
+    name: str
+    # "drtools" modules register through the drtools registry, others on import
+    loader: str = "import"
+    # sha256 of the module source, to detect a manifest gone stale
+    fingerprint: str = ""
+
+
+@dataclass
+class ToolManifestEntry:
+    """Everything needed to list a tool without importing its module."""
+
+    name: str
+    module: str
+    parameters: dict[str, Any]
+    description: Optional[str] = None
+    title: Optional[str] = None
+    output_schema: Optional[dict[str, Any]] = None
+    annotations: Optional[dict[str, Any]] = None
+    tags: list[str] = field(default_factory=list)
+    meta: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class ToolManifest:
+    """Tools per module plus the import time measured when building the manifest."""
+
+    enabled_tool_types: list[str]
+    modules: dict[str, ToolModule]
+    import_seconds: dict[str, float]
+    tools: list[ToolManifestEntry]
+    version: int = MANIFEST_VERSION
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ToolManifest":
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported tool manifest version: {data.get('version')}"
+            )
+        return cls(
+            enabled_tool_types=list(data["enabled_tool_types"]),
+            modules={
+                name: ToolModule(**module) for name, module in data["modules"].items()
+            },
+            import_seconds=dict(data["import_seconds"]),
+            tools=[ToolManifestEntry(**entry) for entry in data["tools"]],
+        )
+
+
+def get_enabled_tool_types(config: MCPServerConfig) -> list[str]:
+    """Return the native tool types enabled by the server configuration."""
+    return sorted(
+        tool_type.value
+        for tool_type in TOOL_CONFIGS
+        if is_tool_enabled(tool_type, config)
+    )
+
+
+def _modules_in_directory(directory: str, package_prefix: str) -> list[ToolModule]:
+    loader = (
+        "drtools" if package_prefix.startswith(_DRTOOLS_PACKAGE_PREFIX) else "import"
+    )
+    return [
+        ToolModule(
+            name=f"{package_prefix}.{Path(file).stem}",
+            loader=loader,
+            fingerprint=hashlib.sha256(Path(file).read_bytes()).hexdigest(),
+        )
+        for file in sorted(glob.glob(os.path.join(directory, "*.py")))
+        if os.path.basename(file) != "__init__.py"
+    ]
+
+
+def discover_tool_modules(
+    config: MCPServerConfig, tool_directories: list[tuple[str, str]]
+) -> list[ToolModule]:
+    """
+    List the modules the server imports eagerly to register tools.
+
+    Args:
+        config: The MCP server configuration (selects the native tool types)
+        tool_directories: (directory, package_prefix) tuples of user tool modules
+    """
+    import datarobot_genai
+
+    drtools_dir = Path(datarobot_genai.__file__).parent / "drtools"
+    modules: list[ToolModule] = []
+    for tool_type, tool_config in TOOL_CONFIGS.items():
+        if is_tool_enabled(tool_type, config):
+            modules.extend(
+                _modules_in_directory(
+                    str(drtools_dir / tool_config["directory"]),
+                    tool_config["package_prefix"],
+                )
+            )
+    for directory, package_prefix in tool_directories:
+        modules.extend(_modules_in_directory(directory, package_prefix))
+    return modules
+
+
+def import_tool_module(module: ToolModule) -> None:
+    """Import a tool module so that its tools get registered."""
+    if module.loader == "drtools":
+        load_drtools_registry(module.name)
+    elif module.name in sys.modules:
+        # Already imported (e.g. by another tool module): re-run its decorators
+        importlib.reload(sys.modules[module.name])
+    else:
+        importlib.import_module(module.name)
+
+
+def _tool_to_manifest_entry(tool: Tool, module: str) -> ToolManifestEntry:
+    return ToolManifestEntry(
+        name=tool.name,
+        module=module,
+        parameters=tool.parameters,
+        description=tool.description,
+        title=tool.title,
+        output_schema=tool.output_schema,
+        annotations=(
+            tool.annotations.model_dump(mode="json", exclude_none=True)
+            if tool.annotations
+            else None
+        ),
+        tags=sorted(tool.tags),
+        meta=tool.meta,
+    )
+
+
+async def build_tool_manifest(
+    mcp: FastMCP, config: MCPServerConfig, modules: list[ToolModule]
+) -> ToolManifest:
+    """
+    Import ``modules`` one by one, timing each import and recording its tools.
+
+    Tools are attributed to a module by diffing the registered tools before and
+    after importing it.
+    """
+    known = {tool.name for tool in await mcp.list_tools(run_middleware=False)}
+    import_seconds: dict[str, float] = {}
+    entries: list[ToolManifestEntry] = []
+    for module in modules:
+        started = time.perf_counter()
+        try:
+            import_tool_module(module)
+        except ImportError as e:
+            logger.warning("Failed to import module %s: %s", module.name, e)
+            continue
+        import_seconds[module.name] = round(time.perf_counter() - started, 6)
+        for tool in await mcp.list_tools(run_middleware=False):
+            if tool.name not in known:
+                known.add(tool.name)
+                entries.append(_tool_to_manifest_entry(tool, module.name))
+    return ToolManifest(
+        enabled_tool_types=get_enabled_tool_types(config),
+        modules={module.name: module for module in modules},
+        import_seconds=import_seconds,
+        tools=entries,
+    )
+
+
+async def generate_tool_manifest(
+    mcp: FastMCP, config: MCPServerConfig, output: str
+) -> ToolManifest:
+    """Build the manifest of the tool modules enabled by ``config`` and save it."""
+    modules = discover_tool_modules(config, get_user_tool_directories())
+    manifest = await build_tool_manifest(mcp, config, modules)
+    save_tool_manifest(manifest, output)
+    return manifest
+
+
+def save_tool_manifest(manifest: ToolManifest, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(manifest.to_dict(), f, indent=2, sort_keys=True)
+
+
+def load_tool_manifest(path: str) -> ToolManifest:
+    with open(path) as f:
+        return ToolManifest.from_dict(json.load(f))
+
+
+def load_valid_tool_manifest(
+    path: str, config: MCPServerConfig, tool_directories: list[tuple[str, str]]
+) -> Optional[ToolManifest]:
+    """
+    Load the manifest at ``path`` if it can stand in for eager tool loading.
+
+    Returns None (and logs why) when the manifest is missing or unreadable, or
+    is stale: generated with a different set of enabled native tool types, or
+    before a tool module was added, removed, renamed or modified.
+    """
+    try:
+        manifest = load_tool_manifest(path)
+    except FileNotFoundError:
+        logger.warning(
+            "Tool manifest %s not found, loading tools eagerly. "
+            "Generate it with `task generate-tool-manifest`.",
+            path,
+        )
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Invalid tool manifest %s, loading tools eagerly: %s", path, e)
+        return None
+    enabled_tool_types = get_enabled_tool_types(config)
+    if manifest.enabled_tool_types != enabled_tool_types:
+        logger.warning(
+            "Tool manifest %s was generated for tool types %s but %s are enabled, "
+            "loading tools eagerly",
+            path,
+            manifest.enabled_tool_types,
+            enabled_tool_types,
+        )
+        return None
+    expected = {
+        module.name: module.fingerprint
+        for module in discover_tool_modules(config, tool_directories)
+    }
+    actual = {name: module.fingerprint for name, module in manifest.modules.items()}
+    if actual != expected:
+        changed = sorted(
+            name
+            for name in expected.keys() | actual.keys()
+            if expected.get(name) != actual.get(name)
+        )
+        logger.warning(
+            "Tool manifest %s is stale (changed modules: %s), loading tools eagerly. "
+            "Regenerate it with `task generate-tool-manifest`.",
+            path,
+            ", ".join(changed),
+        )
+        return None
+    return manifest
+
+
+class LazyToolLoader:
+    """Import the module behind a placeholder tool on first use."""
+
+    def __init__(self, mcp: FastMCP, manifest: ToolManifest) -> None:
+        self._mcp = mcp
+        self._manifest = manifest
+        self._loaded: set[str] = set()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._placeholders: dict[str, list["LazyTool"]] = {}
+
+    @property
+    def loaded_modules(self) -> set[str]:
+        return set(self._loaded)
+
+    def add_placeholder(self, tool: "LazyTool") -> None:
+        self._placeholders.setdefault(tool.module, []).append(tool)
+        self._mcp.add_tool(tool)
+
+    async def get_tool(self, name: str, module: str) -> Tool:
+        """Return the real tool ``name``, importing ``module`` if needed."""
+        if module not in self._loaded:
+            lock = self._locks.setdefault(module, asyncio.Lock())
+            async with lock:
+                if module not in self._loaded:
+                    await self._import(module)
+        tool = await self._mcp.get_tool(name)
+        if tool is None or isinstance(tool, LazyTool):
+            raise RuntimeError(f"Module {module} did not register tool {name}")
+        return tool
+
+    async def _import(self, module: str) -> None:
+        placeholders = self._placeholders.get(module, [])
+        # Drop every placeholder of the module first so the real tools can be
+        # registered without tripping the duplicate-registration policy.
+        for placeholder in placeholders:
+            self._mcp.local_provider.remove_tool(placeholder.name)
+        started = time.perf_counter()
+        try:
+            import_tool_module(self._manifest.modules[module])
+        except Exception:
+            await self._restore_placeholders(placeholders)
+            raise
+        # The drtools loader logs import errors instead of raising them
+        missing = [
+            p.name for p in placeholders if await self._mcp.get_tool(p.name) is None
+        ]
+        if missing:
+            await self._restore_placeholders(placeholders)
+            raise RuntimeError(
+                f"Module {module} did not register tools {', '.join(missing)}"
+            )
+        self._loaded.add(module)
+        logger.info(
+            "Lazily imported tool module %s in %.3fs",
+            module,
+            time.perf_counter() - started,
+        )
+
+    async def _restore_placeholders(self, placeholders: list["LazyTool"]) -> None:
+        """Put back the placeholders of a module whose import failed."""
+        for placeholder in placeholders:
+            # Drop real tools registered before the import failed
+            if await self._mcp.get_tool(placeholder.name) is not None:
+                self._mcp.local_provider.remove_tool(placeholder.name)
+            self._mcp.add_tool(placeholder)
+
+
+class LazyTool(Tool):
+    """Placeholder exposing a tool's schema until its module is imported."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    module: str
+    loader: LazyToolLoader = Field(exclude=True)
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        tool = await self.loader.get_tool(self.name, self.module)
+        return await tool.run(arguments)
+
+
+def register_lazy_tools(mcp: FastMCP, manifest: ToolManifest) -> LazyToolLoader:
+    """Register a placeholder for every tool in ``manifest`` and report savings."""
+    loader = LazyToolLoader(mcp, manifest)
+    for entry in manifest.tools:
+        loader.add_placeholder(
+            LazyTool(
+                name=entry.name,
+                title=entry.title,
+                description=entry.description,
+                parameters=entry.parameters,
+                output_schema=entry.output_schema,
+                annotations=(
+                    ToolAnnotations(**entry.annotations) if entry.annotations else None
+                ),
+                tags=set(entry.tags),
+                meta=entry.meta,
+                module=entry.module,
+                loader=loader,
+            )
+        )
+    for module, seconds in sorted(
+        manifest.import_seconds.items(), key=lambda item: item[1], reverse=True
+    ):
+        logger.info("Deferred import of %s (saves ~%.3fs at startup)", module, seconds)
+    logger.info(
+        "Registered %s lazy tools, deferring ~%.3fs of module imports",
+        len(manifest.tools),
+        sum(manifest.import_seconds.values()),
+    )
+    return loader
+
+
+if __name__ == "__main__":
+    from datarobot_genai.drmcp import get_config
+    from datarobot_genai.drmcp.core.mcp_instance import mcp
+
+    manifest = asyncio.run(
+        generate_tool_manifest(mcp, get_config(), get_default_manifest_path())
+    )
+    print(f"Saved {len(manifest.tools)} tools to {get_default_manifest_path()}")
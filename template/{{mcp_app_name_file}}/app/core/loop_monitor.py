@@ -0,0 +1,282 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Event loop lag and slow callback monitor.
+
+Started in ``ServerLifecycle.post_server_start``, it measures two things:
+
+- the scheduling lag: a background task sleeps for
+  ``MCP_SERVER_LOOP_MONITOR_INTERVAL`` seconds and measures how late it is
+  woken up, the time the loop was kept busy by other callbacks;
+- slow callbacks: a watchdog thread pings the loop, and when the loop does not
+  answer within ``MCP_SERVER_LOOP_SLOW_CALLBACK_THRESHOLD`` seconds, records the
+  task that is blocking it and, unless ``MCP_SERVER_LOOP_STACK_SAMPLES=false``,
+  a sample of the stack it is blocked in. This is typically a tool running
+  blocking code in the loop instead of an executor (see app/core/executors.py).
+
+Both are exported as OpenTelemetry metrics and served by the ``/debug/loop``
+route, which only answers requests from the local host.
+"""
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from typing import Any, Optional
+
+from datarobot_genai.drmcp.core.routes_utils import prefix_mount_path
+from fastmcp import FastMCP
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+# Slow callbacks kept for /debug/loop
+MAX_SLOW_CALLBACKS = 20
+# Innermost frames kept in a stack sample
+MAX_STACK_FRAMES = 30
+
+
+@dataclass
+class SlowCallback:
+    """An occurrence of the event loop being blocked."""
+
+    detected_at: float
+    blocked_seconds: float
+    task: Optional[str]
+    stack: Optional[list[str]]
+
+
+class LoopLagMonitor:
+    """Periodic measurement of the event loop scheduling lag and slow callbacks."""
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task[None]] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._interval = 0.0
+        self._threshold = 0.0
+        self._sample_stacks = False
+        self._samples = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+        self._slow_callbacks_total = 0
+        self._slow_callbacks: deque[SlowCallback] = deque(maxlen=MAX_SLOW_CALLBACKS)
+        self._lag_histogram: Optional[metrics.Histogram] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(
+        self,
+        interval: float,
+        slow_callback_threshold: float = 0.0,
+        sample_stacks: bool = False,
+    ) -> None:
+        """
+        Start measuring in the running loop.
+
+        Args:
+            interval: seconds between lag measurements, 0 disables the monitor
+            slow_callback_threshold: seconds the loop may stay unresponsive
+                before it is reported as blocked, 0 disables the watchdog
+            sample_stacks: capture the stack the loop is blocked in
+        """
+        if self._task is not None or interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        self._interval = interval
+        self._threshold = slow_callback_threshold
+        self._sample_stacks = sample_stacks
+        self._register_instruments()
+        self._task = loop.create_task(self._run(), name="loop-lag-monitor")
+        if slow_callback_threshold > 0:
+            self._stopping.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    def record(self, lag: float) -> None:
+        self._samples += 1
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        self._total_lag += lag
+        if self._lag_histogram is not None:
+            self._lag_histogram.record(lag)
+
+    def record_slow_callback(self, slow_callback: SlowCallback) -> None:
+        self._slow_callbacks_total += 1
+        self._slow_callbacks.append(slow_callback)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "interval_seconds": self._interval,
+            "samples": self._samples,
+            "last_lag_seconds": round(self._last_lag, 6),
+            "max_lag_seconds": round(self._max_lag, 6),
+            "average_lag_seconds": (
+                round(self._total_lag / self._samples, 6) if self._samples else 0.0
+            ),
+            "slow_callback_threshold_seconds": self._threshold,
+            "slow_callbacks": self._slow_callbacks_total,
+        }
+
+    def slow_callbacks(self) -> list[dict[str, Any]]:
+        """Return the most recent slow callbacks, newest first."""
+        return [
+            asdict(slow_callback) for slow_callback in reversed(self._slow_callbacks)
+        ]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self.record(max(0.0, loop.time() - expected))
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        """Watchdog thread: ping the loop and report it when it does not answer."""
+        while not self._stopping.wait(self._interval):
+            answered = threading.Event()
+            sent = time.monotonic()
+            try:
+                loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                # The loop is closed
+                return
+            if answered.wait(self._threshold):
+                continue
+            task, stack = self._sample(loop, loop_thread_id)
+            detected_at = time.time()
+            logger.warning(
+                "Event loop blocked for more than %ss by %s%s",
+                self._threshold,
+                task or "a callback",
+                ":\n" + "".join(stack) if stack else "",
+            )
+            while not answered.wait(self._interval):
+                if self._stopping.is_set():
+                    return
+            self.record_slow_callback(
+                SlowCallback(
+                    detected_at=detected_at,
+                    blocked_seconds=round(time.monotonic() - sent, 6),
+                    task=task,
+                    stack=stack,
+                )
+            )
+
+    def _sample(
+        self, loop: asyncio.AbstractEventLoop, loop_thread_id: int
+    ) -> tuple[Optional[str], Optional[list[str]]]:
+        task = asyncio.current_task(loop)
+        task_name = None
+        if task is not None:
+            coro = task.get_coro()
+            task_name = f"{task.get_name()} ({getattr(coro, '__qualname__', coro)})"
+        stack = None
+        if self._sample_stacks:
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is not None:
+                stack = traceback.format_stack(frame)[-MAX_STACK_FRAMES:]
+        return task_name, stack
+
+    def _register_instruments(self) -> None:
+        if self._lag_histogram is not None:
+            return
+        meter = metrics.get_meter(__name__)
+        self._lag_histogram = meter.create_histogram(
+            "mcp.event_loop.lag",
+            unit="s",
+            description="Delay between when the loop should and did run a callback",
+        )
+        meter.create_observable_gauge(
+            "mcp.event_loop.max_lag",
+            callbacks=[lambda _: [Observation(self._max_lag)]],
+            unit="s",
+            description="Largest event loop lag measured since the server started",
+        )
+        meter.create_observable_counter(
+            "mcp.event_loop.slow_callbacks",
+            callbacks=[lambda _: [Observation(self._slow_callbacks_total)]],
+            description="Times the event loop was blocked over the threshold",
+        )
+
+
+def _is_local(request: Request) -> bool:
+    if request.client is None:
+        return False
+    try:
+        return ipaddress.ip_address(request.client.host).is_loopback
+    except ValueError:
+        return False
+
+
+def register_debug_routes(mcp: FastMCP, monitor: LoopLagMonitor) -> None:
+    """Register the ``/debug/loop`` route, only answering local requests."""
+
+    @mcp.custom_route(prefix_mount_path("/debug/loop"), methods=["GET"])
+    async def debug_loop(request: Request) -> JSONResponse:
+        if not _is_local(request):
+            return JSONResponse(
+                status_code=HTTPStatus.FORBIDDEN,
+                content={"error": "/debug/loop is only served to local clients"},
+            )
+        return JSONResponse(
+            status_code=HTTPStatus.OK,
+            content={
+                **monitor.stats(),
+                "recent_slow_callbacks": monitor.slow_callbacks(),
+            },
+        )
+
+
+# Global loop lag monitor instance
+_loop_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """Get the global loop lag monitor."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopLagMonitor()
+    return _loop_monitor
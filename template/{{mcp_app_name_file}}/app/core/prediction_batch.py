@@ -0,0 +1,301 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-batching of row predictions.
+
+Agents usually score one row at a time: each call of a structured prediction
+tool posts a CSV of one or a few rows to ``.../deployments/{id}/predictions``.
+When sessions call the same deployment at the same time, every call pays a
+prediction server request. With ``MCP_SERVER_PREDICTION_BATCHING_ENABLED``,
+``PredictionBatcher`` holds such calls for up to
+``MCP_SERVER_PREDICTION_BATCH_WINDOW`` seconds, or until
+``MCP_SERVER_PREDICTION_BATCH_MAX_ROWS`` rows are waiting, and sends their
+rows as one CSV through the deployment proxy (app/core/deployment_proxy.py).
+The rows of the response are split back into one response per call, with
+``rowId`` numbered from 0 for each call as if it had been sent alone.
+
+Only calls with the same deployment, URL, headers, query parameters and CSV
+columns are batched together, so the credentials of one session are never used
+for the rows of another. When the batch fails with an error status, or its
+response cannot be split by row, each call is sent on its own instead, so one
+bad row does not fail the other calls.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+from opentelemetry import metrics
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+if TYPE_CHECKING:
+    from app.core.deployment_proxy import DeploymentProxy
+
+logger = logging.getLogger(__name__)
+
+# Keys of the per-row list in prediction responses: DataRobot prediction
+# servers use "data", DRUM "predictions"
+ROW_KEYS = ("data", "predictions")
+
+_meter = metrics.get_meter(__name__)
+_batch_calls_histogram = _meter.create_histogram(
+    "mcp.prediction_batch.calls",
+    description="Prediction calls sent in one request to a deployment",
+)
+_fallbacks_counter = _meter.create_counter(
+    "mcp.prediction_batch.fallbacks",
+    description="Prediction batches sent again as one request per call",
+)
+
+
+def is_row_prediction(
+    method: str, url: str, headers: dict[str, str], data: Any
+) -> bool:
+    """Whether the request posts CSV rows to a predictions endpoint."""
+    content_type = next(
+        (value for key, value in headers.items() if key.lower() == "content-type"),
+        "",
+    )
+    return (
+        method == "POST"
+        and url.rstrip("/").endswith("/predictions")
+        and isinstance(data, str)
+        and "csv" in content_type.lower()
+    )
+
+
+@dataclass
+class _Call:
+    body: str
+    rows: list[list[str]]
+    future: "asyncio.Future[httpx.Response]"
+
+
+@dataclass
+class _Batch:
+    tool_name: str
+    deployment_id: str
+    url: str
+    headers: dict[str, str]
+    params: Optional[dict[str, Any]]
+    columns: list[str]
+    calls: list[_Call] = field(default_factory=list)
+    rows: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+def _split(response: httpx.Response, calls: list[_Call]) -> Optional[list[bytes]]:
+    """Split a batch response into the body of each call, None if impossible."""
+    try:
+        payload = response.json()
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    total = sum(len(call.rows) for call in calls)
+    key = next(
+        (
+            k
+            for k in ROW_KEYS
+            if isinstance(payload.get(k), list) and len(payload[k]) == total
+        ),
+        None,
+    )
+    if key is None:
+        return None
+    bodies = []
+    start = 0
+    for call in calls:
+        part = payload[key][start : start + len(call.rows)]
+        start += len(call.rows)
+        for row_id, row in enumerate(part):
+            if isinstance(row, dict) and "rowId" in row:
+                row["rowId"] = row_id
+        bodies.append(json.dumps({**payload, key: part}).encode())
+    return bodies
+
+
+class PredictionBatcher:
+    """Coalesce concurrent row predictions to a deployment into one request."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        config = config or get_user_config()
+        self.enabled = config.mcp_server_prediction_batching_enabled
+        self._window = config.mcp_server_prediction_batch_window
+        self._max_rows = config.mcp_server_prediction_batch_max_rows
+        self._pending: dict[tuple[Any, ...], _Batch] = {}
+        self._sending: set[asyncio.Task[None]] = set()
+        self._batches = 0
+        self._calls = 0
+        self._rows = 0
+        self._fallbacks = 0
+
+    async def submit(
+        self,
+        proxy: "DeploymentProxy",
+        tool_name: str,
+        deployment_id: str,
+        url: str,
+        headers: dict[str, str],
+        params: Optional[dict[str, Any]],
+        body: str,
+    ) -> httpx.Response:
+        """Send the CSV ``body`` with the calls waiting for the same deployment."""
+        records = list(csv.reader(io.StringIO(body)))
+        if len(records) < 2:
+            # Nothing to batch, let the deployment report the error
+            return await proxy.request(
+                tool_name,
+                deployment_id,
+                "POST",
+                url,
+                params=params,
+                content=body,
+                headers=headers,
+            )
+        columns, rows = records[0], records[1:]
+        key = (
+            deployment_id,
+            url,
+            tuple(sorted(headers.items())),
+            json.dumps(params, sort_keys=True),
+            tuple(columns),
+        )
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(
+                tool_name, deployment_id, url, headers, params, columns
+            )
+            batch.timer = asyncio.get_running_loop().call_later(
+                self._window, self._flush, key, proxy
+            )
+        call = _Call(body, rows, asyncio.get_running_loop().create_future())
+        batch.calls.append(call)
+        batch.rows += len(rows)
+        if batch.rows >= self._max_rows:
+            self._flush(key, proxy)
+        return await call.future
+
+    def _flush(self, key: tuple[Any, ...], proxy: "DeploymentProxy") -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.create_task(self._send(batch, proxy))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: _Batch, proxy: "DeploymentProxy") -> None:
+        self._batches += 1
+        self._calls += len(batch.calls)
+        self._rows += batch.rows
+        _batch_calls_histogram.record(len(batch.calls))
+        try:
+            if len(batch.calls) == 1:
+                await self._send_alone(batch, batch.calls[0], proxy)
+                return
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(batch.columns)
+            for call in batch.calls:
+                writer.writerows(call.rows)
+            response = await proxy.request(
+                batch.tool_name,
+                batch.deployment_id,
+                "POST",
+                batch.url,
+                params=batch.params,
+                content=buffer.getvalue(),
+                headers=batch.headers,
+            )
+            bodies = _split(response, batch.calls) if response.is_success else None
+            if bodies is None:
+                logger.debug(
+                    "Sending the %s calls of a %s batch one by one (status %s)",
+                    len(batch.calls),
+                    batch.tool_name,
+                    response.status_code,
+                )
+                self._fallbacks += 1
+                _fallbacks_counter.add(1)
+                await asyncio.gather(
+                    *(self._send_alone(batch, call, proxy) for call in batch.calls)
+                )
+                return
+            for call, content in zip(batch.calls, bodies):
+                if not call.future.done():
+                    call.future.set_result(
+                        httpx.Response(
+                            response.status_code,
+                            headers={
+                                "content-type": response.headers.get(
+                                    "content-type", "application/json"
+                                )
+                            },
+                            content=content,
+                        )
+                    )
+        except Exception as e:
+            for call in batch.calls:
+                if not call.future.done():
+                    call.future.set_exception(e)
+
+    async def _send_alone(
+        self, batch: _Batch, call: _Call, proxy: "DeploymentProxy"
+    ) -> None:
+        try:
+            response = await proxy.request(
+                batch.tool_name,
+                batch.deployment_id,
+                "POST",
+                batch.url,
+                params=batch.params,
+                content=call.body,
+                headers=batch.headers,
+            )
+        except Exception as e:
+            if not call.future.done():
+                call.future.set_exception(e)
+            return
+        if not call.future.done():
+            call.future.set_result(response)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches": self._batches,
+            "calls": self._calls,
+            "rows": self._rows,
+            "fallbacks": self._fallbacks,
+            "pending": sum(len(batch.calls) for batch in self._pending.values()),
+        }
+
+
+# Global prediction batcher instance
+_prediction_batcher: Optional[PredictionBatcher] = None
+
+
+def get_prediction_batcher() -> PredictionBatcher:
+    """Get the global prediction batcher."""
+    global _prediction_batcher
+    if _prediction_batcher is None:
+        _prediction_batcher = PredictionBatcher()
+    return _prediction_batcher
@@ -0,0 +1,452 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming realtime predictions of CSV files.
+
+The realtime prediction tools of ``datarobot-genai`` load their whole input
+into a DataFrame and return the scored rows in the tool response, which limits
+them to small datasets. ``predict_score_file_realtime`` scores a CSV file of
+``MCP_SERVER_PREDICTION_FILES_DIR`` with bounded memory:
+
+- The file is read sequentially in chunks of
+  ``MCP_SERVER_PREDICTION_STREAM_CHUNK_ROWS`` rows, every column as strings so
+  the values are sent as written. It is not memory-mapped: every mapped page
+  read would count in the resident memory of the server until the file is
+  closed.
+- Up to ``MCP_SERVER_PREDICTION_STREAM_CONCURRENCY`` chunks are scored at the
+  same time through the deployment proxy (app/core/deployment_proxy.py), with
+  its retries and circuit breaker. The next chunk is only read once the oldest
+  one has been written, so at most that many chunks are held in memory.
+- The scored rows are written in input order as they arrive, to a file next
+  to the input, or to ``AWS_PREDICTIONS_S3_BUCKET`` with a multipart upload
+  when set. The output only appears once every chunk has been scored.
+
+Rows are scored independently, so time series deployments, which need the
+history of each series in one request, are not supported.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from pathlib import Path, PurePosixPath
+from typing import Annotated, Any, Optional, Union
+
+import datarobot as dr
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from datarobot.errors import ClientError
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.tool_config import ToolType, is_tool_enabled
+from datarobot_genai.drtools.core.clients.datarobot import (
+    get_datarobot_access_token,
+    request_user_dr_sdk,
+)
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+from opentelemetry import metrics
+from pydantic import Field
+
+from app.core.deployment_proxy import DeploymentProxy, get_deployment_proxy
+from app.core.executors import get_executor_manager
+from app.core.prediction_validation import read_csv_header
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+PREDICT_FILE_TOOL_NAME = "predict_score_file_realtime"
+
+# Smallest part of an S3 multipart upload, except the last one, is 5 MiB
+S3_PART_SIZE = 8 * 1024 * 1024
+
+_meter = metrics.get_meter(__name__)
+_rows_counter = _meter.create_counter(
+    "mcp.prediction_stream.rows",
+    description="Rows of files scored by predict_score_file_realtime",
+)
+
+
+def _boto3_available() -> bool:
+    try:
+        import boto3  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_files_path(files_dir: str, path: str) -> Path:
+    """Resolve ``path`` in ``files_dir``, rejecting paths outside of it."""
+    root = Path(files_dir).resolve()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ToolError(f"{path} is outside of the prediction files directory")
+    return resolved
+
+
+def _prediction_target(deployment_id: str) -> tuple[str, dict[str, str]]:
+    """The URL and headers of the predictions endpoint, blocking."""
+    # Same endpoints as datarobot_predict.deployment.predict
+    try:
+        with request_user_dr_sdk(headers_auth_only=True):
+            deployment = dr.Deployment.get(deployment_id)
+            endpoint = dr.client.get_client().endpoint
+    except ClientError as e:
+        raise ToolError(f"Deployment {deployment_id} cannot be fetched: {e}") from e
+    headers = {
+        "Authorization": f"Bearer {get_datarobot_access_token(headers_auth_only=True)}",
+        "Content-Type": "text/csv; charset=utf-8",
+        "Accept": "text/csv",
+    }
+    environment = deployment.prediction_environment or {}
+    if environment.get("platform") == "datarobotServerless":
+        return f"{endpoint}/deployments/{deployment.id}/predictions", headers
+    if "datarobot-nginx" in os.environ.get("DATAROBOT_ENDPOINT", ""):
+        return (
+            "http://datarobot-prediction-server:80/predApi/v1.0/deployments/"
+            f"{deployment.id}/predictions",
+            headers,
+        )
+    server = deployment.default_prediction_server
+    if not server:
+        raise ToolError(f"Deployment {deployment_id} has no prediction server")
+    datarobot_key = server.get("datarobot-key")
+    if datarobot_key:
+        headers["datarobot-key"] = datarobot_key
+    url = f"{server['url']}/predApi/v1.0/deployments/{deployment.id}/predictions"
+    return url, headers
+
+
+class _ChunkReader:
+    """CSV encoded chunks of the rows of a CSV file, blocking."""
+
+    def __init__(self, path: Path, rows: int) -> None:
+        self._rows = rows
+        header = read_csv_header(str(path))
+        self._source = pa.OSFile(str(path))
+        self._reader = pacsv.open_csv(
+            self._source,
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        self._batches: list[pa.RecordBatch] = []
+        self._buffered = 0
+
+    def next_chunk(self) -> Optional[tuple[int, bytes]]:
+        """Return the row count and CSV of the next chunk, None at the end."""
+        while self._buffered < self._rows:
+            try:
+                batch = self._reader.read_next_batch()
+            except StopIteration:
+                break
+            self._batches.append(batch)
+            self._buffered += batch.num_rows
+        if not self._buffered:
+            return None
+        table = pa.Table.from_batches(self._batches, schema=self._reader.schema)
+        chunk, rest = table.slice(0, self._rows), table.slice(self._rows)
+        self._batches = rest.to_batches()
+        self._buffered = rest.num_rows
+        buffer = pa.BufferOutputStream()
+        pacsv.write_csv(chunk, buffer)
+        return chunk.num_rows, buffer.getvalue().to_pybytes()
+
+    def close(self) -> None:
+        self._source.close()
+
+
+class _FileSink:
+    """Scored rows written to a file, renamed into place when complete."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._part = path.with_name(path.name + ".part")
+        self._file = open(self._part, "wb")
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+
+    def close(self) -> str:
+        self._file.close()
+        os.replace(self._part, self._path)
+        return str(self._path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._part.unlink(missing_ok=True)
+
+
+class _S3Sink:
+    """Scored rows written to S3 with a multipart upload."""
+
+    def __init__(self, bucket: str, key: str) -> None:
+        import boto3
+
+        self._client = boto3.client("s3")
+        self._bucket = bucket
+        self._key = key
+        self._upload_id = self._client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType="text/csv"
+        )["UploadId"]
+        self._parts: list[dict[str, Any]] = []
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) >= S3_PART_SIZE:
+            self._upload_part()
+
+    def _upload_part(self) -> None:
+        number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": number})
+        self._buffer.clear()
+
+    def close(self) -> str:
+        if self._buffer or not self._parts:
+            self._upload_part()
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        return f"s3://{self._bucket}/{self._key}"
+
+    def abort(self) -> None:
+        self._client.abort_multipart_upload(
+            Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+        )
+
+
+class PredictionStreamer:
+    """Score CSV files chunk by chunk, writing the scored rows as they arrive."""
+
+    def __init__(
+        self,
+        config: Optional[UserAppConfig] = None,
+        proxy: Optional[DeploymentProxy] = None,
+    ) -> None:
+        config = config or get_user_config()
+        self._files_dir = config.mcp_server_prediction_files_dir or "."
+        self._chunk_rows = config.mcp_server_prediction_stream_chunk_rows
+        self._concurrency = config.mcp_server_prediction_stream_concurrency
+        self._bucket = config.aws_predictions_s3_bucket
+        self._prefix = config.aws_predictions_s3_prefix.strip("/")
+        if self._bucket and not _boto3_available():
+            logger.warning(
+                "AWS_PREDICTIONS_S3_BUCKET is set but the 'boto3' package is not "
+                "installed, writing scored files to the prediction files directory. "
+                "Install it with the 's3' extra."
+            )
+            self._bucket = None
+        self._proxy = proxy
+
+    @property
+    def proxy(self) -> DeploymentProxy:
+        return self._proxy or get_deployment_proxy()
+
+    def _open_sink(self, output_path: str) -> Union[_FileSink, _S3Sink]:
+        if self._bucket:
+            key = PurePosixPath(output_path)
+            if key.is_absolute() or ".." in key.parts:
+                raise ToolError(f"{output_path} is not a valid output key")
+            return _S3Sink(
+                self._bucket, "/".join(filter(None, (self._prefix, str(key))))
+            )
+        return _FileSink(resolve_files_path(self._files_dir, output_path))
+
+    async def score_file(
+        self,
+        deployment_id: str,
+        file_path: str,
+        output_path: Optional[str] = None,
+        passthrough_columns: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Score the rows of ``file_path`` with ``deployment_id``."""
+        source = resolve_files_path(self._files_dir, file_path)
+        if not source.is_file():
+            raise ToolError(f"File {file_path} does not exist")
+        if output_path is None:
+            output_path = str(
+                source.with_name(f"{source.stem}.predictions.csv").relative_to(
+                    Path(self._files_dir).resolve()
+                )
+            )
+        params: dict[str, Any] = {}
+        if passthrough_columns == "all":
+            params["passthroughColumnsSet"] = "all"
+        elif passthrough_columns:
+            params["passthroughColumns"] = [
+                column.strip() for column in passthrough_columns.split(",")
+            ]
+
+        executor = get_executor_manager()
+        started = time.perf_counter()
+        url, headers = await executor.run("thread", _prediction_target, deployment_id)
+        reader = await executor.run("thread", _ChunkReader, source, self._chunk_rows)
+        try:
+            sink = await executor.run("thread", self._open_sink, output_path)
+            pending: deque[asyncio.Task[bytes]] = deque()
+            header: Optional[bytes] = None
+            rows = chunks = 0
+            try:
+                while True:
+                    chunk = await executor.run("thread", reader.next_chunk)
+                    if chunk is None:
+                        break
+                    rows += chunk[0]
+                    chunks += 1
+                    pending.append(
+                        asyncio.create_task(
+                            self._score(
+                                deployment_id, url, headers, params, chunk, chunks
+                            )
+                        )
+                    )
+                    if len(pending) >= self._concurrency:
+                        header = await self._write(
+                            sink, await pending.popleft(), header
+                        )
+                while pending:
+                    header = await self._write(sink, await pending.popleft(), header)
+                location = await executor.run("thread", sink.close)
+            except BaseException:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                await executor.run("thread", sink.abort)
+                raise
+        finally:
+            reader.close()
+
+        _rows_counter.add(rows)
+        logger.info(
+            "Scored %s rows of %s in %s chunks with deployment %s",
+            rows,
+            file_path,
+            chunks,
+            deployment_id,
+        )
+        return {
+            "deployment_id": deployment_id,
+            "rows": rows,
+            "chunks": chunks,
+            "output": location,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    async def _score(
+        self,
+        deployment_id: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any],
+        chunk: tuple[int, bytes],
+        index: int,
+    ) -> bytes:
+        response = await self.proxy.request(
+            PREDICT_FILE_TOOL_NAME,
+            deployment_id,
+            "POST",
+            url,
+            params=params,
+            content=chunk[1],
+            headers=headers,
+        )
+        if not response.is_success:
+            raise ToolError(
+                f"HTTP {response.status_code} error from deployment {deployment_id} "
+                f"on rows chunk {index}: {response.text[:500]}"
+            )
+        return response.content
+
+    async def _write(
+        self, sink: Union[_FileSink, _S3Sink], body: bytes, header: Optional[bytes]
+    ) -> bytes:
+        """Write a scored chunk, keeping the header of the first one only."""
+        first, _, rows = body.partition(b"\n")
+        if header is None:
+            header, data = first, body
+        elif first != header:
+            raise ToolError("The scored chunks of the file have different columns")
+        else:
+            data = rows
+        if data and not data.endswith(b"\n"):
+            data += b"\n"
+        await get_executor_manager().run("thread", sink.write, data)
+        return header
+
+
+def register_prediction_file_tool(
+    mcp: FastMCP, config: Optional[UserAppConfig] = None
+) -> None:
+    """Register ``predict_score_file_realtime`` if a files directory is set."""
+    config = config or get_user_config()
+    if not config.mcp_server_prediction_files_dir or not is_tool_enabled(
+        ToolType.PREDICTIVE, get_config()
+    ):
+        return
+    streamer = PredictionStreamer(config)
+
+    @mcp.tool(
+        name=PREDICT_FILE_TOOL_NAME,
+        tags={"predictive", "prediction", "realtime", "scoring"},
+    )
+    async def predict_score_file_realtime(
+        deployment_id: Annotated[str, Field(description="MLOps deployment id.")],
+        file_path: Annotated[
+            str,
+            Field(description="CSV file to score, relative to the files directory."),
+        ],
+        output_path: Annotated[
+            Optional[str],
+            Field(
+                description="Where to write the scored CSV, relative to the files "
+                "directory or the S3 prefix. Defaults to <file>.predictions.csv."
+            ),
+        ] = None,
+        passthrough_columns: Annotated[
+            Optional[str],
+            Field(
+                description="'all' or comma-separated input column names to copy "
+                "through to the output."
+            ),
+        ] = None,
+    ) -> ToolResult:
+        """
+        Score a large CSV file with a deployment, writing the predictions to a file.
+
+        Use it when the rows to score are in a file of the prediction files
+        directory rather than in the conversation. The file is sent in chunks
+        and the scored rows are written in order to output_path, locally or on
+        S3; only the output location and row counts are returned. Not for time
+        series deployments.
+        """
+        return ToolResult(
+            structured_content=await streamer.score_file(
+                deployment_id, file_path, output_path, passthrough_columns
+            )
+        )
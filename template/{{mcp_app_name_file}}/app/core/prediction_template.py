@@ -0,0 +1,213 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Prediction data templates from cached column plans.
+
+``deployment_generate_prediction_sample`` of ``datarobot-genai`` works out the
+value of every column from the deployment features on each call, builds a
+list per column of ``n_rows`` values, then converts a polars DataFrame back to
+rows. Agents call it again and again with different ``n_rows``, and large
+templates spend most of their time in that conversion.
+
+``register_prediction_template`` replaces the tool, unless
+``MCP_SERVER_PREDICTION_TEMPLATE_PLANS`` is false, with one that:
+
+- Compiles the features of a deployment once into a ``ColumnPlan``: the
+  ordered columns, the value of each column, and the metadata of the
+  response. Plans are cached by deployment, and reused as long as the
+  features they were compiled from are unchanged, so a new model gets a new
+  plan. The least recently used of ``MCP_SERVER_PREDICTION_TEMPLATE_MAX_PLANS``
+  plans are evicted.
+- Renders rows by copying one prebuilt row. Only the generated dates of the
+  time series datetime column vary, and they are formatted with numpy in one
+  call.
+
+The response is the same as the tool's.
+"""
+
+import functools
+import importlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.tool_config import ToolType, is_tool_enabled
+from datarobot_genai.drtools.core.exceptions import ToolError, ToolErrorKind
+from opentelemetry import metrics
+
+from app.core.executors import get_executor_manager
+from app.core.feature_metadata import (
+    DEPLOYMENT_INFO_MODULE,
+    replace_deployment_info_tool,
+)
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_lookups_counter = _meter.create_counter(
+    "mcp.prediction_template.lookups",
+    description="Prediction data template plan lookups, by result",
+)
+
+
+@dataclass
+class ColumnPlan:
+    # Value of each column, in column order
+    row: dict[str, Any]
+    # Time series datetime column filled with one date per day from now
+    dates_column: Optional[str]
+    # Response keys other than template_data
+    metadata: dict[str, Any]
+
+
+def compile_column_plan(features_info: dict[str, Any]) -> ColumnPlan:
+    """Compile the result of ``deployment_get_features`` as the tool reads it."""
+    row: dict[str, Any] = {}
+    for feature in features_info["features"]:
+        frequent_values = feature.get("frequent_values")
+        if frequent_values and isinstance(frequent_values, list):
+            row[feature["name"]] = frequent_values[0]
+        elif feature["feature_type"].lower() in ("numeric", "date"):
+            row[feature["name"]] = None
+        else:
+            row[feature["name"]] = ""
+
+    dates_column = None
+    if "time_series_config" in features_info:
+        ts_config = features_info["time_series_config"]
+        if ts_config["datetime_column"] not in row:
+            dates_column = ts_config["datetime_column"]
+            row[dates_column] = None
+        for series_column in ts_config["series_id_columns"]:
+            if series_column not in row:
+                row[series_column] = "series_A"
+
+    metadata = {
+        "model_type": features_info["model_type"],
+        "target": features_info["target"],
+        "target_type": features_info["target_type"],
+        "total_features": features_info["total_features"],
+    }
+    if "time_series_config" in features_info:
+        metadata["time_series_config"] = features_info["time_series_config"]
+    return ColumnPlan(row, dates_column, metadata)
+
+
+def _dates(n_rows: int) -> list[str]:
+    """One ISO date per day from now, as ``datetime.isoformat`` gives them."""
+    now = datetime.now()
+    days = np.datetime64(now, "us") + np.arange(n_rows) * np.timedelta64(1, "D")
+    # isoformat leaves out zero microseconds
+    dates: list[str] = np.datetime_as_string(
+        days, unit="us" if now.microsecond else "s"
+    ).tolist()
+    return dates
+
+
+def render_template(plan: ColumnPlan, n_rows: int) -> list[dict[str, Any]]:
+    """Return ``n_rows`` rows of the template."""
+    if plan.dates_column is None:
+        return [plan.row.copy() for _ in range(n_rows)]
+    column = plan.dates_column
+    return [{**plan.row, column: date} for date in _dates(n_rows)]
+
+
+class TemplatePlanCache:
+    """Column plans, by deployment."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        config = config or get_user_config()
+        self._max_entries = config.mcp_server_prediction_template_max_plans
+        self._entries: OrderedDict[str, tuple[dict[str, Any], ColumnPlan]] = (
+            OrderedDict()
+        )
+
+    def get(self, deployment_id: str, features_info: dict[str, Any]) -> ColumnPlan:
+        """Return the plan of ``features_info``, compiling it if they changed."""
+        entry = self._entries.get(deployment_id)
+        if entry is not None and entry[0] == features_info:
+            self._entries.move_to_end(deployment_id)
+            _lookups_counter.add(1, {"result": "hit"})
+            return entry[1]
+        _lookups_counter.add(1, {"result": "miss"})
+        plan = compile_column_plan(features_info)
+        self._entries[deployment_id] = (features_info, plan)
+        self._entries.move_to_end(deployment_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return plan
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def planned_template(
+    func: Callable[..., Any], cache: TemplatePlanCache
+) -> Callable[..., Any]:
+    """Replace the template tool ``func``, keeping its name and signature."""
+
+    @functools.wraps(func)
+    async def generate(*, deployment_id: str, n_rows: int = 1) -> dict[str, Any]:
+        if not deployment_id:
+            raise ToolError(
+                "Deployment ID must be provided", kind=ToolErrorKind.VALIDATION
+            )
+        if n_rows is None or n_rows <= 0:
+            n_rows = 1
+        module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+        features_info = await module.deployment_get_features(
+            deployment_id=deployment_id
+        )
+        if not isinstance(features_info, dict) or "features" not in features_info:
+            raise ToolError(
+                f"Invalid feature information received: {features_info}",
+                kind=ToolErrorKind.INTERNAL,
+            )
+        plan = cache.get(deployment_id, features_info)
+        rows = await get_executor_manager().run("thread", render_template, plan, n_rows)
+        response = {"deployment_id": deployment_id, **plan.metadata}
+        response["template_data"] = rows
+        if "time_series_config" in plan.metadata:
+            # Keep the key order of the tool's response
+            response["time_series_config"] = response.pop("time_series_config")
+        return response
+
+    generate._column_plan = cache  # type: ignore[attr-defined]
+    return generate
+
+
+def register_prediction_template(config: Optional[UserAppConfig] = None) -> bool:
+    """
+    Generate prediction data templates from cached column plans, unless disabled.
+
+    Call before the predictive tools are registered.
+    """
+    config = config or get_user_config()
+    if not config.mcp_server_prediction_template_plans or not is_tool_enabled(
+        ToolType.PREDICTIVE, get_config()
+    ):
+        return False
+    replace_deployment_info_tool(
+        "deployment_generate_prediction_sample",
+        functools.partial(planned_template, cache=TemplatePlanCache(config)),
+        "_column_plan",
+    )
+    return True
@@ -0,0 +1,318 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar validation of prediction data.
+
+``deployment_validate_prediction_data`` of ``datarobot-genai`` loads the whole
+CSV into a polars DataFrame, infers a type for each column, then checks the
+deployment features one column at a time. ``validate_prediction_csv`` gives
+the same report from CSV read in blocks of
+``MCP_SERVER_PREDICTION_VALIDATION_BLOCK_SIZE`` bytes with pyarrow:
+
+- Every column is read as strings, so type inference never fails half way
+  through a file. Only the blocks being read ahead and checked are held in
+  memory, so memory depends on the block size, not on the size of the file.
+- Each block is checked with vectorized compute functions: empty values, rows
+  where all values are empty (skipped, as the tool does), and values of
+  numeric features that are not numbers are counted per column.
+- Values of the time series datetime column are parsed with polars, as the
+  tool does, one block at a time.
+
+The report keeps the keys and messages of the tool, its warnings include how
+many values were affected, and ``column_stats`` gives the missing and type
+violation counts of each feature column.
+
+``register_prediction_validation`` replaces the tool with one using this
+engine, unless ``MCP_SERVER_PREDICTION_VALIDATION_COLUMNAR`` is false.
+"""
+
+import csv
+import functools
+import importlib
+import io
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Optional, Union
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.tool_config import ToolType, is_tool_enabled
+from datarobot_genai.drtools.core.exceptions import ToolError, ToolErrorKind
+
+from app.core.executors import get_executor_manager
+from app.core.feature_metadata import (
+    DEPLOYMENT_INFO_MODULE,
+    replace_deployment_info_tool,
+)
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+CsvSource = Union[str, "os.PathLike[str]", bytes]
+
+# Values polars casts to a float: decimals, exponents, inf and nan
+NUMBER_PATTERN = r"(?i)^[+-]?(\d+\.?\d*|\.\d+)(e[+-]?\d+)?$|^[+-]?(inf|infinity|nan)$"
+
+# Features with an importance above this are reported as important
+IMPORTANCE_THRESHOLD = 0.1
+
+
+@dataclass
+class ColumnStats:
+    # Values that are empty, in rows that are not
+    missing: int = 0
+    # Values that are not numbers in numeric features, or dates in the
+    # datetime column
+    type_violations: int = 0
+
+
+def _feature_name(feature: dict[str, Any]) -> str:
+    return str(feature["name"] if "name" in feature else feature["feature_name"])
+
+
+def _importance(feature: dict[str, Any]) -> float:
+    try:
+        return float(feature.get("importance") or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def read_csv_header(source: CsvSource) -> list[str]:
+    """Read the column names of the CSV."""
+    text: IO[str]
+    if isinstance(source, bytes):
+        text = io.TextIOWrapper(io.BytesIO(source), encoding="utf-8-sig", newline="")
+    else:
+        text = open(source, encoding="utf-8-sig", newline="")
+    with text:
+        return next(csv.reader(text), [])
+
+
+def _count(mask: pa.Array) -> int:
+    return int(pc.sum(mask).as_py() or 0)
+
+
+def _unparsed_dates(values: pa.Array) -> int:
+    """Count the values polars cannot parse as dates, as the tool does."""
+    if len(values) == 0:
+        return 0
+    try:
+        parsed = (
+            pl.Series(values).str.replace("Z", "+00:00").str.to_datetime(strict=False)
+        )
+    except Exception:
+        return len(values)
+    return parsed.null_count()
+
+
+def validate_prediction_csv(
+    source: CsvSource,
+    features_info: dict[str, Any],
+    block_size: int = 1024 * 1024,
+    deployment_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Validate the CSV file or data ``source`` against the deployment features.
+
+    ``features_info`` is the result of ``deployment_get_features``. Returns the
+    report of ``deployment_validate_prediction_data``, with ``column_stats``.
+    """
+    header = read_csv_header(source)
+    # Column names are stripped, LLMs often paste CSV with indented headers
+    columns = [name.strip() for name in header]
+    features = {_feature_name(f): f for f in features_info["features"]}
+    ts_config = features_info.get("time_series_config")
+    datetime_column = ts_config["datetime_column"] if ts_config else None
+
+    checked = [name for name in dict.fromkeys(columns) if name in features]
+    stats = {name: ColumnStats() for name in checked}
+    present = {name: 0 for name in checked}
+    numeric = {
+        name
+        for name in checked
+        if str(features[name].get("feature_type", "")).lower() == "numeric"
+    }
+    rows = 0
+    unparsed_dates = 0
+
+    try:
+        reader = pacsv.open_csv(
+            pa.BufferReader(source) if isinstance(source, bytes) else source,
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                null_values=[""],
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            if batch.num_rows == 0 or batch.num_columns == 0:
+                continue
+            values = {}
+            for name, column in zip(columns, batch.columns):
+                # On duplicate names the first column is checked
+                if name not in values:
+                    trimmed = pc.utf8_trim_whitespace(column)
+                    values[name] = (
+                        trimmed,
+                        pc.fill_null(pc.not_equal(trimmed, ""), False),
+                    )
+            row_nonempty = functools.reduce(
+                pc.or_, [nonempty for _, nonempty in values.values()]
+            )
+            batch_rows = _count(row_nonempty)
+            rows += batch_rows
+            for name in checked:
+                trimmed, nonempty = values[name]
+                count = _count(nonempty)
+                present[name] += count
+                stats[name].missing += batch_rows - count
+                if name in numeric:
+                    is_number = pc.match_substring_regex(trimmed, NUMBER_PATTERN)
+                    stats[name].type_violations += _count(
+                        pc.and_(nonempty, pc.invert(pc.fill_null(is_number, False)))
+                    )
+            if datetime_column in values:
+                trimmed, nonempty = values[datetime_column]
+                unparsed = _unparsed_dates(pc.filter(trimmed, nonempty))
+                unparsed_dates += unparsed
+                if datetime_column in stats:
+                    stats[datetime_column].type_violations += unparsed
+    except pa.ArrowInvalid as e:
+        raise ToolError(
+            f"Argument validation error: 'csv_string' is not valid CSV: {e}",
+            kind=ToolErrorKind.VALIDATION,
+        ) from e
+
+    report: dict[str, Any] = {
+        "status": "valid",
+        "errors": [],
+        "warnings": [],
+        "info": [],
+    }
+    for name, feature in features.items():
+        if name not in stats:
+            importance = _importance(feature)
+            if importance > IMPORTANCE_THRESHOLD:
+                report["warnings"].append(
+                    f"Missing important feature: {name} (importance: {importance:.2f})"
+                )
+            else:
+                report["warnings"].append(
+                    f"Missing feature column: {name} (column will be treated as "
+                    f"missing values)"
+                )
+        elif present[name] == 0:
+            report["info"].append(
+                f"Feature {name} is entirely missing or empty (this is allowed)"
+            )
+        elif name in numeric and stats[name].type_violations:
+            report["warnings"].append(
+                f"Feature {name} should be numeric but is string "
+                f"({stats[name].type_violations} of {present[name]} values)"
+            )
+
+    extra_columns = sorted(set(columns) - set(features))
+    if extra_columns:
+        report["info"].append(
+            f"Extra columns found (will be ignored): {', '.join(extra_columns)}"
+        )
+
+    if ts_config:
+        if datetime_column not in columns:
+            report["errors"].append(
+                f"Missing required datetime column: {datetime_column}"
+            )
+        elif unparsed_dates:
+            report["errors"].append(
+                f"Datetime column {datetime_column} cannot be parsed as dates"
+            )
+        for series_column in ts_config["series_id_columns"]:
+            if series_column not in columns:
+                report["errors"].append(
+                    f"Missing required series ID column: {series_column}"
+                )
+        if report["errors"]:
+            report["status"] = "invalid"
+
+    report["summary"] = {
+        "rows": rows,
+        "columns": len(columns),
+        "deployment_id": deployment_id,
+        "model_type": features_info["model_type"],
+    }
+    report["column_stats"] = {name: asdict(stats[name]) for name in checked}
+    return report
+
+
+def columnar_validation(
+    func: Callable[..., Any], block_size: int
+) -> Callable[..., Any]:
+    """Replace the validation tool ``func``, keeping its name and signature."""
+
+    @functools.wraps(func)
+    async def validate(*, deployment_id: str, csv_string: str) -> dict[str, Any]:
+        if not csv_string or not csv_string.strip():
+            raise ToolError(
+                "Argument validation error: 'csv_string' cannot be empty.",
+                kind=ToolErrorKind.VALIDATION,
+            )
+        if not deployment_id:
+            raise ToolError(
+                "Deployment ID must be provided", kind=ToolErrorKind.VALIDATION
+            )
+        module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+        features_info = await module.deployment_get_features(
+            deployment_id=deployment_id
+        )
+        report: dict[str, Any] = await get_executor_manager().run(
+            "thread",
+            validate_prediction_csv,
+            csv_string.strip().encode(),
+            features_info,
+            block_size,
+            deployment_id,
+        )
+        return report
+
+    validate._columnar_validation = True  # type: ignore[attr-defined]
+    return validate
+
+
+def register_prediction_validation(config: Optional[UserAppConfig] = None) -> bool:
+    """
+    Validate prediction data with the columnar engine, unless disabled.
+
+    Call before the predictive tools are registered.
+    """
+    config = config or get_user_config()
+    if not config.mcp_server_prediction_validation_columnar or not is_tool_enabled(
+        ToolType.PREDICTIVE, get_config()
+    ):
+        return False
+    replace_deployment_info_tool(
+        "deployment_validate_prediction_data",
+        functools.partial(
+            columnar_validation,
+            block_size=config.mcp_server_prediction_validation_block_size,
+        ),
+        "_columnar_validation",
+    )
+    return True
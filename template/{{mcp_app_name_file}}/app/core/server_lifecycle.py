@@ -13,11 +13,20 @@
 # limitations under the License.
 
 import logging
+from multiprocessing.synchronize import Event
 from typing import Optional
 
 from datarobot_genai.drmcp import BaseServerLifecycle
 from fastmcp import FastMCP
 
+from app.core.drain import get_drain_manager
+from app.core.executors import get_executor_manager
+from app.core.http_client import get_http_client_pool
+from app.core.loop_monitor import get_loop_monitor
+from app.core.tool_discovery import get_default_snapshot_path, get_tool_discovery
+from app.core.user_config import get_user_config
+from app.core.warmup import get_warmup_manager
+
 
 class ServerLifecycle(BaseServerLifecycle):
     """
@@ -27,10 +36,22 @@ class ServerLifecycle(BaseServerLifecycle):
     You only need to implement the methods you actually need - all others have safe defaults.
     """
 
-    def __init__(self) -> None:
-        """Initialize the ServerLifecycle manager."""
+    def __init__(
+        self, worker_id: Optional[int] = None, started: Optional[Event] = None
+    ) -> None:
+        """
+        Initialize the ServerLifecycle manager.
+
+        Args:
+            worker_id: Index of the worker process when running with multiple
+                workers (each worker owns its own lifecycle), None otherwise
+            started: Event set once the server is up, telling the worker
+                supervisor that this worker started successfully
+        """
         self._logger = logging.getLogger(self.__class__.__name__)
         self._mcp: Optional[FastMCP] = None
+        self._worker_id = worker_id
+        self._started = started
 
     async def pre_server_start(self, mcp: FastMCP) -> None:
         """
@@ -42,6 +63,19 @@ class ServerLifecycle(BaseServerLifecycle):
         self._logger.info("Executing pre-server start user actions...")
         self._mcp = mcp
 
+        # Shared pooled HTTP client for tools (see app/core/http_client.py)
+        get_http_client_pool().start()
+
+        # Deployment tools of the on-disk registry, refreshed after startup
+        user_config = get_user_config()
+        if user_config.mcp_server_dynamic_tools_incremental:
+            discovery = get_tool_discovery()
+            discovery.open(
+                user_config.mcp_server_dynamic_tools_snapshot_path
+                or get_default_snapshot_path()
+            )
+            await discovery.restore()
+
         # Example initialization tasks:
         # - Initialize user-specific resources
         # - Set up connections to external services
@@ -62,6 +96,41 @@ class ServerLifecycle(BaseServerLifecycle):
         """
         self._logger.info("Executing post-server start user actions...")
 
+        # Startup succeeded: from now on the supervisor restarts this worker if it exits
+        if self._started is not None:
+            self._started.set()
+
+        # On SIGTERM, wait for in-flight tool calls before shutting down
+        user_config = get_user_config()
+        get_drain_manager().install_signal_handlers(
+            timeout=user_config.mcp_server_drain_timeout
+        )
+
+        # Measure the event loop lag and report the callbacks blocking it, so that
+        # tools running blocking code show up (served on /debug/loop)
+        get_loop_monitor().start(
+            user_config.mcp_server_loop_monitor_interval,
+            slow_callback_threshold=user_config.mcp_server_loop_slow_callback_threshold,
+            sample_stacks=user_config.mcp_server_loop_stack_samples,
+        )
+
+        # Warm up caches and connections; /readyz answers 503 until this is done.
+        # Register warm-up tasks with @warmup_task (see app/core/warmup.py).
+        if user_config.mcp_server_warmup_enabled:
+            await get_warmup_manager().run(
+                mcp, timeout=user_config.mcp_server_warmup_timeout
+            )
+        else:
+            get_warmup_manager().mark_ready()
+
+        # Discover deployment tool changes in the background (see
+        # app/core/tool_discovery.py)
+        if user_config.mcp_server_dynamic_tools_incremental:
+            get_tool_discovery().start(
+                interval=user_config.mcp_server_dynamic_tools_refresh_interval,
+                concurrency=user_config.mcp_server_dynamic_tools_refresh_concurrency,
+            )
+
         # Example post-start tasks:
         # - Register additional runtime handlers
         # - Start background tasks
@@ -81,6 +150,13 @@ class ServerLifecycle(BaseServerLifecycle):
         """
         self._logger.info("Executing pre-server shutdown user actions...")
 
+        # In-flight tool calls have been drained (or cut off at the deadline)
+        get_drain_manager().log_report()
+        await get_tool_discovery().stop()
+        await get_http_client_pool().aclose()
+        get_executor_manager().shutdown()
+        await get_loop_monitor().stop()
+
         # Example cleanup tasks:
         # - Close database connections
         # - Save application state
@@ -0,0 +1,116 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Listening socket management for the MCP server.
+
+The server binds its listening socket exactly once and hands it to uvicorn,
+instead of probing the port and letting uvicorn bind it again. The socket can
+also be inherited from a process manager: systemd socket activation
+(``LISTEN_FDS``/``LISTEN_PID``) or an explicit ``MCP_SERVER_SOCKET_FD``.
+"""
+
+import functools
+import logging
+import os
+import socket
+from typing import Any, Optional
+
+from fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+# First file descriptor passed by systemd socket activation (sd_listen_fds(3))
+SD_LISTEN_FDS_START = 3
+
+
+def bind_listening_socket(
+    host: str, port: int, backlog: int = 2048, reuse_port: bool = False
+) -> socket.socket:
+    """
+    Bind and listen on host:port, returning a socket child processes can inherit.
+
+    Args:
+        host: Address to bind to
+        port: Port to bind to
+        backlog: Maximum length of the pending connections queue
+        reuse_port: Set SO_REUSEPORT so another server process (e.g. the next
+            release during a rolling restart) can bind the same port
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            if not hasattr(socket, "SO_REUSEPORT"):
+                raise OSError("SO_REUSEPORT is not supported on this platform")
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+    except OSError:
+        sock.close()
+        raise
+    sock.set_inheritable(True)
+    return sock
+
+
+def get_inherited_socket(fd: Optional[int] = None) -> Optional[socket.socket]:
+    """
+    Return a listening socket inherited from the parent process, if any.
+
+    Args:
+        fd: Explicit file descriptor of an already listening socket. When None,
+            systemd socket activation variables are checked instead.
+    """
+    if fd is None:
+        listen_fds = os.environ.get("LISTEN_FDS")
+        listen_pid = os.environ.get("LISTEN_PID")
+        if not listen_fds or listen_pid != str(os.getpid()):
+            return None
+        if int(listen_fds) > 1:
+            logger.warning(
+                "Received %s sockets from systemd, only the first one is used",
+                listen_fds,
+            )
+        fd = SD_LISTEN_FDS_START
+        # Do not let worker processes believe the sockets were passed to them
+        for name in ("LISTEN_FDS", "LISTEN_PID", "LISTEN_FDNAMES"):
+            os.environ.pop(name, None)
+
+    sock = socket.socket(fileno=fd)
+    if sock.type != socket.SOCK_STREAM:
+        sock.detach()
+        raise OSError(f"Inherited file descriptor {fd} is not a stream socket")
+    sock.set_inheritable(True)
+    logger.info(
+        "Using inherited listening socket (fd %s) on %s", fd, sock.getsockname()
+    )
+    return sock
+
+
+def serve_on_sockets(mcp: FastMCP, sockets: list[socket.socket]) -> None:
+    """
+    Make the HTTP transport of ``mcp`` serve on pre-bound sockets.
+
+    ``DataRobotMCPServer.run()`` does not expose uvicorn's ``sockets`` argument,
+    so ``run_http_async`` is wrapped to inject it.
+    """
+    run_http_async = mcp.run_http_async
+
+    @functools.wraps(run_http_async)
+    async def patched(*args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("sockets", sockets)
+        await run_http_async(*args, **kwargs)
+
+    mcp.run_http_async = patched  # type: ignore[method-assign]
@@ -0,0 +1,319 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Startup profiling of the MCP server boot sequence.
+
+With ``MCP_SERVER_STARTUP_PROFILE`` enabled, every phase between the start of
+the process and the first served request is timed: interpreter startup, the
+top-level imports of ``app.main``, configuration and credential loading,
+tool/prompt/resource module imports (per ``additional_module_paths`` entry and
+native tool type), telemetry initialization, dynamic registration and the
+``ServerLifecycle`` start hooks.
+A JSON report is logged (and optionally written to a file) once the server has
+started and updated when the first request is served; a cProfile dump of the
+whole boot can be saved as well.
+"""
+
+import cProfile
+import functools
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, TypeVar
+
+from datarobot_genai.drmcp import BaseServerLifecycle
+from datarobot_genai.drmcp.core import dr_mcp_server
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+REPORT_VERSION = 1
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    start_seconds: float
+    duration_seconds: float
+
+
+def get_process_start_time() -> Optional[float]:
+    """
+    Return when this process started, on the ``time.monotonic()`` clock.
+
+    The start time is read from ``/proc``, so it includes interpreter startup.
+    Returns None where ``/proc`` is not available (macOS, Windows).
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the command name, which may contain spaces; the
+            # 22nd field (starttime, in clock ticks since boot) is at index 19
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        start_ticks = int(fields[19])
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+    return time.monotonic() - (uptime - start_ticks / clock_ticks)
+
+
+class StartupProfiler:
+    """
+    Record the duration of named startup phases.
+
+    Phases are always cheap to record; the report, the cProfile dump and the
+    instrumentation of the server internals only happen once ``enable()`` has
+    been called.
+    """
+
+    def __init__(
+        self, worker_id: Optional[int] = None, started: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            worker_id: Index of the worker process in multi-worker mode, None otherwise
+            started: ``time.monotonic()`` timestamp all offsets are measured from,
+                defaults to now
+        """
+        self._worker_id = worker_id
+        self._started = time.monotonic() if started is None else started
+        self._phases: list[StartupPhase] = []
+        self._enabled = False
+        self._report_path: Optional[str] = None
+        self._cprofile_path: Optional[str] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._startup_seconds: Optional[float] = None
+        self._first_request_seconds: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def phases(self) -> list[StartupPhase]:
+        return list(self._phases)
+
+    def enable(
+        self, report_path: Optional[str] = None, cprofile_path: Optional[str] = None
+    ) -> None:
+        """
+        Turn on reporting.
+
+        Args:
+            report_path: File the JSON report is written to, in addition to the log
+            cprofile_path: File a cProfile dump (pstats format) of the boot is saved to
+        """
+        self._enabled = True
+        self._report_path = self._per_worker_path(report_path)
+        self._cprofile_path = self._per_worker_path(cprofile_path)
+        if self._cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def _per_worker_path(self, path: Optional[str]) -> Optional[str]:
+        if not path or self._worker_id is None:
+            return path
+        root, ext = os.path.splitext(path)
+        return f"{root}.worker{self._worker_id}{ext}"
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Record phase ``name`` from ``time.monotonic()`` timestamps."""
+        self._phases.append(
+            StartupPhase(
+                name=name,
+                start_seconds=round(start - self._started, 6),
+                duration_seconds=round(end - start, 6),
+            )
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``."""
+        start = self._elapsed()
+        try:
+            yield
+        finally:
+            self._phases.append(
+                StartupPhase(
+                    name=name,
+                    start_seconds=round(start, 6),
+                    duration_seconds=round(self._elapsed() - start, 6),
+                )
+            )
+
+    def wrap(self, name: str, func: Callable[..., T]) -> Callable[..., T]:
+        """Return ``func`` timed as phase ``name`` on every call."""
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def wrap_async(
+        self, name: str, func: Callable[..., Awaitable[T]]
+    ) -> Callable[..., Awaitable[T]]:
+        """Return the coroutine function ``func`` timed as phase ``name``."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with self.phase(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    def instrument_server(self) -> None:
+        """
+        Time the phases run inside ``DataRobotMCPServer``.
+
+        ``DataRobotMCPServer`` does not expose hooks around its initialization,
+        so the functions it calls are wrapped in its module namespace.
+        """
+        import_modules = dr_mcp_server._import_modules_from_dir
+
+        @functools.wraps(import_modules)
+        def timed_import_modules(
+            directory: str, package_prefix: str, *args: Any, **kwargs: Any
+        ) -> None:
+            with self.phase(f"import_modules:{package_prefix}"):
+                import_modules(directory, package_prefix, *args, **kwargs)
+
+        dr_mcp_server._import_modules_from_dir = timed_import_modules
+        for attr, name in (
+            ("get_credentials", "get_credentials"),
+            ("initialize_telemetry", "initialize_telemetry"),
+            ("initialize_oauth_middleware", "initialize_oauth_middleware"),
+            ("register_routes", "register_routes"),
+        ):
+            setattr(dr_mcp_server, attr, self.wrap(name, getattr(dr_mcp_server, attr)))
+        for attr, name in (
+            ("register_tools_of_datarobot_deployments", "register_dynamic_tools"),
+            (
+                "register_prompts_from_datarobot_prompt_management",
+                "register_dynamic_prompts",
+            ),
+        ):
+            setattr(
+                dr_mcp_server, attr, self.wrap_async(name, getattr(dr_mcp_server, attr))
+            )
+
+    def instrument_lifecycle(self, lifecycle: BaseServerLifecycle) -> None:
+        """Time the lifecycle start hooks; the report is emitted after post start."""
+        pre_server_start = lifecycle.pre_server_start
+        post_server_start = lifecycle.post_server_start
+
+        async def timed_pre_server_start(mcp: FastMCP) -> None:
+            with self.phase("pre_server_start"):
+                await pre_server_start(mcp)
+
+        async def timed_post_server_start(mcp: FastMCP) -> None:
+            with self.phase("post_server_start"):
+                await post_server_start(mcp)
+            self.finish()
+
+        lifecycle.pre_server_start = timed_pre_server_start  # type: ignore[method-assign]
+        lifecycle.post_server_start = timed_post_server_start  # type: ignore[method-assign]
+
+    def finish(self) -> None:
+        """Mark the end of startup and emit the report."""
+        if self._startup_seconds is not None:
+            return
+        self._startup_seconds = round(self._elapsed(), 6)
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            if self._cprofile_path:
+                try:
+                    self._cprofile.dump_stats(self._cprofile_path)
+                except OSError as e:
+                    logger.warning(
+                        "Could not save the startup cProfile dump to %s: %s",
+                        self._cprofile_path,
+                        e,
+                    )
+                else:
+                    logger.info(
+                        "Startup cProfile dump saved to %s", self._cprofile_path
+                    )
+        self._emit()
+
+    def mark_first_request(self) -> None:
+        """Record when the first request was served and emit the report again."""
+        if self._first_request_seconds is not None:
+            return
+        self._first_request_seconds = round(self._elapsed(), 6)
+        if self._startup_seconds is not None:
+            self._emit()
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "version": REPORT_VERSION,
+            "pid": os.getpid(),
+            "worker_id": self._worker_id,
+            "startup_seconds": self._startup_seconds,
+            "first_request_seconds": self._first_request_seconds,
+            "phases": [
+                asdict(phase)
+                for phase in sorted(self._phases, key=lambda p: p.start_seconds)
+            ],
+        }
+
+    def _emit(self) -> None:
+        if not self._enabled:
+            return
+        report = self.report()
+        logger.info("Startup profile: %s", json.dumps(report))
+        if self._report_path:
+            try:
+                with open(self._report_path, "w") as f:
+                    json.dump(report, f, indent=2)
+            except OSError as e:
+                # The report is a diagnostic, never fail the server for it
+                logger.warning(
+                    "Could not write the startup profile report to %s: %s",
+                    self._report_path,
+                    e,
+                )
+
+
+class FirstRequestMiddleware(Middleware):
+    """Report the time to the first MCP request served."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler = profiler
+
+    async def on_message(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        result = await call_next(context)
+        # The server also lists its components while starting, outside of any
+        # client request: only count messages received from a client session
+        fastmcp_context = context.fastmcp_context
+        if fastmcp_context is not None and fastmcp_context.request_context is not None:
+            self._profiler.mark_first_request()
+        return result
@@ -0,0 +1,220 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streamed results for tools with large outputs.
+
+Tools building a large CSV or JSON payload can yield it in chunks from an async
+generator instead of returning it at once, with the ``streaming_tool``
+decorator applied under ``dr_mcp_tool``::
+
+    @dr_mcp_tool(tags={"user"})
+    @streaming_tool()
+    async def export_rows(limit: int) -> AsyncIterator[str]:
+        yield "id,value\\n"
+        async for row in fetch_rows(limit):
+            yield f"{row.id},{row.value}\\n"
+
+When the client asks for progress (``progress_callback`` of
+``ClientSession.call_tool``), the chunks, coalesced or split to
+``MCP_SERVER_TOOL_STREAM_CHUNK_SIZE`` characters, are sent as the messages of
+MCP progress notifications while the tool is running, and the final
+``ToolResult`` only reports how many chunks were sent. The generator runs ahead
+of the notifications by at most ``MCP_SERVER_TOOL_STREAM_BUFFER_CHUNKS``
+chunks, so the memory held per call does not depend on the size of the output.
+
+Other clients get the output in the ``ToolResult``, truncated after
+``MCP_SERVER_TOOL_STREAM_MAX_INLINE_SIZE`` characters.
+"""
+
+import asyncio
+import codecs
+import functools
+import inspect
+import logging
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Union
+
+from fastmcp import Context
+from fastmcp.server.dependencies import get_context
+from fastmcp.tools.tool import ToolResult
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+Chunk = Union[str, bytes]
+
+_END = object()
+
+
+@dataclass
+class StreamSummary:
+    """Outcome of a streamed tool call."""
+
+    streamed: bool
+    chunks: int = 0
+    size: int = 0
+    truncated: bool = False
+
+
+def _progress_context() -> Optional[Context]:
+    """Return the request context if the client asked for progress notifications."""
+    try:
+        context = get_context()
+    except RuntimeError:
+        return None
+    request_context = context.request_context
+    if request_context is None or request_context.meta is None:
+        return None
+    if request_context.meta.progressToken is None:
+        return None
+    return context
+
+
+async def _rechunk(chunks: AsyncIterator[Chunk], size: int) -> AsyncIterator[str]:
+    """Coalesce small chunks and split large ones into chunks of ``size``."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer: list[str] = []
+    buffered = 0
+    async for chunk in chunks:
+        # Multi-byte characters may be split across bytes chunks
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        while text:
+            piece = text[: size - buffered]
+            text = text[len(piece) :]
+            buffer.append(piece)
+            buffered += len(piece)
+            if buffered == size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+    buffer.append(decoder.decode(b"", final=True))
+    if buffered or buffer[-1]:
+        yield "".join(buffer)
+
+
+async def _aclose(*iterators: AsyncIterator[Any]) -> None:
+    for iterator in iterators:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _produce(
+    chunks: AsyncIterator[Chunk], queue: "asyncio.Queue[Any]", size: int
+) -> None:
+    pieces = _rechunk(chunks, size)
+    try:
+        async for piece in pieces:
+            await queue.put(piece)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(_END)
+    finally:
+        await _aclose(pieces, chunks)
+
+
+async def stream_result(
+    chunks: AsyncIterator[Chunk], config: Optional[UserAppConfig] = None
+) -> ToolResult:
+    """Send ``chunks`` as progress notifications, or inline them in the result."""
+    config = config or get_user_config()
+    chunk_size = config.mcp_server_tool_stream_chunk_size
+    context = _progress_context()
+    if context is None:
+        return await _inline_result(
+            chunks, chunk_size, config.mcp_server_tool_stream_max_inline_size
+        )
+
+    summary = StreamSummary(streamed=True)
+    queue: asyncio.Queue[Any] = asyncio.Queue(
+        maxsize=config.mcp_server_tool_stream_buffer_chunks
+    )
+    producer = asyncio.create_task(_produce(chunks, queue, chunk_size))
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            summary.chunks += 1
+            summary.size += len(item)
+            await context.report_progress(summary.chunks, message=item)
+    finally:
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+    return ToolResult(
+        content=(
+            f"Streamed {summary.size} characters in {summary.chunks} chunks "
+            "as progress notifications"
+        ),
+        structured_content=asdict(summary),
+    )
+
+
+async def _inline_result(
+    chunks: AsyncIterator[Chunk], chunk_size: int, max_size: int
+) -> ToolResult:
+    summary = StreamSummary(streamed=False)
+    pieces: list[str] = []
+    rechunked = _rechunk(chunks, chunk_size)
+    try:
+        async for piece in rechunked:
+            remaining = max_size - summary.size
+            if len(piece) > remaining:
+                piece = piece[:remaining]
+                summary.truncated = True
+            pieces.append(piece)
+            summary.chunks += 1
+            summary.size += len(piece)
+            if summary.truncated:
+                logger.warning(
+                    "Streamed tool output truncated to %s characters, "
+                    "the client did not ask for progress notifications",
+                    max_size,
+                )
+                break
+    finally:
+        await _aclose(rechunked, chunks)
+    return ToolResult(content="".join(pieces), structured_content=asdict(summary))
+
+
+def streaming_tool() -> Callable[
+    [Callable[..., AsyncIterator[Chunk]]], Callable[..., Any]
+]:
+    """Turn an async generator of ``str`` (or UTF-8 ``bytes``) chunks into a tool."""
+
+    def decorator(func: Callable[..., AsyncIterator[Chunk]]) -> Callable[..., Any]:
+        if not inspect.isasyncgenfunction(func):
+            raise TypeError(
+                f"streaming_tool requires an async generator function, got {func!r}"
+            )
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> ToolResult:
+            return await stream_result(func(*args, **kwargs))
+
+        # The tool returns a ToolResult, not the generator
+        wrapper.__signature__ = inspect.signature(func).replace(  # type: ignore[attr-defined]
+            return_annotation=ToolResult
+        )
+        wrapper.__annotations__ = {**func.__annotations__, "return": ToolResult}
+        return wrapper
+
+    return decorator
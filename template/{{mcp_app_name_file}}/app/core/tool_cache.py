@@ -0,0 +1,324 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Response cache for user tools.
+
+Tools opt in with the ``cached_tool`` decorator, applied under ``dr_mcp_tool``::
+
+    @dr_mcp_tool(tags={"user"})
+    @cached_tool(ttl=60)
+    async def my_tool(query: str) -> ToolResult:
+        ...
+
+Results are memoized by tool name, caller and canonicalized arguments
+(injected ``Depends`` and ``Context`` parameters are not part of the key) in a
+process wide LRU bounded by ``MCP_SERVER_TOOL_CACHE_MAX_ENTRIES`` and
+``MCP_SERVER_TOOL_CACHE_MAX_BYTES``. Concurrent calls with the same arguments
+share a single execution. Errors, including ``ToolResult(is_error=True)``, are
+never cached. Hits, misses and evictions are tracked per tool in ``stats()``
+and exported as OpenTelemetry counters.
+
+The caller is a hash of the DataRobot token of the request, so a result
+computed with one user's credentials is never returned to another user. Tools
+whose results do not depend on the caller can share them with
+``cached_tool(shared=True)``.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, TypeVar
+
+import pydantic_core
+from datarobot_genai.drtools.core.auth import resolve_datarobot_token
+from fastmcp import Context
+from fastmcp.dependencies import Dependency
+from fastmcp.tools.tool import ToolResult
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass
+class ToolCacheStats:
+    """Cache usage of one tool."""
+
+    hits: int = 0
+    misses: int = 0
+    # Calls that joined an identical call already in progress
+    shared: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class ToolResultCache:
+    """LRU of tool results with per-entry TTL and a global byte bound."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        config = config or get_user_config()
+        self.enabled = config.mcp_server_tool_cache_enabled
+        self.max_entries = config.mcp_server_tool_cache_max_entries
+        self.max_bytes = config.mcp_server_tool_cache_max_bytes
+        self.default_ttl = config.mcp_server_tool_cache_default_ttl
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._in_flight: dict[tuple[str, str], asyncio.Future[Any]] = {}
+        self._stats: dict[str, ToolCacheStats] = {}
+        self._bytes = 0
+        self._gauges_registered = False
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_call(
+        self,
+        tool: str,
+        key: str,
+        ttl: float,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached result of ``call``, running it at most once at a time."""
+        self._register_gauges()
+        stats = self._stats.setdefault(tool, ToolCacheStats())
+        cache_key = (tool, key)
+        entry = self._lookup(cache_key)
+        if entry is not None:
+            stats.hits += 1
+            return entry.value
+
+        pending = self._in_flight.get(cache_key)
+        if pending is not None:
+            stats.shared += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The call we joined was cancelled, run our own
+
+        stats.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            value = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Joined calls re-raise it, don't log it as never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if not (isinstance(value, ToolResult) and value.is_error):
+                self._store(cache_key, value, ttl)
+            return value
+        finally:
+            self._in_flight.pop(cache_key, None)
+
+    def clear(self, tool: Optional[str] = None) -> None:
+        """Drop the cached results of ``tool``, or of every tool."""
+        for cache_key in list(self._entries):
+            if tool is None or cache_key[0] == tool:
+                self._bytes -= self._entries.pop(cache_key).size
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the per-tool cache usage."""
+        return {tool: asdict(s) for tool, s in self._stats.items()}
+
+    def _lookup(self, cache_key: tuple[str, str]) -> Optional[_Entry]:
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._bytes -= self._entries.pop(cache_key).size
+            return None
+        self._entries.move_to_end(cache_key)
+        return entry
+
+    def _store(self, cache_key: tuple[str, str], value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        size = _result_size(value)
+        if size > self.max_bytes:
+            logger.debug(
+                "Result of %s (%s bytes) exceeds the cache size, not cached",
+                cache_key[0],
+                size,
+            )
+            return
+        previous = self._entries.pop(cache_key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[cache_key] = _Entry(value, size, time.monotonic() + ttl)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            (tool, _), evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._stats.setdefault(tool, ToolCacheStats()).evictions += 1
+
+    def _observe(self, field: str) -> Iterable[Observation]:
+        return [
+            Observation(getattr(stats, field), {"mcp.tool.name": tool})
+            for tool, stats in self._stats.items()
+        ]
+
+    def _register_gauges(self) -> None:
+        if self._gauges_registered:
+            return
+        self._gauges_registered = True
+        meter = metrics.get_meter(__name__)
+        meter.create_observable_counter(
+            "mcp.tool_cache.hits",
+            callbacks=[lambda _: self._observe("hits")],
+            description="Tool calls answered from the response cache, per tool",
+        )
+        meter.create_observable_counter(
+            "mcp.tool_cache.misses",
+            callbacks=[lambda _: self._observe("misses")],
+            description="Tool calls executed on a response cache miss, per tool",
+        )
+        meter.create_observable_counter(
+            "mcp.tool_cache.shared",
+            callbacks=[lambda _: self._observe("shared")],
+            description="Tool calls that joined an identical call in progress",
+        )
+        meter.create_observable_counter(
+            "mcp.tool_cache.evictions",
+            callbacks=[lambda _: self._observe("evictions")],
+            description="Cached tool results evicted to respect the size bounds",
+        )
+        meter.create_observable_gauge(
+            "mcp.tool_cache.bytes",
+            callbacks=[lambda _: [Observation(self._bytes)]],
+            description="Estimated size of the cached tool results",
+        )
+
+
+def _result_size(value: Any) -> int:
+    return len(pydantic_core.to_json(value, fallback=str))
+
+
+def _key_parameters(func: Callable[..., Any]) -> list[str]:
+    """Names of the parameters identifying a call, without the injected ones."""
+    names = []
+    for name, param in inspect.signature(func).parameters.items():
+        if isinstance(param.default, Dependency):
+            continue
+        annotation = param.annotation
+        if inspect.isclass(annotation) and issubclass(annotation, Context):
+            continue
+        names.append(name)
+    return names
+
+
+def _caller() -> str:
+    """Hash of the DataRobot token of the request, empty without one."""
+    token = resolve_datarobot_token()
+    return hashlib.sha256(token.encode()).hexdigest()[:32] if token else ""
+
+
+def cache_key(
+    func: Callable[..., Any],
+    key_parameters: list[str],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    caller: str = "",
+) -> str:
+    """
+    Canonical key of a call by ``caller``: its arguments, defaults applied, as
+    sorted JSON.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {
+        name: pydantic_core.to_jsonable_python(bound.arguments[name], fallback=str)
+        for name in key_parameters
+        if name in bound.arguments
+    }
+    canonical = json.dumps([caller, arguments], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def cached_tool(
+    ttl: Optional[float] = None, name: Optional[str] = None, shared: bool = False
+) -> Callable[[F], F]:
+    """
+    Memoize the results of an async tool.
+
+    Args:
+        ttl: seconds a result is kept, defaults to MCP_SERVER_TOOL_CACHE_DEFAULT_TTL
+        name: cache namespace and metrics label, defaults to the function name
+        shared: share results between callers, only for tools that do not use
+            the caller's credentials
+    """
+
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"cached_tool requires an async function, got {func!r}")
+        tool = name or func.__name__
+        key_parameters = _key_parameters(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = get_tool_cache()
+            if not cache.enabled:
+                return await func(*args, **kwargs)
+            return await cache.get_or_call(
+                tool,
+                cache_key(
+                    func, key_parameters, args, kwargs, "" if shared else _caller()
+                ),
+                cache.default_ttl if ttl is None else ttl,
+                lambda: func(*args, **kwargs),
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# Global tool result cache
+_tool_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_cache() -> ToolResultCache:
+    """Get the global tool result cache."""
+    global _tool_cache
+    if _tool_cache is None:
+        _tool_cache = ToolResultCache()
+    return _tool_cache
@@ -0,0 +1,321 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cached tool catalog.
+
+Building the ``tools/list`` response walks every provider and transform and
+dereferences the JSON schema of every tool, which takes tens of milliseconds
+with dozens of dynamic deployment tools. ``ToolCatalogMiddleware`` keeps the
+listed tools until the registry changes: a tool is added, replaced or removed
+(``PUT``/``DELETE /registeredDeployments/{id}``, lazy tool loading), a provider
+is mounted or a visibility transform is added. Checking the registry only
+compares object identities. The dereferenced schema and serialized form of each
+tool are kept too, so a rebuild after registering one tool only processes that
+tool instead of the whole catalog.
+
+Each snapshot of the catalog has an ETag, the hash of its serialized form. The
+``/tools`` route serves the serialized catalog with that ETag, so clients and
+proxies revalidate with ``If-None-Match`` and get ``304 Not Modified`` while
+the catalog is unchanged. When the ETag of a rebuilt catalog differs from the
+previous one, a ``notifications/tools/list_changed`` is sent to the client of
+the request that noticed the change. Re-registering a tool with the same
+definition changes nothing and sends nothing.
+
+The ``x-datarobot-mcp-mode`` and ``x-datarobot-mcp-tools`` headers of a request
+select what the catalog transform of ``datarobot-genai`` lists: the code mode
+tools, or the tools of an allowlist. The catalog has one snapshot per such
+view, the least recently used of ``MAX_VIEWS`` are evicted, and ``/tools``
+serves the view of its own request headers. Otherwise the cache assumes every
+client sees the same tools: it is bypassed while tools with an ``auth`` check
+are registered.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Optional
+
+from datarobot_genai.drmcp.core.routes_utils import prefix_mount_path
+from datarobot_genai.drmcpbase.fastmcp_transforms.utils import (
+    MCPRequestContext,
+    get_request_context,
+)
+from fastmcp import Context, FastMCP
+from fastmcp.server.middleware import CallNext, MiddlewareContext
+from fastmcp.server.middleware.dereference import DereferenceRefsMiddleware
+from fastmcp.tools import Tool
+from fastmcp.utilities.json_schema import dereference_refs
+from fastmcp.utilities.versions import dedupe_with_versions
+from mcp.types import ServerNotification, ToolListChangedNotification
+from opentelemetry import metrics
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+# Views of the catalog kept, by request mode and tool allowlist
+MAX_VIEWS = 32
+
+_meter = metrics.get_meter(__name__)
+_rebuilds_counter = _meter.create_counter(
+    "mcp.tool_catalog.rebuilds",
+    description="Rebuilds of the tools/list response after a registry change",
+)
+_changes_counter = _meter.create_counter(
+    "mcp.tool_catalog.changes",
+    description="Rebuilds of the tools/list response that changed the catalog",
+)
+
+
+@dataclass
+class CatalogSnapshot:
+    """Listed tools and their serialized form, for one state of the registry."""
+
+    registry: tuple[Any, ...]
+    tools: Sequence[Tool]
+    body: bytes
+    etag: str
+
+
+def _serialize(tool: Tool) -> bytes:
+    return (
+        tool.to_mcp_tool(name=tool.name)
+        .model_dump_json(by_alias=True, exclude_none=True)
+        .encode()
+    )
+
+
+def _snapshot(
+    tools: Sequence[Tool],
+    registry: tuple[Any, ...] = (),
+    serialize: Callable[[Tool], bytes] = _serialize,
+) -> CatalogSnapshot:
+    """Serialize ``tools`` as a ``tools/list`` result and hash it."""
+    fragments = [
+        serialize(tool) for tool in dedupe_with_versions(list(tools), lambda t: t.name)
+    ]
+    body = b'{"tools":[' + b",".join(fragments) + b"]}"
+    etag = hashlib.sha256(body).hexdigest()[:32]
+    return CatalogSnapshot(registry=registry, tools=tools, body=body, etag=etag)
+
+
+def _has_ref(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        return "$ref" in schema or any(_has_ref(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(_has_ref(item) for item in schema)
+    return False
+
+
+def _dereferenced(tool: Tool) -> Tool:
+    """Copy of ``tool`` with its schemas inlined, as DereferenceRefsMiddleware does."""
+    updates: dict[str, Any] = {}
+    for field in ("parameters", "output_schema"):
+        schema = getattr(tool, field)
+        if schema is not None and ("$defs" in schema or _has_ref(schema)):
+            updates[field] = dereference_refs(schema)
+    return tool.model_copy(update=updates) if updates else tool
+
+
+@dataclass
+class _Entry:
+    """A listed tool, kept so its id is not reused, and its processed forms."""
+
+    tool: Tool
+    listed: Tool
+    serialized: Optional[bytes] = None
+
+
+async def _registry_state(server: FastMCP) -> Optional[tuple[Any, ...]]:
+    """Objects the catalog is built from, or None if it cannot be cached."""
+    tools = await server.local_provider.list_tools()
+    if any(tool.auth is not None for tool in tools):
+        return None
+    return (*tools, *server.providers, *server.transforms)
+
+
+def _same(a: tuple[Any, ...], b: tuple[Any, ...]) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+async def _notify_list_changed(context: Optional[Context]) -> None:
+    """Send ``notifications/tools/list_changed`` on the current request stream."""
+    if context is None or context.request_context is None:
+        return
+    try:
+        # Related to the request so it reaches stateless HTTP clients too
+        await context.session.send_notification(
+            ServerNotification(ToolListChangedNotification()),
+            related_request_id=context.request_id,
+        )
+    except Exception:
+        logger.debug("Could not send tools/list_changed", exc_info=True)
+
+
+class ToolCatalogMiddleware(DereferenceRefsMiddleware):
+    """
+    Serve ``tools/list`` from a snapshot rebuilt on registry changes.
+
+    It replaces fastmcp's ``DereferenceRefsMiddleware`` and keeps the
+    dereferenced schema and the serialized form of each tool, so a rebuild
+    after registering one tool only processes that tool.
+    """
+
+    def __init__(self, dereference: bool = True) -> None:
+        self._dereference = dereference
+        self._snapshots: OrderedDict[MCPRequestContext, CatalogSnapshot] = OrderedDict()
+        self._entries: dict[MCPRequestContext, dict[int, _Entry]] = {}
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._rebuilds = 0
+        self._changes = 0
+
+    async def on_list_tools(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        if context.fastmcp_context is None:
+            return await self._list(context, call_next)
+        registry = await _registry_state(context.fastmcp_context.fastmcp)
+        if registry is None:
+            return await self._list(context, call_next)
+        view = get_request_context()
+        snapshot = self._snapshots.get(view)
+        if snapshot is not None and _same(snapshot.registry, registry):
+            self._snapshots.move_to_end(view)
+            self._hits += 1
+            return snapshot.tools
+
+        async with self._lock:
+            previous = self._snapshots.get(view)
+            if previous is not None and _same(previous.registry, registry):
+                return previous.tools
+            snapshot = self._rebuild(view, await call_next(context), registry)
+            self._snapshots[view] = snapshot
+            self._snapshots.move_to_end(view)
+            while len(self._snapshots) > MAX_VIEWS:
+                evicted, _ = self._snapshots.popitem(last=False)
+                del self._entries[evicted]
+            self._rebuilds += 1
+            _rebuilds_counter.add(1)
+        if previous is not None and previous.etag != snapshot.etag:
+            self._changes += 1
+            _changes_counter.add(1)
+            logger.info("Tool catalog changed, ETag %s", snapshot.etag)
+            await _notify_list_changed(context.fastmcp_context)
+        return snapshot.tools
+
+    async def _list(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Sequence[Tool]:
+        if self._dereference:
+            return list(await super().on_list_tools(context, call_next))
+        return list(await call_next(context))
+
+    def _rebuild(
+        self, view: MCPRequestContext, tools: Sequence[Tool], registry: tuple[Any, ...]
+    ) -> CatalogSnapshot:
+        # Views share the processed forms of the tools they have in common
+        known: dict[int, _Entry] = {}
+        for view_entries in self._entries.values():
+            known.update(view_entries)
+        entries: dict[int, _Entry] = {}
+        for tool in tools:
+            entry = known.get(id(tool))
+            if entry is None or entry.tool is not tool:
+                entry = _Entry(
+                    tool=tool,
+                    listed=_dereferenced(tool) if self._dereference else tool,
+                )
+            entries[id(tool)] = entry
+        self._entries[view] = entries
+        by_listed = {id(entry.listed): entry for entry in entries.values()}
+
+        def serialize(tool: Tool) -> bytes:
+            entry = by_listed[id(tool)]
+            if entry.serialized is None:
+                entry.serialized = _serialize(tool)
+            return entry.serialized
+
+        listed = [entries[id(tool)].listed for tool in tools]
+        return _snapshot(listed, registry, serialize)
+
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        # Tell the caller about registry changes without waiting for a tools/list
+        snapshot = self._snapshots.get(get_request_context())
+        if snapshot is not None and context.fastmcp_context is not None:
+            server = context.fastmcp_context.fastmcp
+            registry = await _registry_state(server)
+            if registry is not None and not _same(snapshot.registry, registry):
+                await server.list_tools()
+        return await call_next(context)
+
+    async def snapshot(self, server: FastMCP) -> CatalogSnapshot:
+        """
+        Return the snapshot of the current catalog, rebuilding it if needed.
+
+        Call it while handling a request: the view is the one of its headers.
+        """
+        tools = await server.list_tools()
+        snapshot = self._snapshots.get(get_request_context())
+        if snapshot is not None and snapshot.tools is tools:
+            return snapshot
+        # Not cacheable, serialize what was listed
+        return _snapshot(tools)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self._hits,
+            "rebuilds": self._rebuilds,
+            "changes": self._changes,
+            "views": len(self._snapshots),
+        }
+
+
+def register_tool_catalog(
+    mcp: FastMCP, config: Optional[UserAppConfig] = None
+) -> Optional[ToolCatalogMiddleware]:
+    """Cache ``tools/list`` and serve the catalog on ``/tools``, unless disabled."""
+    config = config or get_user_config()
+    if not config.mcp_server_tool_list_cache_enabled:
+        return None
+    # Takes the place of the schema dereferencing middleware, the outermost one
+    dereference = [
+        i for i, m in enumerate(mcp.middleware) if type(m) is DereferenceRefsMiddleware
+    ]
+    catalog = ToolCatalogMiddleware(dereference=bool(dereference))
+    if dereference:
+        mcp.middleware[dereference[0]] = catalog
+    else:
+        mcp.middleware.insert(0, catalog)
+
+    @mcp.custom_route(prefix_mount_path("/tools"), methods=["GET"])
+    async def tools(request: Request) -> Response:
+        snapshot = await catalog.snapshot(mcp)
+        etag = f'"{snapshot.etag}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return Response(snapshot.body, media_type="application/json", headers=headers)
+
+    return catalog
@@ -0,0 +1,540 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental discovery of deployment tools.
+
+``MCP_SERVER_REGISTER_DYNAMIC_TOOLS_ON_STARTUP`` walks every deployment tagged
+``tool`` and fetches its metadata one deployment at a time before the server
+serves traffic. With ``MCP_SERVER_DYNAMIC_TOOLS_INCREMENTAL`` the startup scan
+is replaced by:
+
+1. ``restore``, from ``pre_server_start``: the tools of the on-disk registry
+   (``MCP_SERVER_DYNAMIC_TOOLS_SNAPSHOT_PATH``, see app/core/tool_registry.py)
+   are registered without calling DataRobot, as placeholders exposing the
+   stored definition. Like lazy tools (app/core/lazy_tools.py), the real tool
+   is only built from the stored configuration by the first call.
+2. ``start``, from ``post_server_start``: a background task lists the tool
+   deployments and fetches their metadata, at most
+   ``MCP_SERVER_DYNAMIC_TOOLS_REFRESH_CONCURRENCY`` at a time, every
+   ``MCP_SERVER_DYNAMIC_TOOLS_REFRESH_INTERVAL`` seconds. Only the changes are
+   applied: new and modified deployments are registered, deployments that lost
+   their tag are unregistered, and the registry is updated.
+3. ``DynamicToolRevalidationMiddleware``: the first call of a tool confirmed
+   more than ``MCP_SERVER_DYNAMIC_TOOLS_MAX_AGE`` seconds ago revalidates its
+   deployment in the background, without delaying the call. Like the refresh,
+   it runs with the app credentials, not the caller's.
+
+Deployments registered with ``PUT /registeredDeployments/{id}`` are recorded in
+the registry as well, so they are restored after a restart. They are never
+unregistered by a refresh, only by ``DELETE /registeredDeployments/{id}`` or
+when their deployment no longer exists.
+
+The tools are registered through the proxy engine (app/core/deployment_proxy.py)
+unless ``MCP_SERVER_DEPLOYMENT_PROXY_ENABLED`` is false. A deployment whose
+metadata cannot be fetched keeps its current tool, and a tool is only
+unregistered when its deployment is not found with the app credentials. The
+registry holds the tool configurations without the ``Authorization`` header,
+which is rebuilt from the app credentials on restore: a restored tool is shared
+by every caller.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from typing import Any, Optional
+
+import datarobot as dr
+from datarobot.errors import ClientError
+from datarobot_genai.drmcp.core.dynamic_tools.deployment.config import (
+    create_deployment_tool_config,
+)
+from datarobot_genai.drmcp.core.dynamic_tools.deployment.register import (
+    get_datarobot_tool_deployments,
+)
+from datarobot_genai.drmcp.core.mcp_instance import mcp
+from datarobot_genai.drmcp.core.routes_utils import prefix_mount_path
+from datarobot_genai.drmcpbase.dynamic_tools.external_tool import (
+    ExternalToolRegistrationConfig,
+)
+from datarobot_genai.drtools.core.auth import resolve_datarobot_token
+from datarobot_genai.drtools.core.clients.datarobot import request_user_dr_sdk
+from datarobot_genai.drtools.core.credentials import get_credentials
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools import Tool, ToolResult
+from mcp.types import ToolAnnotations
+from pydantic import ConfigDict, Field
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app.core.deployment_proxy import register_deployment_tool
+from app.core.executors import get_executor_manager
+from app.core.tool_registry import EntrySource, RegistryEntry, ToolRegistryStore
+from app.core.user_config import get_user_config
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_FILE_NAME = "mcp_dynamic_tools.sqlite3"
+
+# Rebuilt from the current credentials, never written to the registry
+_AUTHORIZATION_HEADER = "authorization"
+
+
+@dataclass
+class DiscoveryStats:
+    """Counters of the deployment tool discovery."""
+
+    restored: int = 0
+    refreshes: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    failed: int = 0
+    revalidations: int = 0
+    last_refresh_seconds: Optional[float] = None
+
+
+def get_default_snapshot_path() -> str:
+    return os.path.join(tempfile.gettempdir(), REGISTRY_FILE_NAME)
+
+
+def _stored_config(config: ExternalToolRegistrationConfig) -> dict[str, Any]:
+    """JSON form of ``config`` without credentials, compared to detect changes."""
+    stored = config.model_dump(mode="json")
+    stored["headers"] = {
+        name: value
+        for name, value in (config.headers or {}).items()
+        if name.lower() != _AUTHORIZATION_HEADER
+    }
+    stored["tags"] = sorted(config.tags or ())
+    return stored
+
+
+def _restored_config(
+    stored: dict[str, Any], token: str
+) -> ExternalToolRegistrationConfig:
+    config = ExternalToolRegistrationConfig.model_validate(stored)
+    config.headers = {**(config.headers or {}), "Authorization": f"Bearer {token}"}
+    return config
+
+
+def _tool_definition(tool: Tool) -> dict[str, Any]:
+    """What ``tools/list`` shows of ``tool``, to register a placeholder."""
+    return {
+        "name": tool.name,
+        "title": tool.title,
+        "description": tool.description,
+        "parameters": tool.parameters,
+        "output_schema": tool.output_schema,
+        "annotations": (
+            tool.annotations.model_dump(mode="json", exclude_none=True)
+            if tool.annotations
+            else None
+        ),
+        "tags": sorted(tool.tags),
+        "meta": tool.meta,
+    }
+
+
+def _fetch_tool_config(deployment_id: str) -> ExternalToolRegistrationConfig:
+    """Fetch the deployment and its tool metadata, blocking."""
+    with request_user_dr_sdk(headers_auth_only=False):
+        deployment = dr.Deployment.get(deployment_id)
+    return create_deployment_tool_config(deployment)
+
+
+def _is_not_found(error: Exception) -> bool:
+    return isinstance(error, ClientError) and error.status_code == HTTPStatus.NOT_FOUND
+
+
+class DeploymentToolDiscovery:
+    """Keep the deployment tools in sync with DataRobot, applying only changes."""
+
+    def __init__(self) -> None:
+        self._store: Optional[ToolRegistryStore] = None
+        # Registry entries of the registered deployment tools, by deployment id
+        self._known: dict[str, RegistryEntry] = {}
+        # Deployment ids by tool name, to revalidate on use
+        self._tool_names: dict[str, str] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+        self._revalidations: dict[str, asyncio.Task[None]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._stats = DiscoveryStats()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def store(self) -> ToolRegistryStore:
+        if self._store is None:
+            raise RuntimeError("The deployment tool registry is not open")
+        return self._store
+
+    def open(self, path: str) -> None:
+        """Use the registry at ``path``."""
+        self._store = ToolRegistryStore(path)
+
+    async def restore(self) -> None:
+        """Register a placeholder for every tool of the registry."""
+        started = time.perf_counter()
+        for deployment_id, entry in self.store.load().items():
+            definition = entry.tool
+            try:
+                placeholder = DeploymentToolPlaceholder(
+                    **{
+                        **definition,
+                        "annotations": (
+                            ToolAnnotations(**definition["annotations"])
+                            if definition["annotations"]
+                            else None
+                        ),
+                        "tags": set(definition["tags"]),
+                    },
+                    deployment_id=deployment_id,
+                    discovery=self,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Could not restore the tool of deployment %s: %s", deployment_id, e
+                )
+                continue
+            mcp.add_tool(placeholder)
+            await mcp.set_deployment_mapping(deployment_id, placeholder.name)
+            self._remember(entry, placeholder.name)
+            self._stats.restored += 1
+        logger.info(
+            "Restored %s deployment tools from %s in %.3fs",
+            self._stats.restored,
+            self.store.path,
+            time.perf_counter() - started,
+        )
+
+    async def materialize(self, deployment_id: str) -> Tool:
+        """Replace the placeholder of ``deployment_id`` by the real tool."""
+        lock = self._locks.setdefault(deployment_id, asyncio.Lock())
+        async with lock:
+            entry = self._known.get(deployment_id)
+            if entry is None:
+                raise RuntimeError(f"Deployment {deployment_id} is not registered")
+            current = await mcp.get_tool(entry.tool["name"])
+            if current is not None and not isinstance(
+                current, DeploymentToolPlaceholder
+            ):
+                return current
+            # The tool is shared, never with the token of the caller materializing it
+            token = get_credentials().datarobot.datarobot_api_token
+            config = _restored_config(entry.config, token)
+            # Drop the placeholder so the duplicate-registration policy does not apply
+            if current is not None:
+                mcp.local_provider.remove_tool(current.name)
+            try:
+                tool = await register_deployment_tool(config, deployment_id)
+            except Exception:
+                if current is not None:
+                    mcp.add_tool(current)
+                raise
+            return tool
+
+    def _remember(self, entry: RegistryEntry, tool_name: str) -> None:
+        self._known[entry.deployment_id] = entry
+        self._tool_names[tool_name] = entry.deployment_id
+
+    async def _forget(self, deployment_id: str) -> None:
+        await mcp.remove_deployment_mapping(deployment_id)
+        self._known.pop(deployment_id, None)
+        self._tool_names = {
+            name: known_id
+            for name, known_id in self._tool_names.items()
+            if known_id != deployment_id
+        }
+
+    async def _sync(
+        self,
+        deployment_id: str,
+        source: EntrySource,
+        register: bool = True,
+        replace: bool = False,
+    ) -> Optional[RegistryEntry]:
+        """
+        Fetch the tool of ``deployment_id`` and register it if it changed.
+
+        With ``replace``, the tool is registered again even if unchanged.
+
+        Returns the new entry to store, or None if nothing is to be stored.
+        """
+        try:
+            config = await get_executor_manager().run(
+                "thread", _fetch_tool_config, deployment_id
+            )
+        except Exception as e:
+            # A caller's token may just not see the deployment
+            app_credentials = resolve_datarobot_token() is None
+            if _is_not_found(e) and app_credentials and deployment_id in self._known:
+                await self._forget(deployment_id)
+                self._stats.removed += 1
+                logger.info("Deployment %s no longer exists", deployment_id)
+                return None
+            self._stats.failed += 1
+            logger.warning(
+                "Could not fetch the tool of deployment %s: %s", deployment_id, e
+            )
+            return None
+        now = time.time()
+        stored = _stored_config(config)
+        previous = self._known.get(deployment_id)
+        if previous is not None and previous.config == stored and not replace:
+            previous.validated_at = now
+            if source == "runtime":
+                previous.source = source
+            return previous
+        tool: Optional[Tool]
+        if register:
+            try:
+                tool = await register_deployment_tool(config, deployment_id)
+            except Exception as e:
+                self._stats.failed += 1
+                logger.warning(
+                    "Could not register the tool of deployment %s: %s",
+                    deployment_id,
+                    e,
+                )
+                return None
+        else:
+            # Registered by the /registeredDeployments route
+            tool = await mcp.get_tool(config.name)
+            if tool is None:
+                return None
+        entry = RegistryEntry.create(
+            deployment_id, source, stored, _tool_definition(tool), now
+        )
+        if previous is None:
+            self._stats.added += 1
+        else:
+            entry.source = (
+                "runtime" if "runtime" in (source, previous.source) else source
+            )
+            self._stats.updated += 1
+        self._remember(entry, tool.name)
+        return entry
+
+    async def refresh(self, concurrency: int) -> None:
+        """Discover the tool deployments and apply the changes."""
+        started = time.perf_counter()
+        executors = get_executor_manager()
+        try:
+            listed = set(await executors.run("thread", get_datarobot_tool_deployments))
+        except Exception as e:
+            logger.warning("Could not list the tool deployments: %s", e)
+            return
+
+        removed = [
+            deployment_id
+            for deployment_id, entry in self._known.items()
+            if entry.source == "discovery" and deployment_id not in listed
+        ]
+        for deployment_id in removed:
+            await self._forget(deployment_id)
+            self._stats.removed += 1
+            logger.info("Unregistered the tool of deployment %s", deployment_id)
+
+        # Runtime registrations are revalidated along with the tagged deployments
+        targets = listed | {
+            deployment_id
+            for deployment_id, entry in self._known.items()
+            if entry.source == "runtime"
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def sync(deployment_id: str) -> Optional[RegistryEntry]:
+            async with semaphore:
+                entry = self._known.get(deployment_id)
+                return await self._sync(
+                    deployment_id, entry.source if entry else "discovery"
+                )
+
+        synced = await asyncio.gather(*(sync(d) for d in sorted(targets)))
+        stored = [entry for entry in synced if entry is not None]
+        # Runtime registrations whose deployment no longer exists
+        removed += [d for d in targets if d not in self._known and d not in listed]
+        await executors.run("thread", self._save, stored, removed)
+        self._stats.refreshes += 1
+        self._stats.last_refresh_seconds = round(time.perf_counter() - started, 3)
+        logger.info("Deployment tools refreshed: %s", asdict(self._stats))
+
+    def _save(self, entries: list[RegistryEntry], removed: list[str]) -> None:
+        self.store.put(entries)
+        self.store.delete(removed)
+
+    async def revalidate(self, deployment_id: str) -> None:
+        """Fetch the tool of ``deployment_id`` again and apply a change."""
+        entry = self._known.get(deployment_id)
+        if entry is None:
+            return
+        self._stats.revalidations += 1
+        synced = await self._sync(deployment_id, entry.source)
+        removed = [] if deployment_id in self._known else [deployment_id]
+        await get_executor_manager().run(
+            "thread", self._save, [synced] if synced else [], removed
+        )
+
+    def revalidate_on_use(self, tool_name: str, max_age: float) -> None:
+        """Revalidate the deployment of ``tool_name`` in the background if stale."""
+        deployment_id = self._tool_names.get(tool_name)
+        if deployment_id is None or deployment_id in self._revalidations:
+            return
+        entry = self._known.get(deployment_id)
+        if entry is None or time.time() - entry.validated_at < max_age:
+            return
+        # Without the caller's request context, so with the app credentials
+        task = asyncio.create_task(
+            self.revalidate(deployment_id), context=contextvars.Context()
+        )
+        self._revalidations[deployment_id] = task
+        task.add_done_callback(lambda _: self._revalidations.pop(deployment_id, None))
+
+    async def adopt(self, deployment_id: str) -> None:
+        """Record the tool registered by ``PUT /registeredDeployments/{id}``."""
+        # The route registers the library's tool, replaced by a proxied one
+        proxied = get_user_config().mcp_server_deployment_proxy_enabled
+        synced = await self._sync(
+            deployment_id, "runtime", register=proxied, replace=proxied
+        )
+        if synced is not None:
+            await get_executor_manager().run("thread", self._save, [synced], [])
+
+    async def discard(self, deployment_id: str) -> None:
+        """Drop the tool unregistered by ``DELETE /registeredDeployments/{id}``."""
+        await self._forget(deployment_id)
+        await get_executor_manager().run("thread", self._save, [], [deployment_id])
+
+    def start(self, interval: float, concurrency: int) -> None:
+        """Refresh now, then every ``interval`` seconds (once if 0)."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(
+            self._run(interval, concurrency), name="deployment-tool-discovery"
+        )
+
+    async def _run(self, interval: float, concurrency: int) -> None:
+        while True:
+            try:
+                await self.refresh(concurrency)
+            except Exception:
+                logger.exception("Deployment tool discovery failed")
+            if interval <= 0:
+                return
+            await asyncio.sleep(interval)
+
+    async def stop(self) -> None:
+        tasks = [*self._revalidations.values()]
+        if self._task is not None:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {**asdict(self._stats), "deployments": len(self._known)}
+
+
+class DeploymentToolPlaceholder(Tool):
+    """Restored deployment tool, built from the registry on first call."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    deployment_id: str
+    discovery: DeploymentToolDiscovery = Field(exclude=True)
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        tool = await self.discovery.materialize(self.deployment_id)
+        return await tool.run(arguments)
+
+
+class DynamicToolRevalidationMiddleware(Middleware):
+    """Revalidate the deployment of a stale dynamic tool when it is called."""
+
+    def __init__(self, discovery: DeploymentToolDiscovery, max_age: float) -> None:
+        self._discovery = discovery
+        self._max_age = max_age
+
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        if self._max_age > 0:
+            self._discovery.revalidate_on_use(context.message.name, self._max_age)
+        return await call_next(context)
+
+
+def record_runtime_registrations(
+    mcp: FastMCP, discovery: DeploymentToolDiscovery
+) -> None:
+    """Record ``PUT``/``DELETE /registeredDeployments/{id}`` in the registry."""
+    path = prefix_mount_path("/registeredDeployments/{deployment_id}")
+
+    def recording(
+        endpoint: Callable[[Request], Awaitable[Response]],
+        succeeded: HTTPStatus,
+        record: Callable[[str], Awaitable[None]],
+    ) -> Callable[[Request], Awaitable[Response]]:
+        async def handler(request: Request) -> Response:
+            response = await endpoint(request)
+            if response.status_code == succeeded:
+                deployment_id = request.path_params["deployment_id"]
+                try:
+                    await record(deployment_id)
+                except Exception as e:
+                    logger.warning(
+                        "Could not record deployment %s in the tool registry: %s",
+                        deployment_id,
+                        e,
+                    )
+            return response
+
+        return handler
+
+    # FastMCP has no public API to replace a custom route, swap the handlers in place
+    routes = mcp._additional_http_routes
+    for index, route in enumerate(routes):
+        if not isinstance(route, Route) or route.path != path or not route.methods:
+            continue
+        if "PUT" in route.methods:
+            endpoint = recording(route.endpoint, HTTPStatus.CREATED, discovery.adopt)
+        elif "DELETE" in route.methods:
+            endpoint = recording(route.endpoint, HTTPStatus.OK, discovery.discard)
+        else:
+            continue
+        routes[index] = Route(
+            route.path, endpoint=endpoint, methods=list(route.methods)
+        )
+
+
+_tool_discovery: Optional[DeploymentToolDiscovery] = None
+
+
+def get_tool_discovery() -> DeploymentToolDiscovery:
+    """Get the global deployment tool discovery."""
+    global _tool_discovery
+    if _tool_discovery is None:
+        _tool_discovery = DeploymentToolDiscovery()
+    return _tool_discovery
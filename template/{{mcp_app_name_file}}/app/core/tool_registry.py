@@ -0,0 +1,180 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk registry of deployment tools.
+
+One SQLite row per deployment tool holds everything needed to register it
+again without calling DataRobot: the tool configuration (endpoint, method,
+input schema, headers without ``Authorization``), the tool definition compiled
+from it (the JSON schema of its parameters, annotations, tags), an ETag of the
+configuration, when it last changed and when it was last confirmed against
+DataRobot. Rows come from the discovery of tagged deployments or from the
+``/registeredDeployments`` runtime API, so runtime registrations survive a
+restart too.
+
+The database uses WAL journaling, so several workers can share it, and is
+created readable by its owner only. A database that cannot be read is
+replaced by an empty one. All methods block; call them from an executor
+thread when on the event loop.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+EntrySource = Literal["discovery", "runtime"]
+
+
+def config_etag(config: dict[str, Any]) -> str:
+    """ETag of a stored tool configuration."""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+@dataclass
+class RegistryEntry:
+    """A deployment tool as stored in the registry."""
+
+    deployment_id: str
+    source: EntrySource
+    config: dict[str, Any]
+    # Listed definition of the registered tool, see app/core/tool_discovery.py
+    tool: dict[str, Any]
+    etag: str
+    last_modified: float
+    validated_at: float
+
+    @classmethod
+    def create(
+        cls,
+        deployment_id: str,
+        source: EntrySource,
+        config: dict[str, Any],
+        tool: dict[str, Any],
+        now: float,
+    ) -> "RegistryEntry":
+        return cls(deployment_id, source, config, tool, config_etag(config), now, now)
+
+
+class ToolRegistryStore:
+    """SQLite file of the registered deployment tools."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._initialized:
+            self._initialize()
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _initialize(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # SQLite creates its journal files with the permissions of the database
+        os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+        try:
+            self._create_schema()
+        except sqlite3.DatabaseError as e:
+            logger.warning("Replacing unreadable tool registry %s: %s", self.path, e)
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(self.path + suffix):
+                    os.unlink(self.path + suffix)
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            self._create_schema()
+        self._initialized = True
+
+    def _create_schema(self) -> None:
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise sqlite3.DatabaseError(f"unknown schema version {version}")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS deployment_tools ("
+                    " deployment_id TEXT PRIMARY KEY,"
+                    " source TEXT NOT NULL,"
+                    " config TEXT NOT NULL,"
+                    " tool TEXT NOT NULL,"
+                    " etag TEXT NOT NULL,"
+                    " last_modified REAL NOT NULL,"
+                    " validated_at REAL NOT NULL)"
+                )
+                connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        finally:
+            connection.close()
+
+    def load(self) -> dict[str, RegistryEntry]:
+        """Return the stored entries by deployment id."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT deployment_id, source, config, tool, etag, last_modified,"
+                " validated_at FROM deployment_tools"
+            ).fetchall()
+        return {
+            row[0]: RegistryEntry(
+                deployment_id=row[0],
+                source=row[1],
+                config=json.loads(row[2]),
+                tool=json.loads(row[3]),
+                etag=row[4],
+                last_modified=row[5],
+                validated_at=row[6],
+            )
+            for row in rows
+        }
+
+    def put(self, entries: Iterable[RegistryEntry]) -> None:
+        """Insert or replace ``entries``."""
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO deployment_tools VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        entry.deployment_id,
+                        entry.source,
+                        json.dumps(entry.config, sort_keys=True),
+                        json.dumps(entry.tool, sort_keys=True),
+                        entry.etag,
+                        entry.last_modified,
+                        entry.validated_at,
+                    )
+                    for entry in entries
+                ],
+            )
+
+    def delete(self, deployment_ids: Iterable[str]) -> None:
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM deployment_tools WHERE deployment_id = ?",
+                [(deployment_id,) for deployment_id in deployment_ids],
+            )
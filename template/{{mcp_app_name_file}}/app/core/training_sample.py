@@ -0,0 +1,496 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Samples of the training data of deployments.
+
+``deployment_get_training_data_sample`` returns example rows of the dataset a
+deployed model was trained on, so an agent can see what the model expects
+before building prediction data:
+
+- The training dataset of the model's project is streamed once from the AI
+  Catalog in blocks, every column as strings. Each row gets a random key and
+  the rows with the smallest keys are kept, which is a uniform reservoir
+  sample: memory depends on the sample size and the block size, not on the
+  size of the dataset.
+- For binary and multiclass targets the smallest keys of each class are kept
+  instead, and the sample takes from each class in proportion to its rows,
+  with at least one row per class when the sample is large enough. Targets
+  with more than ``MAX_STRATA`` classes are sampled uniformly.
+- Samples are cached by caller, deployment, model and dataset version, in
+  memory and as JSON files of ``MCP_SERVER_TRAINING_SAMPLE_CACHE_DIR``, for
+  ``MCP_SERVER_TRAINING_SAMPLE_TTL`` seconds. Replacing the deployed model
+  changes the key, so its samples are never reused. Concurrent identical
+  calls share one download.
+"""
+
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Annotated, Any, Optional, Protocol, Union
+
+import datarobot as dr
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.tool_config import ToolType, is_tool_enabled
+from datarobot_genai.drtools.core.clients.datarobot import (
+    get_datarobot_access_token,
+    request_user_dr_sdk,
+)
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+from opentelemetry import metrics
+from pydantic import Field
+
+from app.core.executors import get_executor_manager
+from app.core.user_config import UserAppConfig, get_user_config
+
+logger = logging.getLogger(__name__)
+
+TRAINING_SAMPLE_TOOL_NAME = "deployment_get_training_data_sample"
+CACHE_DIR_NAME = "mcp_training_samples"
+
+# Targets with more classes are sampled uniformly
+MAX_STRATA = 100
+# Samples kept in memory, the disk cache is only bounded by the TTL
+MEMORY_ENTRIES = 128
+BLOCK_SIZE = 1024 * 1024
+STRATIFIED_TARGET_TYPES = {"Binary", "Multiclass"}
+
+_meter = metrics.get_meter(__name__)
+_lookups_counter = _meter.create_counter(
+    "mcp.training_sample.lookups",
+    description="Training data sample lookups, by result",
+)
+
+
+def get_default_cache_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), CACHE_DIR_NAME)
+
+
+def _strata_codes(table: pa.Table, column: str) -> tuple[np.ndarray, list[str]]:
+    """Return the stratum index of each row, and the stratum values."""
+    encoded = pc.fill_null(table[column], "").combine_chunks().dictionary_encode()
+    return (
+        encoded.indices.to_numpy(zero_copy_only=False),
+        encoded.dictionary.to_pylist(),
+    )
+
+
+def _smallest_keys(
+    keys: np.ndarray, k: Union[int, np.ndarray], codes: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Return the indices of the ``k`` smallest keys, of each stratum if ``codes``.
+
+    With ``codes``, ``k`` may give the number to keep of each stratum.
+    """
+    if codes is None:
+        if len(keys) <= k:
+            return np.arange(len(keys))
+        return np.argpartition(keys, k)[:k]
+    order = np.lexsort((keys, codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    limit = k[sorted_codes] if isinstance(k, np.ndarray) else k
+    return order[rank < limit]
+
+
+def _quotas(counts: dict[str, int], size: int) -> dict[str, int]:
+    """Split ``size`` rows among strata in proportion to their ``counts``."""
+    total = sum(counts.values())
+    if total <= size:
+        return dict(counts)
+    share = {s: size * c / total for s, c in counts.items()}
+    largest = sorted(counts, key=lambda s: -counts[s])[:size]
+    quotas = {s: min(counts[s], max(int(share[s]), s in largest)) for s in counts}
+    while sum(quotas.values()) < size:
+        s = max(
+            (s for s in counts if quotas[s] < counts[s]),
+            key=lambda s: share[s] - quotas[s],
+        )
+        quotas[s] += 1
+    while sum(quotas.values()) > size:
+        s = max(
+            (s for s in counts if quotas[s] > 1), key=lambda s: quotas[s] - share[s]
+        )
+        quotas[s] -= 1
+    return quotas
+
+
+class ReservoirSampler:
+    """Sample of ``size`` rows of record batches, optionally stratified."""
+
+    def __init__(
+        self, size: int, stratify_by: Optional[str] = None, seed: Optional[int] = None
+    ) -> None:
+        self.size = size
+        self.stratify_by = stratify_by
+        self.rows_seen = 0
+        self.counts: dict[str, int] = {}
+        self._rng = np.random.default_rng(seed)
+        self._table: Optional[pa.Table] = None
+        self._keys = np.empty(0)
+
+    def add(self, batch: pa.RecordBatch) -> None:
+        if batch.num_rows == 0:
+            return
+        self.rows_seen += batch.num_rows
+        table = pa.Table.from_batches([batch])
+        keys = self._rng.random(batch.num_rows)
+        if self._table is not None:
+            table = pa.concat_tables([self._table, table])
+            keys = np.concatenate([self._keys, keys])
+        codes = None
+        if self.stratify_by is not None:
+            counts = pc.value_counts(pc.fill_null(batch[self.stratify_by], ""))
+            for item in counts.to_pylist():
+                self.counts[item["values"]] = (
+                    self.counts.get(item["values"], 0) + item["counts"]
+                )
+            if len(self.counts) > MAX_STRATA:
+                logger.info(
+                    "%s has more than %d values, sampling uniformly",
+                    self.stratify_by,
+                    MAX_STRATA,
+                )
+                # The smallest keys overall are among the smallest of each
+                # stratum, so the rows kept so far are enough
+                self.stratify_by = None
+                self.counts = {}
+            else:
+                codes, _ = _strata_codes(table, self.stratify_by)
+        keep = _smallest_keys(keys, self.size, codes)
+        self._table = table.take(keep)
+        self._keys = keys[keep]
+
+    def sample(self) -> Optional[pa.Table]:
+        """Return the sampled rows, in random order."""
+        if self._table is None:
+            return None
+        if self.stratify_by is None:
+            keep = _smallest_keys(self._keys, self.size)
+        else:
+            codes, values = _strata_codes(self._table, self.stratify_by)
+            quotas = _quotas(self.counts, self.size)
+            keep = _smallest_keys(
+                self._keys, np.array([quotas[v] for v in values]), codes
+            )
+        return self._table.take(keep[np.argsort(self._keys[keep])])
+
+
+class Readable(Protocol):
+    def read(self, size: int, /) -> bytes: ...
+
+
+class _PrefixedStream(io.RawIOBase):
+    """``stream``, after the bytes already read from it."""
+
+    def __init__(self, prefix: bytes, stream: Readable) -> None:
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._prefix:
+            n = min(len(buffer), len(self._prefix))
+            buffer[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def sample_csv(
+    stream: Readable,
+    size: int,
+    stratify_by: Optional[str] = None,
+    seed: Optional[int] = None,
+    block_size: int = BLOCK_SIZE,
+) -> ReservoirSampler:
+    """Sample ``size`` rows of the CSV ``stream``, reading it once."""
+    head = b""
+    while b"\n" not in head:
+        data = stream.read(64 * 1024)
+        if not data:
+            break
+        head += data
+    header = next(csv.reader(io.StringIO(head.decode("utf-8-sig", "replace"))), [])
+    if stratify_by not in header:
+        stratify_by = None
+    sampler = ReservoirSampler(size, stratify_by, seed)
+    if not header:
+        return sampler
+    try:
+        reader = pacsv.open_csv(
+            _PrefixedStream(head, stream),
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            sampler.add(batch)
+    except pa.ArrowInvalid as e:
+        raise ToolError(f"The training data is not valid CSV: {e}") from e
+    return sampler
+
+
+@dataclass
+class _TrainingData:
+    model_id: str
+    dataset_id: str
+    dataset_version_id: str
+    # Target of binary and multiclass models
+    class_column: Optional[str]
+
+
+def _training_data(deployment_id: str) -> _TrainingData:
+    """Find the catalog dataset the deployed model was trained on, blocking."""
+    with request_user_dr_sdk(headers_auth_only=True):
+        deployment = dr.Deployment.get(deployment_id)
+        model_id = deployment.model["id"] if deployment.model else None
+        project_id = deployment.model["project_id"] if deployment.model else None
+        if not model_id or not project_id:
+            raise ToolError(
+                f"Deployment {deployment_id} does not serve a DataRobot model"
+            )
+        project = dr.Project.get(project_id)
+    if not project.catalog_id or not project.catalog_version_id:
+        raise ToolError(
+            f"The training data of deployment {deployment_id} is not in the AI Catalog"
+        )
+    return _TrainingData(
+        model_id=model_id,
+        dataset_id=project.catalog_id,
+        dataset_version_id=project.catalog_version_id,
+        class_column=(
+            project.target if project.target_type in STRATIFIED_TARGET_TYPES else None
+        ),
+    )
+
+
+def _download_sample(
+    training_data: _TrainingData, size: int, stratify_by: Optional[str]
+) -> dict[str, Any]:
+    """Stream the training dataset and sample it, blocking."""
+    with request_user_dr_sdk(headers_auth_only=True):
+        response = dr.client.get_client().get(
+            f"datasets/{training_data.dataset_id}/versions/"
+            f"{training_data.dataset_version_id}/file/",
+            stream=True,
+        )
+        try:
+            response.raw.decode_content = True
+            sampler = sample_csv(response.raw, size, stratify_by)
+        finally:
+            response.close()
+    table = sampler.sample()
+    return {
+        "columns": table.column_names if table is not None else [],
+        "rows": table.to_pylist() if table is not None else [],
+        "rows_scanned": sampler.rows_seen,
+        "stratified_by": sampler.stratify_by,
+    }
+
+
+class TrainingSampleCache:
+    """Training data samples, in memory and on disk."""
+
+    def __init__(self, directory: str, ttl: float) -> None:
+        self.directory = directory
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get_memory(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get_disk(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the sample stored on disk, blocking."""
+        path = self._path(key)
+        try:
+            stored_at = os.path.getmtime(path)
+            if time.time() - stored_at >= self._ttl:
+                os.unlink(path)
+                return None
+            with open(path, encoding="utf-8") as f:
+                value: dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable training sample %s: %s", path, e)
+            return None
+        self._remember(key, value, stored_at)
+        return value
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        """Store the sample in memory and on disk, blocking."""
+        self._remember(key, value, time.time())
+        path = self._path(key)
+        partial = f"{path}.{os.getpid()}.part"
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(partial, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning("Could not store training sample %s: %s", path, e)
+
+    def _remember(self, key: str, value: dict[str, Any], stored_at: float) -> None:
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > MEMORY_ENTRIES:
+            self._entries.popitem(last=False)
+
+
+class TrainingSampler:
+    """Cached samples of the training data of deployments."""
+
+    def __init__(self, config: Optional[UserAppConfig] = None) -> None:
+        config = config or get_user_config()
+        self.max_rows = config.mcp_server_training_sample_max_rows
+        self.cache = TrainingSampleCache(
+            config.mcp_server_training_sample_cache_dir or get_default_cache_dir(),
+            config.mcp_server_training_sample_ttl,
+        )
+        self._in_flight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+    async def sample(
+        self, deployment_id: str, n_rows: int, stratify: bool = True
+    ) -> dict[str, Any]:
+        token = get_datarobot_access_token(headers_auth_only=True)
+        executor = get_executor_manager()
+        training_data = await executor.run("thread", _training_data, deployment_id)
+        stratify_by = training_data.class_column if stratify else None
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    hashlib.sha256(token.encode()).hexdigest()[:32],
+                    deployment_id,
+                    training_data.model_id,
+                    training_data.dataset_version_id,
+                    n_rows,
+                    stratify_by,
+                ]
+            ).encode()
+        ).hexdigest()
+
+        source = "memory"
+        value = self.cache.get_memory(key)
+        if value is None:
+            source = "disk"
+            value = await executor.run("thread", self.cache.get_disk, key)
+        if value is None:
+            task = self._in_flight.get(key)
+            source = "shared" if task is not None else "dataset"
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._load(key, training_data, n_rows, stratify_by)
+                )
+                self._in_flight[key] = task
+                task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            value = await asyncio.shield(task)
+        _lookups_counter.add(1, {"result": source})
+
+        return {
+            "deployment_id": deployment_id,
+            "model_id": training_data.model_id,
+            "dataset_id": training_data.dataset_id,
+            "dataset_version_id": training_data.dataset_version_id,
+            **value,
+            "source": "dataset" if source == "shared" else source,
+        }
+
+    async def _load(
+        self,
+        key: str,
+        training_data: _TrainingData,
+        n_rows: int,
+        stratify_by: Optional[str],
+    ) -> dict[str, Any]:
+        executor = get_executor_manager()
+        value: dict[str, Any] = await executor.run(
+            "thread", _download_sample, training_data, n_rows, stratify_by
+        )
+        await executor.run("thread", self.cache.put, key, value)
+        return value
+
+
+def register_training_sample_tool(
+    mcp: FastMCP, config: Optional[UserAppConfig] = None
+) -> None:
+    """Register ``deployment_get_training_data_sample`` unless disabled."""
+    config = config or get_user_config()
+    if not config.mcp_server_training_sample_enabled or not is_tool_enabled(
+        ToolType.PREDICTIVE, get_config()
+    ):
+        return
+    sampler = TrainingSampler(config)
+
+    @mcp.tool(
+        name=TRAINING_SAMPLE_TOOL_NAME,
+        tags={"predictive", "deployment", "training", "data"},
+    )
+    async def deployment_get_training_data_sample(
+        deployment_id: Annotated[str, Field(description="MLOps deployment id.")],
+        n_rows: Annotated[
+            int,
+            Field(ge=1, le=sampler.max_rows, description="Number of rows to return."),
+        ] = 5,
+        stratify: Annotated[
+            bool,
+            Field(
+                description="For classification models, sample each class in "
+                "proportion to its rows."
+            ),
+        ] = True,
+    ) -> ToolResult:
+        """
+        Get example rows of the data a deployed model was trained on.
+
+        Use it to see the columns, formats and typical values the model expects
+        before building prediction data. Rows are a random sample of the whole
+        training dataset; values are returned as strings.
+        """
+        return ToolResult(
+            structured_content=await sampler.sample(deployment_id, n_rows, stratify)
+        )
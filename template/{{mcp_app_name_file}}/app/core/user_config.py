@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from datarobot_genai.drmcp import (
     RUNTIME_PARAM_ENV_VAR_NAME_PREFIX,
@@ -21,6 +21,8 @@ from datarobot_genai.drmcp import (
 from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+EventLoopType = Literal["asyncio", "uvloop"]
+
 
 class UserAppConfig(BaseSettings):
     """User-specific application configuration."""
@@ -35,8 +37,799 @@ class UserAppConfig(BaseSettings):
         description="Name of the user being used",
     )
 
+    mcp_server_workers: int = Field(
+        default=1,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_WORKERS",
+            "MCP_SERVER_WORKERS",
+        ),
+        description="Number of worker processes sharing the MCP server socket",
+    )
+
+    mcp_server_socket_backlog: int = Field(
+        default=2048,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_SOCKET_BACKLOG",
+            "MCP_SERVER_SOCKET_BACKLOG",
+        ),
+        description="Maximum number of pending connections on the listening socket",
+    )
+
+    mcp_server_socket_reuse_port: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_SOCKET_REUSE_PORT",
+            "MCP_SERVER_SOCKET_REUSE_PORT",
+        ),
+        description="Set SO_REUSEPORT so a new server can bind while the old one drains",
+    )
+
+    mcp_server_socket_fd: Optional[int] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_SOCKET_FD",
+            "MCP_SERVER_SOCKET_FD",
+        ),
+        description="File descriptor of an inherited listening socket to serve on",
+    )
+
+    mcp_server_event_loop: EventLoopType = Field(
+        default="asyncio",
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_EVENT_LOOP",
+            "MCP_SERVER_EVENT_LOOP",
+        ),
+        description="Event loop implementation; uvloop requires the 'uvloop' extra",
+    )
+
+    mcp_server_lazy_tools: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_LAZY_TOOLS",
+            "MCP_SERVER_LAZY_TOOLS",
+        ),
+        description="Import tool modules on first call, listing tools from the manifest",
+    )
+
+    mcp_server_tool_manifest_path: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_MANIFEST_PATH",
+            "MCP_SERVER_TOOL_MANIFEST_PATH",
+        ),
+        description="Tool manifest used in lazy mode (defaults to app/tool_manifest.json)",
+    )
+
+    mcp_server_startup_profile: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_STARTUP_PROFILE",
+            "MCP_SERVER_STARTUP_PROFILE",
+        ),
+        description="Time each startup phase and log a JSON startup report",
+    )
+
+    mcp_server_startup_profile_path: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_STARTUP_PROFILE_PATH",
+            "MCP_SERVER_STARTUP_PROFILE_PATH",
+        ),
+        description="File the JSON startup report is also written to",
+    )
+
+    mcp_server_startup_profile_cprofile_path: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_STARTUP_PROFILE_CPROFILE_PATH",
+            "MCP_SERVER_STARTUP_PROFILE_CPROFILE_PATH",
+        ),
+        description="File a cProfile dump of the startup sequence is saved to",
+    )
+
+    mcp_server_warmup_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_WARMUP_ENABLED",
+            "MCP_SERVER_WARMUP_ENABLED",
+        ),
+        description="Run the warm-up tasks before reporting the server ready",
+    )
+
+    mcp_server_warmup_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_WARMUP_TIMEOUT",
+            "MCP_SERVER_WARMUP_TIMEOUT",
+        ),
+        description="Seconds after which unfinished warm-up tasks are cancelled",
+    )
+
+    mcp_server_drain_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DRAIN_TIMEOUT",
+            "MCP_SERVER_DRAIN_TIMEOUT",
+        ),
+        description="Seconds to wait for in-flight tool calls on shutdown",
+    )
+
+    mcp_server_http_client_http2: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_HTTP_CLIENT_HTTP2",
+            "MCP_SERVER_HTTP_CLIENT_HTTP2",
+        ),
+        description="Use HTTP/2 in the shared HTTP client; requires the 'http2' extra",
+    )
+
+    mcp_server_http_client_max_connections: int = Field(
+        default=100,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_HTTP_CLIENT_MAX_CONNECTIONS",
+            "MCP_SERVER_HTTP_CLIENT_MAX_CONNECTIONS",
+        ),
+        description="Maximum number of connections of the shared HTTP client",
+    )
+
+    mcp_server_http_client_max_connections_per_host: int = Field(
+        default=20,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST",
+            "MCP_SERVER_HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST",
+        ),
+        description="Maximum number of concurrent requests per host of the shared HTTP client",
+    )
+
+    mcp_server_http_client_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS",
+            "MCP_SERVER_HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS",
+        ),
+        description="Maximum number of idle keep-alive connections kept in the pool",
+    )
+
+    mcp_server_http_client_keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_HTTP_CLIENT_KEEPALIVE_EXPIRY",
+            "MCP_SERVER_HTTP_CLIENT_KEEPALIVE_EXPIRY",
+        ),
+        description="Seconds an idle keep-alive connection is kept in the pool",
+    )
+
+    mcp_server_http_client_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_HTTP_CLIENT_TIMEOUT",
+            "MCP_SERVER_HTTP_CLIENT_TIMEOUT",
+        ),
+        description="Default timeout in seconds of the shared HTTP client requests",
+    )
+
+    mcp_server_tool_cache_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_CACHE_ENABLED",
+            "MCP_SERVER_TOOL_CACHE_ENABLED",
+        ),
+        description="Serve the tools decorated with cached_tool from the cache",
+    )
+
+    mcp_server_tool_cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_CACHE_MAX_ENTRIES",
+            "MCP_SERVER_TOOL_CACHE_MAX_ENTRIES",
+        ),
+        description="Maximum number of cached tool results",
+    )
+
+    mcp_server_tool_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_CACHE_MAX_BYTES",
+            "MCP_SERVER_TOOL_CACHE_MAX_BYTES",
+        ),
+        description="Maximum estimated size in bytes of the cached tool results",
+    )
+
+    mcp_server_tool_cache_default_ttl: float = Field(
+        default=300.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_CACHE_DEFAULT_TTL",
+            "MCP_SERVER_TOOL_CACHE_DEFAULT_TTL",
+        ),
+        description="Seconds a cached tool result is kept when the tool sets no TTL",
+    )
+
+    mcp_server_tool_concurrency_limits: str = Field(
+        default="",
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_CONCURRENCY_LIMITS",
+            "MCP_SERVER_TOOL_CONCURRENCY_LIMITS",
+        ),
+        description=(
+            "Concurrent call limits, e.g. 'my_tool=4,tag:deployment=16' "
+            "(overrides the concurrency_limit decorator)"
+        ),
+    )
+
+    mcp_server_tool_queue_size: int = Field(
+        default=32,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_QUEUE_SIZE",
+            "MCP_SERVER_TOOL_QUEUE_SIZE",
+        ),
+        description="Maximum number of tool calls waiting for a slot, per limit",
+    )
+
+    mcp_server_tool_queue_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_QUEUE_TIMEOUT",
+            "MCP_SERVER_TOOL_QUEUE_TIMEOUT",
+        ),
+        description="Seconds a tool call waits for a slot before it is rejected",
+    )
+
+    mcp_server_executor_threads: int = Field(
+        default=16,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_EXECUTOR_THREADS",
+            "MCP_SERVER_EXECUTOR_THREADS",
+        ),
+        description="Threads of the executor running run_in_executor('thread') tools",
+    )
+
+    mcp_server_executor_processes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_EXECUTOR_PROCESSES",
+            "MCP_SERVER_EXECUTOR_PROCESSES",
+        ),
+        description=(
+            "Processes of the executor running run_in_executor('process') tools "
+            "(defaults to the number of CPUs)"
+        ),
+    )
+
+    mcp_server_loop_monitor_interval: float = Field(
+        default=0.5,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_LOOP_MONITOR_INTERVAL",
+            "MCP_SERVER_LOOP_MONITOR_INTERVAL",
+        ),
+        description="Seconds between event loop lag measurements, 0 to disable",
+    )
+
+    mcp_server_loop_slow_callback_threshold: float = Field(
+        default=0.25,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_LOOP_SLOW_CALLBACK_THRESHOLD",
+            "MCP_SERVER_LOOP_SLOW_CALLBACK_THRESHOLD",
+        ),
+        description=(
+            "Seconds the event loop may stay blocked before it is reported, "
+            "0 to disable"
+        ),
+    )
+
+    mcp_server_loop_stack_samples: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_LOOP_STACK_SAMPLES",
+            "MCP_SERVER_LOOP_STACK_SAMPLES",
+        ),
+        description="Capture the stack the event loop is blocked in",
+    )
+
+    mcp_server_tool_stream_chunk_size: int = Field(
+        default=64 * 1024,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_STREAM_CHUNK_SIZE",
+            "MCP_SERVER_TOOL_STREAM_CHUNK_SIZE",
+        ),
+        description="Maximum characters per progress notification of streamed tools",
+    )
+
+    mcp_server_tool_stream_buffer_chunks: int = Field(
+        default=8,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_STREAM_BUFFER_CHUNKS",
+            "MCP_SERVER_TOOL_STREAM_BUFFER_CHUNKS",
+        ),
+        description="Chunks a streamed tool may produce ahead of the notifications",
+    )
+
+    mcp_server_tool_stream_max_inline_size: int = Field(
+        default=1024 * 1024,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_TOOL_STREAM_MAX_INLINE_SIZE",
+            "MCP_SERVER_TOOL_STREAM_MAX_INLINE_SIZE",
+        ),
+        description=(
+            "Characters of a streamed tool output returned to clients "
+            "not asking for progress notifications"
+        ),
+    )
+
+    mcp_server_batch_tool_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_BATCH_TOOL_ENABLED",
+            "MCP_SERVER_BATCH_TOOL_ENABLED",
+        ),
+        description="Register the batch_call tool running several tool calls at once",
+    )
+
+    mcp_server_batch_max_calls: int = Field(
+        default=50,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_BATCH_MAX_CALLS",
+            "MCP_SERVER_BATCH_MAX_CALLS",
+        ),
+        description="Maximum number of tool calls in one batch_call",
+    )
+
+    mcp_server_batch_max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_BATCH_MAX_CONCURRENCY",
+            "MCP_SERVER_BATCH_MAX_CONCURRENCY",
+        ),
+        description="Tool calls of one batch_call running at the same time",
+    )
+
+    mcp_server_tool_list_cache_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TOOL_LIST_CACHE_ENABLED",
+            "MCP_SERVER_TOOL_LIST_CACHE_ENABLED",
+        ),
+        description="Cache the tools/list response until the tool registry changes",
+    )
+
+    mcp_server_dynamic_tools_incremental: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DYNAMIC_TOOLS_INCREMENTAL",
+            "MCP_SERVER_DYNAMIC_TOOLS_INCREMENTAL",
+        ),
+        description=(
+            "Register deployment tools from the last snapshot at startup and "
+            "discover changes in the background, instead of scanning at startup"
+        ),
+    )
+
+    mcp_server_dynamic_tools_snapshot_path: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_DYNAMIC_TOOLS_SNAPSHOT_PATH",
+            "MCP_SERVER_DYNAMIC_TOOLS_SNAPSHOT_PATH",
+        ),
+        description=(
+            "SQLite registry of the deployment tools, in the temp directory if not set"
+        ),
+    )
+
+    mcp_server_dynamic_tools_refresh_interval: float = Field(
+        default=300.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_DYNAMIC_TOOLS_REFRESH_INTERVAL",
+            "MCP_SERVER_DYNAMIC_TOOLS_REFRESH_INTERVAL",
+        ),
+        description="Seconds between deployment tool discoveries, 0 to discover once",
+    )
+
+    mcp_server_dynamic_tools_refresh_concurrency: int = Field(
+        default=8,
+        ge=1,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_DYNAMIC_TOOLS_REFRESH_CONCURRENCY",
+            "MCP_SERVER_DYNAMIC_TOOLS_REFRESH_CONCURRENCY",
+        ),
+        description="Deployments whose tool metadata is fetched at the same time",
+    )
+
+    mcp_server_dynamic_tools_max_age: float = Field(
+        default=3600.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DYNAMIC_TOOLS_MAX_AGE",
+            "MCP_SERVER_DYNAMIC_TOOLS_MAX_AGE",
+        ),
+        description=(
+            "Seconds after which the first call of a deployment tool revalidates it "
+            "in the background, 0 to only revalidate on refresh"
+        ),
+    )
+
+    mcp_server_deployment_proxy_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DEPLOYMENT_PROXY_ENABLED",
+            "MCP_SERVER_DEPLOYMENT_PROXY_ENABLED",
+        ),
+        description=(
+            "Call deployments of discovered tools through the pooled proxy engine"
+        ),
+    )
+
+    mcp_server_deployment_proxy_timeout: float = Field(
+        default=600.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DEPLOYMENT_PROXY_TIMEOUT",
+            "MCP_SERVER_DEPLOYMENT_PROXY_TIMEOUT",
+        ),
+        description="Read, write and pool timeout in seconds of deployment requests",
+    )
+
+    mcp_server_deployment_proxy_connect_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_DEPLOYMENT_PROXY_CONNECT_TIMEOUT",
+            "MCP_SERVER_DEPLOYMENT_PROXY_CONNECT_TIMEOUT",
+        ),
+        description="Connect timeout in seconds of deployment requests",
+    )
+
+    mcp_server_deployment_proxy_retries: int = Field(
+        default=4,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DEPLOYMENT_PROXY_RETRIES",
+            "MCP_SERVER_DEPLOYMENT_PROXY_RETRIES",
+        ),
+        description=(
+            "Retries of deployment requests failing with a transport error or 429/5xx"
+        ),
+    )
+
+    mcp_server_deployment_proxy_backoff: float = Field(
+        default=0.1,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_DEPLOYMENT_PROXY_BACKOFF",
+            "MCP_SERVER_DEPLOYMENT_PROXY_BACKOFF",
+        ),
+        description="Base delay in seconds of the jittered exponential retry backoff",
+    )
+
+    mcp_server_deployment_proxy_breaker_threshold: int = Field(
+        default=5,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_THRESHOLD",
+            "MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_THRESHOLD",
+        ),
+        description=(
+            "Consecutive failures opening the circuit of a deployment, 0 to disable"
+        ),
+    )
+
+    mcp_server_deployment_proxy_breaker_reset: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_RESET",
+            "MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_RESET",
+        ),
+        description="Seconds an open deployment circuit fails fast before a trial call",
+    )
+
+    mcp_server_prediction_batching_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_PREDICTION_BATCHING_ENABLED",
+            "MCP_SERVER_PREDICTION_BATCHING_ENABLED",
+        ),
+        description="Coalesce concurrent row predictions to the same deployment into one request",
+    )
+
+    mcp_server_prediction_batch_window: float = Field(
+        default=0.005,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_PREDICTION_BATCH_WINDOW",
+            "MCP_SERVER_PREDICTION_BATCH_WINDOW",
+        ),
+        description="Seconds a prediction call waits for others to the same deployment",
+    )
+
+    mcp_server_prediction_batch_max_rows: int = Field(
+        default=1000,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_PREDICTION_BATCH_MAX_ROWS",
+            "MCP_SERVER_PREDICTION_BATCH_MAX_ROWS",
+        ),
+        description="Rows after which a prediction batch is sent without waiting",
+    )
+
+    mcp_server_feature_metadata_cache_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_FEATURE_METADATA_CACHE_ENABLED",
+            "MCP_SERVER_FEATURE_METADATA_CACHE_ENABLED",
+        ),
+        description="Share deployment feature metadata between the deployment info tools",
+    )
+
+    mcp_server_feature_metadata_ttl: float = Field(
+        default=900.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_FEATURE_METADATA_TTL",
+            "MCP_SERVER_FEATURE_METADATA_TTL",
+        ),
+        description="Seconds deployment feature metadata is kept",
+    )
+
+    mcp_server_feature_metadata_check_interval: float = Field(
+        default=60.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_FEATURE_METADATA_CHECK_INTERVAL",
+            "MCP_SERVER_FEATURE_METADATA_CHECK_INTERVAL",
+        ),
+        description="Seconds after which the deployed model is checked before reusing feature metadata",
+    )
+
+    mcp_server_feature_metadata_max_entries: int = Field(
+        default=256,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_FEATURE_METADATA_MAX_ENTRIES",
+            "MCP_SERVER_FEATURE_METADATA_MAX_ENTRIES",
+        ),
+        description="Maximum number of cached deployment feature metadata entries",
+    )
+
+    mcp_server_prediction_validation_columnar: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_PREDICTION_VALIDATION_COLUMNAR",
+            "MCP_SERVER_PREDICTION_VALIDATION_COLUMNAR",
+        ),
+        description="Validate prediction data with the streaming columnar engine",
+    )
+
+    mcp_server_prediction_validation_block_size: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_PREDICTION_VALIDATION_BLOCK_SIZE",
+            "MCP_SERVER_PREDICTION_VALIDATION_BLOCK_SIZE",
+        ),
+        description="Bytes of CSV read per block when validating prediction data",
+    )
+
+    mcp_server_prediction_template_plans: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_PREDICTION_TEMPLATE_PLANS",
+            "MCP_SERVER_PREDICTION_TEMPLATE_PLANS",
+        ),
+        description="Generate prediction data templates from cached column plans",
+    )
+
+    mcp_server_prediction_template_max_plans: int = Field(
+        default=256,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_PREDICTION_TEMPLATE_MAX_PLANS",
+            "MCP_SERVER_PREDICTION_TEMPLATE_MAX_PLANS",
+        ),
+        description="Deployments whose prediction data template plan is cached",
+    )
+
+    mcp_server_prediction_files_dir: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_PREDICTION_FILES_DIR",
+            "MCP_SERVER_PREDICTION_FILES_DIR",
+        ),
+        description="Directory of the files scored by predict_score_file_realtime",
+    )
+
+    mcp_server_prediction_stream_chunk_rows: int = Field(
+        default=10000,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_PREDICTION_STREAM_CHUNK_ROWS",
+            "MCP_SERVER_PREDICTION_STREAM_CHUNK_ROWS",
+        ),
+        description="Rows sent per prediction request when scoring a file",
+    )
+
+    mcp_server_prediction_stream_concurrency: int = Field(
+        default=4,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX
+            + "MCP_SERVER_PREDICTION_STREAM_CONCURRENCY",
+            "MCP_SERVER_PREDICTION_STREAM_CONCURRENCY",
+        ),
+        description="Prediction requests in flight when scoring a file",
+    )
+
+    aws_predictions_s3_bucket: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "AWS_PREDICTIONS_S3_BUCKET",
+            "AWS_PREDICTIONS_S3_BUCKET",
+        ),
+        description="S3 bucket scored files are written to instead of the files directory",
+    )
+
+    aws_predictions_s3_prefix: str = Field(
+        default="",
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "AWS_PREDICTIONS_S3_PREFIX",
+            "AWS_PREDICTIONS_S3_PREFIX",
+        ),
+        description="Key prefix of the scored files written to S3",
+    )
+
+    mcp_server_training_sample_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TRAINING_SAMPLE_ENABLED",
+            "MCP_SERVER_TRAINING_SAMPLE_ENABLED",
+        ),
+        description="Register the deployment_get_training_data_sample tool",
+    )
+
+    mcp_server_training_sample_max_rows: int = Field(
+        default=100,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TRAINING_SAMPLE_MAX_ROWS",
+            "MCP_SERVER_TRAINING_SAMPLE_MAX_ROWS",
+        ),
+        description="Maximum number of rows of a training data sample",
+    )
+
+    mcp_server_training_sample_cache_dir: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TRAINING_SAMPLE_CACHE_DIR",
+            "MCP_SERVER_TRAINING_SAMPLE_CACHE_DIR",
+        ),
+        description="Directory of cached training data samples, in the temp directory if not set",
+    )
+
+    mcp_server_training_sample_ttl: float = Field(
+        default=86400.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            RUNTIME_PARAM_ENV_VAR_NAME_PREFIX + "MCP_SERVER_TRAINING_SAMPLE_TTL",
+            "MCP_SERVER_TRAINING_SAMPLE_TTL",
+        ),
+        description="Seconds a training data sample is cached",
+    )
+
     @field_validator(
         "user_name",
+        "mcp_server_workers",
+        "mcp_server_event_loop",
+        "mcp_server_socket_backlog",
+        "mcp_server_socket_reuse_port",
+        "mcp_server_socket_fd",
+        "mcp_server_lazy_tools",
+        "mcp_server_tool_manifest_path",
+        "mcp_server_startup_profile",
+        "mcp_server_startup_profile_path",
+        "mcp_server_startup_profile_cprofile_path",
+        "mcp_server_warmup_enabled",
+        "mcp_server_warmup_timeout",
+        "mcp_server_drain_timeout",
+        "mcp_server_http_client_http2",
+        "mcp_server_http_client_max_connections",
+        "mcp_server_http_client_max_connections_per_host",
+        "mcp_server_http_client_max_keepalive_connections",
+        "mcp_server_http_client_keepalive_expiry",
+        "mcp_server_http_client_timeout",
+        "mcp_server_tool_cache_enabled",
+        "mcp_server_tool_cache_max_entries",
+        "mcp_server_tool_cache_max_bytes",
+        "mcp_server_tool_cache_default_ttl",
+        "mcp_server_tool_concurrency_limits",
+        "mcp_server_tool_queue_size",
+        "mcp_server_tool_queue_timeout",
+        "mcp_server_executor_threads",
+        "mcp_server_executor_processes",
+        "mcp_server_loop_monitor_interval",
+        "mcp_server_loop_slow_callback_threshold",
+        "mcp_server_loop_stack_samples",
+        "mcp_server_tool_stream_chunk_size",
+        "mcp_server_tool_stream_buffer_chunks",
+        "mcp_server_tool_stream_max_inline_size",
+        "mcp_server_batch_tool_enabled",
+        "mcp_server_batch_max_calls",
+        "mcp_server_batch_max_concurrency",
+        "mcp_server_tool_list_cache_enabled",
+        "mcp_server_dynamic_tools_incremental",
+        "mcp_server_dynamic_tools_snapshot_path",
+        "mcp_server_dynamic_tools_refresh_interval",
+        "mcp_server_dynamic_tools_refresh_concurrency",
+        "mcp_server_dynamic_tools_max_age",
+        "mcp_server_deployment_proxy_enabled",
+        "mcp_server_deployment_proxy_timeout",
+        "mcp_server_deployment_proxy_connect_timeout",
+        "mcp_server_deployment_proxy_retries",
+        "mcp_server_deployment_proxy_backoff",
+        "mcp_server_deployment_proxy_breaker_threshold",
+        "mcp_server_deployment_proxy_breaker_reset",
+        "mcp_server_prediction_batching_enabled",
+        "mcp_server_prediction_batch_window",
+        "mcp_server_prediction_batch_max_rows",
+        "mcp_server_feature_metadata_cache_enabled",
+        "mcp_server_feature_metadata_ttl",
+        "mcp_server_feature_metadata_check_interval",
+        "mcp_server_feature_metadata_max_entries",
+        "mcp_server_prediction_validation_columnar",
+        "mcp_server_prediction_validation_block_size",
+        "mcp_server_prediction_template_plans",
+        "mcp_server_prediction_template_max_plans",
+        "mcp_server_prediction_files_dir",
+        "mcp_server_prediction_stream_chunk_rows",
+        "mcp_server_prediction_stream_concurrency",
+        "aws_predictions_s3_bucket",
+        "aws_predictions_s3_prefix",
+        "mcp_server_training_sample_enabled",
+        "mcp_server_training_sample_max_rows",
+        "mcp_server_training_sample_cache_dir",
+        "mcp_server_training_sample_ttl",
         mode="before",
     )
     @classmethod
@@ -0,0 +1,212 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Warm-up phase and readiness gating.
+
+Warm-up tasks are coroutines run concurrently from
+``ServerLifecycle.post_server_start`` with a shared deadline, so the first
+client requests do not pay for cold caches, connection pools and TLS
+handshakes. ``/readyz`` answers 503 until warm-up has finished (successfully,
+with failures, or by hitting the deadline) while ``/healthz`` is a cheap
+liveness probe that answers as soon as the server accepts connections.
+
+With multiple workers, each worker publishes its readiness in a flag array
+shared by the worker pool (see ``app.core.workers``), and ``/readyz`` only
+answers 200 once every worker is ready, whichever worker serves the probe.
+
+Register additional tasks with the ``warmup_task`` decorator::
+
+    @warmup_task("prime_my_cache")
+    async def prime_my_cache(mcp: FastMCP) -> None:
+        ...
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from multiprocessing.sharedctypes import SynchronizedArray
+from typing import Any, Literal, Optional
+
+from datarobot_genai.drmcp.core.routes_utils import prefix_mount_path
+from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from app.core.http_client import prime_http_client
+
+logger = logging.getLogger(__name__)
+
+WarmupTask = Callable[[FastMCP], Awaitable[None]]
+WarmupStatus = Literal["pending", "running", "ready", "draining"]
+WarmupTaskStatus = Literal["ok", "failed", "timeout"]
+
+
+@dataclass
+class WarmupTaskResult:
+    status: WarmupTaskStatus
+    duration_seconds: float
+    error: Optional[str] = None
+
+
+class WarmupManager:
+    """Registry of warm-up tasks and readiness state of this server process."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, WarmupTask] = {}
+        self._status: WarmupStatus = "pending"
+        self._results: dict[str, WarmupTaskResult] = {}
+        self._worker_flags: Optional["SynchronizedArray[int]"] = None
+        self._worker_id = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether this process, and every other worker of the pool, is ready."""
+        if self._status != "ready":
+            return False
+        return self._worker_flags is None or all(self._worker_flags[:])
+
+    def share_readiness(self, flags: "SynchronizedArray[int]", worker_id: int) -> None:
+        """Publish readiness in ``flags``, the flag array shared by the worker pool."""
+        self._worker_flags = flags
+        self._worker_id = worker_id
+        flags[worker_id] = int(self._status == "ready")
+
+    @property
+    def task_names(self) -> list[str]:
+        return list(self._tasks)
+
+    def register(self, name: str, task: WarmupTask) -> None:
+        """Register ``task`` to run during warm-up, replacing any task named ``name``."""
+        self._tasks[name] = task
+
+    def unregister(self, name: str) -> None:
+        self._tasks.pop(name, None)
+
+    def mark_ready(self) -> None:
+        """Mark the server ready without running the warm-up tasks."""
+        if self._status == "draining":
+            return
+        self._status = "ready"
+        if self._worker_flags is not None:
+            self._worker_flags[self._worker_id] = 1
+
+    def mark_draining(self) -> None:
+        """Report the server unready for good, it is shutting down."""
+        self._status = "draining"
+        if self._worker_flags is not None:
+            self._worker_flags[self._worker_id] = 0
+
+    async def run(self, mcp: FastMCP, timeout: float) -> dict[str, WarmupTaskResult]:
+        """
+        Run all warm-up tasks concurrently and mark the server ready.
+
+        Tasks still running after ``timeout`` seconds are cancelled. Failed or
+        timed out tasks are logged but do not keep the server unready: warm-up
+        only saves latency, the server can still serve requests without it.
+        """
+        self._status = "running"
+        self._results = {}
+        started = time.perf_counter()
+        tasks = {
+            name: asyncio.create_task(self._run_task(name, task, mcp))
+            for name, task in self._tasks.items()
+        }
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for name, task in tasks.items():
+                if task in pending:
+                    logger.warning("Warm-up task %s timed out after %ss", name, timeout)
+                    self._results[name] = WarmupTaskResult(
+                        status="timeout", duration_seconds=round(timeout, 6)
+                    )
+        self.mark_ready()
+        logger.info(
+            "Warm-up finished in %.3fs: %s",
+            time.perf_counter() - started,
+            {name: result.status for name, result in self._results.items()},
+        )
+        return dict(self._results)
+
+    async def _run_task(self, name: str, task: WarmupTask, mcp: FastMCP) -> None:
+        started = time.perf_counter()
+        try:
+            await task(mcp)
+        except Exception as e:
+            logger.warning("Warm-up task %s failed: %s", name, e)
+            self._results[name] = WarmupTaskResult(
+                status="failed",
+                duration_seconds=round(time.perf_counter() - started, 6),
+                error=str(e),
+            )
+        else:
+            self._results[name] = WarmupTaskResult(
+                status="ok", duration_seconds=round(time.perf_counter() - started, 6)
+            )
+
+    def readiness(self) -> dict[str, Any]:
+        readiness: dict[str, Any] = {
+            "status": self._status,
+            "warmup": {name: asdict(result) for name, result in self._results.items()},
+        }
+        if self._worker_flags is not None:
+            flags = self._worker_flags[:]
+            readiness["workers"] = {"ready": sum(flags), "total": len(flags)}
+        return readiness
+
+
+# Global warm-up manager instance
+_warmup_manager: Optional[WarmupManager] = None
+
+
+def get_warmup_manager() -> WarmupManager:
+    """Get the global warm-up manager, with the built-in tasks registered."""
+    global _warmup_manager
+    if _warmup_manager is None:
+        _warmup_manager = WarmupManager()
+        _warmup_manager.register("prime_http_client", prime_http_client)
+    return _warmup_manager
+
+
+def warmup_task(name: Optional[str] = None) -> Callable[[WarmupTask], WarmupTask]:
+    """Register the decorated coroutine function as a warm-up task."""
+
+    def decorator(task: WarmupTask) -> WarmupTask:
+        get_warmup_manager().register(name or getattr(task, "__name__"), task)
+        return task
+
+    return decorator
+
+
+def register_health_routes(mcp: FastMCP, manager: WarmupManager) -> None:
+    """Register the ``/healthz`` liveness and ``/readyz`` readiness routes."""
+
+    @mcp.custom_route(prefix_mount_path("/healthz"), methods=["GET"])
+    async def healthz(_: Request) -> JSONResponse:
+        return JSONResponse(status_code=HTTPStatus.OK, content={"status": "alive"})
+
+    @mcp.custom_route(prefix_mount_path("/readyz"), methods=["GET"])
+    async def readyz(_: Request) -> JSONResponse:
+        return JSONResponse(
+            status_code=(
+                HTTPStatus.OK if manager.ready else HTTPStatus.SERVICE_UNAVAILABLE
+            ),
+            content=manager.readiness(),
+        )
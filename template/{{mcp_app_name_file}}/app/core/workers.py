@@ -0,0 +1,262 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Multi-process serving for the MCP server.
+
+The parent process binds the listening socket once (see ``app.core.sockets``)
+and spawns N worker processes that inherit it. Every worker builds its own
+server (config, credentials, tools and ``ServerLifecycle``) and accepts
+connections from the shared socket, so the kernel balances connections across
+workers.
+
+The streamable-HTTP transport runs in stateless mode, so no MCP session state
+lives in a worker and any worker can serve any MCP request. Tools and prompts
+registered at runtime through ``/registeredDeployments`` and
+``/registeredPrompts`` are the exception: they would only be added to (or
+removed from) the worker that happened to receive the request, so those routes
+are refused in multi-worker mode (see ``disable_runtime_registration_routes``).
+"""
+
+import logging
+import multiprocessing
+import signal
+import socket
+import threading
+import time
+from collections.abc import Callable
+from http import HTTPStatus
+from multiprocessing.process import BaseProcess
+from multiprocessing.sharedctypes import SynchronizedArray
+from multiprocessing.synchronize import Event
+from types import FrameType
+from typing import Any, Optional
+
+from datarobot_genai.drmcp.core.routes_utils import prefix_mount_path
+from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+logger = logging.getLogger(__name__)
+
+_RUNTIME_REGISTRATION_PATHS = ("/registeredDeployments", "/registeredPrompts")
+_RUNTIME_REGISTRATION_METHODS = {"PUT", "DELETE"}
+
+
+class WorkerSupervisor:
+    """
+    Spawn and supervise worker processes sharing one listening socket.
+
+    Each worker receives a ``started`` event it sets once its server is up (see
+    ``ServerLifecycle.post_server_start``) and the pool's ``ready`` flag array,
+    in which it sets its own flag once warmed up (see
+    ``WarmupManager.share_readiness``), so that any worker can report the
+    readiness of the whole pool. A worker that exits before setting it
+    failed during startup (bad config, missing credentials...) and stops the
+    whole pool. Workers that crash after a successful start are respawned with
+    an exponential backoff, reset once a worker stays up for
+    ``max_restart_backoff`` seconds. SIGTERM/SIGINT trigger a
+    coordinated shutdown: every worker gets SIGTERM and is killed if it has not
+    exited within ``shutdown_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[socket.socket, int, Event, "SynchronizedArray[int]"], None],
+        sock: socket.socket,
+        workers: int,
+        shutdown_timeout: float = 30.0,
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 30.0,
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            target: Module-level callable run in each worker as
+                ``target(sock, worker_id, started, ready)``
+            sock: The pre-bound listening socket shared by all workers
+            workers: Number of worker processes
+            shutdown_timeout: Seconds to wait for workers to exit before killing them
+            restart_backoff: Seconds to wait before the first restart of a crashed
+                worker, doubled on every consecutive crash
+            max_restart_backoff: Upper bound of the restart delay
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._target = target
+        self._sock = sock
+        self._workers = workers
+        self._shutdown_timeout = shutdown_timeout
+        self._restart_backoff = restart_backoff
+        self._max_restart_backoff = max_restart_backoff
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[int, BaseProcess] = {}
+        self._started: dict[int, Event] = {}
+        self._ready: "SynchronizedArray[int]" = self._context.Array("b", workers)
+        self._spawned_at: dict[int, float] = {}
+        self._failures: dict[int, int] = {}
+        self._restart_at: dict[int, float] = {}
+        self._should_exit = threading.Event()
+
+    @property
+    def processes(self) -> dict[int, BaseProcess]:
+        """Return the current worker processes keyed by worker id."""
+        return dict(self._processes)
+
+    def shutdown(self) -> None:
+        """Request a coordinated shutdown of all workers."""
+        self._should_exit.set()
+
+    def run(self) -> int:
+        """Run the worker pool until shutdown, returning the process exit code."""
+        previous_handlers = self._install_signal_handlers()
+        exit_code = 0
+        try:
+            for worker_id in range(self._workers):
+                self._spawn(worker_id)
+            while not self._should_exit.wait(0.5):
+                failed = self._check_workers()
+                if failed is not None:
+                    exit_code = failed
+                    break
+        finally:
+            self._stop_workers()
+            self._restore_signal_handlers(previous_handlers)
+        return exit_code
+
+    def restart_delay(self, failures: int) -> float:
+        """Return the delay before restarting a worker that crashed ``failures`` times in a row."""
+        delay: float = self._restart_backoff * 2 ** max(failures - 1, 0)
+        return min(delay, self._max_restart_backoff)
+
+    def _spawn(self, worker_id: int) -> None:
+        started = self._context.Event()
+        self._ready[worker_id] = 0
+        process = self._context.Process(
+            target=self._target,
+            args=(self._sock, worker_id, started, self._ready),
+            name=f"mcp-worker-{worker_id}",
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._started[worker_id] = started
+        self._spawned_at[worker_id] = time.monotonic()
+        logger.info("Started MCP worker %s (pid %s)", worker_id, process.pid)
+
+    def _check_workers(self) -> Optional[int]:
+        """Respawn crashed workers; return an exit code if the pool must stop."""
+        now = time.monotonic()
+        for worker_id, process in list(self._processes.items()):
+            restart_at = self._restart_at.get(worker_id)
+            if restart_at is not None:
+                if now >= restart_at:
+                    del self._restart_at[worker_id]
+                    self._spawn(worker_id)
+                continue
+            started = self._started[worker_id].is_set()
+            if process.is_alive():
+                if (
+                    started
+                    and now - self._spawned_at[worker_id] >= self._max_restart_backoff
+                ):
+                    self._failures.pop(worker_id, None)
+                continue
+            exitcode = process.exitcode
+            self._ready[worker_id] = 0
+            if not started:
+                logger.error(
+                    "MCP worker %s exited during startup with code %s, stopping",
+                    worker_id,
+                    exitcode,
+                )
+                return exitcode or 1
+            failures = self._failures.get(worker_id, 0) + 1
+            self._failures[worker_id] = failures
+            delay = self.restart_delay(failures)
+            logger.warning(
+                "MCP worker %s exited with code %s, restarting in %.1fs",
+                worker_id,
+                exitcode,
+                delay,
+            )
+            self._restart_at[worker_id] = now + delay
+        return None
+
+    def _stop_workers(self) -> None:
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + self._shutdown_timeout
+        for worker_id, process in self._processes.items():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("MCP worker %s did not stop in time, killing", worker_id)
+                process.kill()
+                process.join()
+        self._processes.clear()
+        self._restart_at.clear()
+
+    def _handle_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        logger.info("Received signal %s, stopping MCP workers", signum)
+        self.shutdown()
+
+    def _install_signal_handlers(self) -> dict[int, Any]:
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        previous: dict[int, Any] = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.signal(signum, self._handle_signal)
+        return previous
+
+    @staticmethod
+    def _restore_signal_handlers(previous: dict[int, Any]) -> None:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def disable_runtime_registration_routes(mcp: FastMCP) -> None:
+    """
+    Refuse the runtime tool and prompt (de)registration routes.
+
+    ``PUT``/``DELETE`` on ``/registeredDeployments`` and ``/registeredPrompts``
+    only change the worker that receives the request, leaving the other workers
+    with a different set of tools and prompts. In multi-worker mode they answer
+    409 Conflict instead; register deployments and prompts through configuration
+    so that every worker loads them at startup.
+    """
+    prefixes = tuple(prefix_mount_path(path) for path in _RUNTIME_REGISTRATION_PATHS)
+
+    async def refuse(_: Request) -> JSONResponse:
+        return JSONResponse(
+            status_code=HTTPStatus.CONFLICT,
+            content={
+                "error": "Runtime registration is not supported with multiple "
+                "workers (MCP_SERVER_WORKERS > 1)"
+            },
+        )
+
+    # FastMCP has no public API to replace a custom route, swap the handlers in place
+    routes = mcp._additional_http_routes
+    for index, route in enumerate(routes):
+        if (
+            isinstance(route, Route)
+            and route.path.startswith(prefixes)
+            and route.methods
+            and route.methods & _RUNTIME_REGISTRATION_METHODS
+        ):
+            routes[index] = Route(
+                route.path, endpoint=refuse, methods=list(route.methods)
+            )
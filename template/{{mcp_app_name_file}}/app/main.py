@@ -12,24 +12,82 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
 import asyncio
 import errno
 import logging
 import os
+import signal
 import socket
 import sys
-from typing import Any
+import time
+from collections.abc import Callable
+from multiprocessing.sharedctypes import SynchronizedArray
+from multiprocessing.synchronize import Event
+from typing import Any, Optional, cast
 
 import requests
 from datarobot.errors import ClientError
-from datarobot_genai.drmcp import create_mcp_server, get_config
+from datarobot_genai.drmcp import (
+    DataRobotMCPServer,
+    MCPLogging,
+    create_mcp_server,
+    get_config,
+)
+from datarobot_genai.drmcp.core.mcp_instance import mcp
 
+from app import IMPORT_STARTED
+from app.core.batch import register_batch_tool
+from app.core.concurrency import ConcurrencyLimitMiddleware
+from app.core.drain import (
+    ToolCallDrainMiddleware,
+    get_drain_manager,
+    handle_sigterm,
+)
+from app.core.feature_metadata import register_feature_metadata_cache
+from app.core.lazy_tools import (
+    ToolManifest,
+    get_default_manifest_path,
+    get_user_tool_directories,
+    load_valid_tool_manifest,
+    register_lazy_tools,
+)
+from app.core.loop_monitor import get_loop_monitor, register_debug_routes
+from app.core.prediction_stream import register_prediction_file_tool
+from app.core.prediction_template import register_prediction_template
+from app.core.prediction_validation import register_prediction_validation
 from app.core.server_lifecycle import ServerLifecycle
-from app.core.user_config import get_user_config
+from app.core.sockets import (
+    bind_listening_socket,
+    get_inherited_socket,
+    serve_on_sockets,
+)
+from app.core.startup_profile import (
+    FirstRequestMiddleware,
+    StartupProfiler,
+    get_process_start_time,
+)
+from app.core.tool_catalog import register_tool_catalog
+from app.core.tool_discovery import (
+    DynamicToolRevalidationMiddleware,
+    get_tool_discovery,
+    record_runtime_registrations,
+)
+from app.core.training_sample import register_training_sample_tool
+from app.core.user_config import EventLoopType, get_user_config
 from app.core.user_credentials import get_user_credentials
+from app.core.validation import ArgumentValidationMiddleware
+from app.core.warmup import get_warmup_manager, register_health_routes
+from app.core.workers import WorkerSupervisor, disable_runtime_registration_routes
 
 logger = logging.getLogger(__name__)
 
+# End of the top-level imports, reported by the startup profile
+_IMPORTED = time.monotonic()
+
+# Seconds a worker may take to shut down on top of MCP_SERVER_DRAIN_TIMEOUT
+_WORKER_SHUTDOWN_GRACE_SECONDS = 10.0
+
 _CONNECTION_ERROR_MSG = "Could not reach DataRobot. Check your network connection and ensure VPN is connected, then try again."
 _AUTH_ERROR_MSG = (
     "DataRobot API authentication failed. Your API token may be expired or invalid. "
@@ -42,19 +100,6 @@ def _get_server_port() -> int:
     return get_config().mcp_server_port
 
 
-def _is_port_in_use(port: int, host: str = "0.0.0.0") -> bool:
-    """Return True if the given host:port is already in use (EADDRINUSE only)."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind((host, port))
-            return False
-        except OSError as e:
-            if e.errno == errno.EADDRINUSE:
-                logger.error("%s", _format_port_in_use_message(port))
-                return True
-            raise
-
-
 def _format_port_in_use_message(port: int) -> str:
     """Return a user-friendly message and commands for port-in-use errors."""
     return (
@@ -107,47 +152,128 @@ def handle_asyncio_exception(
         default_handler(context)
 
 
+def _get_uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's event loop factory, or None when uvloop is not installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return cast(Callable[[], asyncio.AbstractEventLoop], uvloop.new_event_loop)
+
+
 class CustomEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
-    """Custom event loop policy that sets exception handler for KeyboardInterrupt."""
+    """Custom event loop policy that sets exception handler for KeyboardInterrupt.
+
+    With ``event_loop="uvloop"`` loops are created by uvloop when it is installed;
+    otherwise the default asyncio loop is used.
+    """
+
+    def __init__(self, event_loop: EventLoopType = "asyncio") -> None:
+        super().__init__()
+        self._uvloop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None
+        if event_loop == "uvloop":
+            self._uvloop_factory = _get_uvloop_factory()
+            if self._uvloop_factory is None:
+                logger.warning(
+                    "MCP_SERVER_EVENT_LOOP=uvloop but uvloop is not installed, "
+                    "falling back to the asyncio event loop. "
+                    "Install it with the 'uvloop' extra."
+                )
+
+    @property
+    def loop_type(self) -> EventLoopType:
+        """Return the type of event loop created by this policy."""
+        return "uvloop" if self._uvloop_factory is not None else "asyncio"
 
     def new_event_loop(self) -> asyncio.AbstractEventLoop:
-        loop = super().new_event_loop()
+        if self._uvloop_factory is not None:
+            loop = self._uvloop_factory()
+        else:
+            loop = super().new_event_loop()
         loop.set_exception_handler(handle_asyncio_exception)
         return loop
 
 
-if __name__ == "__main__":
-    # Suppress KeyboardInterrupt tracebacks globally
-    sys.excepthook = suppress_keyboard_interrupt_traceback
+def _get_lazy_tool_manifest() -> Optional[ToolManifest]:
+    """Return the tool manifest to serve from in lazy mode, None for eager loading."""
+    user_config = get_user_config()
+    if not user_config.mcp_server_lazy_tools:
+        return None
+    return load_valid_tool_manifest(
+        user_config.mcp_server_tool_manifest_path or get_default_manifest_path(),
+        get_config(),
+        get_user_tool_directories(),
+    )
 
-    # Set custom event loop policy to handle KeyboardInterrupt in asyncio tasks
-    # even when the loop is created inside server.run()
-    asyncio.set_event_loop_policy(CustomEventLoopPolicy())
 
-    # Get paths to user modules
+def _create_server(
+    lifecycle: ServerLifecycle, profiler: StartupProfiler
+) -> DataRobotMCPServer:
+    """Create the MCP server with user extensions."""
     app_dir = os.path.dirname(__file__)
+    module_paths = [
+        (os.path.join(app_dir, "prompts"), "app.prompts"),
+        (os.path.join(app_dir, "resources"), "app.resources"),
+    ]
+    credentials_factory = profiler.wrap("get_user_credentials", get_user_credentials)
+    if profiler.enabled:
+        profiler.instrument_lifecycle(lifecycle)
+    manifest = _get_lazy_tool_manifest()
+    if (
+        get_user_config().mcp_server_dynamic_tools_incremental
+        and get_config().mcp_server_register_dynamic_tools_on_startup
+    ):
+        # Replaced by the registry restore and background refresh
+        logger.info("Deployment tools are discovered incrementally, skipping the scan")
+        get_config().mcp_server_register_dynamic_tools_on_startup = False
+    # Before the predictive tools are registered
+    register_feature_metadata_cache()
+    register_prediction_validation()
+    register_prediction_template()
+    with profiler.phase("create_server"):
+        server = create_mcp_server(
+            config_factory=get_user_config,
+            credentials_factory=credentials_factory,
+            lifecycle=lifecycle,
+            additional_module_paths=(
+                module_paths
+                if manifest is not None
+                else get_user_tool_directories() + module_paths
+            ),
+            transport="streamable-http",
+            load_native_mcp_tools=manifest is None,
+        )
+    if manifest is not None:
+        # Tool modules are imported on first call, register placeholders only
+        with profiler.phase("register_lazy_tools"):
+            register_lazy_tools(mcp, manifest)
+    register_health_routes(mcp, get_warmup_manager())
+    register_debug_routes(mcp, get_loop_monitor())
+    mcp.add_middleware(ToolCallDrainMiddleware(get_drain_manager()))
+    mcp.add_middleware(ArgumentValidationMiddleware())
+    user_config = get_user_config()
+    if user_config.mcp_server_dynamic_tools_incremental:
+        discovery = get_tool_discovery()
+        mcp.add_middleware(
+            DynamicToolRevalidationMiddleware(
+                discovery, user_config.mcp_server_dynamic_tools_max_age
+            )
+        )
+        record_runtime_registrations(mcp, discovery)
+    mcp.add_middleware(ConcurrencyLimitMiddleware())
+    register_batch_tool(mcp)
+    register_prediction_file_tool(mcp)
+    register_training_sample_tool(mcp)
+    register_tool_catalog(mcp)
+    return server
 
-    # Check if port is already in use before starting (avoids noisy traceback)
-    port = _get_server_port()
-    if _is_port_in_use(port):
-        sys.exit(1)
-
-    # Create server with user extensions
-    server = create_mcp_server(
-        config_factory=get_user_config,
-        credentials_factory=get_user_credentials,
-        lifecycle=ServerLifecycle(),
-        additional_module_paths=[
-            (os.path.join(app_dir, "tools"), "app.tools"),
-            (os.path.join(app_dir, "prompts"), "app.prompts"),
-            (os.path.join(app_dir, "resources"), "app.resources"),
-        ],
-        transport="streamable-http",
-        load_native_mcp_tools=True,
-    )
 
+def _run_server(server: DataRobotMCPServer, port: int, show_banner: bool) -> None:
+    """Run the server, turning common startup failures into friendly messages."""
+    # Let the server drain and run its shutdown hooks on SIGTERM
+    signal.signal(signal.SIGTERM, handle_sigterm)
     try:
-        server.run(show_banner=True)
+        server.run(show_banner=show_banner)
     except requests.exceptions.ConnectionError:
         # Handle before OSError: ConnectionError is a subclass of OSError; if we
         # caught OSError first we would re-raise (errno is None) and this would never run.
@@ -167,3 +293,153 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         # Exit cleanly on Ctrl+C without showing traceback
         sys.exit(0)
+
+
+def _install_exception_handlers() -> None:
+    """Install the KeyboardInterrupt-friendly exception hooks and event loop policy."""
+    # Suppress KeyboardInterrupt tracebacks globally
+    sys.excepthook = suppress_keyboard_interrupt_traceback
+
+    # Set custom event loop policy to handle KeyboardInterrupt in asyncio tasks
+    # even when the loop is created inside server.run()
+    asyncio.set_event_loop_policy(
+        CustomEventLoopPolicy(get_user_config().mcp_server_event_loop)
+    )
+
+
+def _create_profiler(worker_id: Optional[int] = None) -> StartupProfiler:
+    """Create the startup profiler, timing from the start of the process."""
+    process_started = get_process_start_time()
+    profiler = StartupProfiler(
+        worker_id=worker_id,
+        started=IMPORT_STARTED if process_started is None else process_started,
+    )
+    if process_started is not None:
+        profiler.record("interpreter_startup", process_started, IMPORT_STARTED)
+    profiler.record("import:app.main", IMPORT_STARTED, _IMPORTED)
+    return profiler
+
+
+def _load_config(profiler: StartupProfiler) -> None:
+    """Load the user and server configuration, timing the first (uncached) load."""
+    with profiler.phase("get_user_config"):
+        get_user_config()
+    with profiler.phase("get_config"):
+        get_config()
+
+
+def _enable_startup_profile(profiler: StartupProfiler) -> None:
+    """Turn on the startup report when MCP_SERVER_STARTUP_PROFILE is set."""
+    user_config = get_user_config()
+    if not user_config.mcp_server_startup_profile:
+        return
+    profiler.enable(
+        report_path=user_config.mcp_server_startup_profile_path,
+        cprofile_path=user_config.mcp_server_startup_profile_cprofile_path,
+    )
+    profiler.instrument_server()
+    mcp.add_middleware(FirstRequestMiddleware(profiler))
+
+
+def _serve_worker(
+    sock: socket.socket,
+    worker_id: int,
+    started: Event,
+    ready: "SynchronizedArray[int]",
+) -> None:
+    """Entry point of a worker process serving on the inherited listening socket."""
+    profiler = _create_profiler(worker_id)
+    _load_config(profiler)
+    _install_exception_handlers()
+    _enable_startup_profile(profiler)
+    get_warmup_manager().share_readiness(ready, worker_id)
+    serve_on_sockets(mcp, [sock])
+    server = _create_server(
+        ServerLifecycle(worker_id=worker_id, started=started), profiler
+    )
+    disable_runtime_registration_routes(mcp)
+    _run_server(server, port=sock.getsockname()[1], show_banner=worker_id == 0)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line value that must be an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the DataRobot MCP server.")
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes (overrides MCP_SERVER_WORKERS).",
+    )
+    return parser.parse_args(argv)
+
+
+def _open_listening_socket(port: int) -> socket.socket:
+    """Bind the listening socket once, or reuse one inherited from a process manager."""
+    user_config = get_user_config()
+    try:
+        sock = get_inherited_socket(user_config.mcp_server_socket_fd)
+        if sock is None:
+            sock = bind_listening_socket(
+                get_config().mcp_server_host,
+                port,
+                backlog=user_config.mcp_server_socket_backlog,
+                reuse_port=user_config.mcp_server_socket_reuse_port,
+            )
+    except OSError as e:
+        if e.errno == errno.EADDRINUSE:
+            logger.error("%s", _format_port_in_use_message(port))
+            sys.exit(1)
+        raise
+    return sock
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Start the MCP server in a single process or as a pool of workers."""
+    profiler = _create_profiler()
+    args = _parse_args(argv)
+    _load_config(profiler)
+    workers = (
+        args.workers
+        if args.workers is not None
+        else get_user_config().mcp_server_workers
+    )
+    _install_exception_handlers()
+    # The server configures logging again on creation; this covers the socket
+    # and worker supervisor logs emitted before that
+    MCPLogging(get_config().app_log_level)
+
+    # Bind once and hand the socket to uvicorn: a port already in use is reported
+    # without a traceback, and there is no window between a probe and the real bind
+    with _open_listening_socket(_get_server_port()) as sock:
+        port = sock.getsockname()[1]
+        if workers <= 1:
+            _enable_startup_profile(profiler)
+            serve_on_sockets(mcp, [sock])
+            server = _create_server(ServerLifecycle(), profiler)
+            _run_server(server, port=port, show_banner=True)
+            return
+
+        logger.info("Starting %s MCP server workers on port %s", workers, port)
+        supervisor = WorkerSupervisor(
+            _serve_worker,
+            sock,
+            workers,
+            # Leave workers time to drain and run their shutdown hooks
+            shutdown_timeout=get_user_config().mcp_server_drain_timeout
+            + _WORKER_SHUTDOWN_GRACE_SECONDS,
+        )
+        sys.exit(supervisor.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from app.core.batch import register_batch_tool
+from app.core.concurrency import ConcurrencyLimitMiddleware
+from app.core.user_config import UserAppConfig
+
+
+def _server(config: UserAppConfig) -> tuple[FastMCP, dict[str, int]]:
+    state = {"active": 0, "max_active": 0}
+    mcp = FastMCP("test")
+
+    @mcp.tool
+    async def lookup(key: str) -> dict[str, str]:
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return {"key": key, "value": key.upper()}
+
+    @mcp.tool
+    async def fail() -> str:
+        raise ToolError("lookup failed")
+
+    mcp.add_middleware(ConcurrencyLimitMiddleware(config))
+    register_batch_tool(mcp, config)
+    return mcp, state
+
+
+@pytest.mark.asyncio
+async def test_batch_call_returns_results_and_errors_in_order() -> None:
+    """Test invocations run concurrently under the limits, results in order."""
+    mcp, state = _server(
+        UserAppConfig(
+            MCP_SERVER_TOOL_CONCURRENCY_LIMITS="lookup=2",
+            MCP_SERVER_BATCH_MAX_CONCURRENCY=4,
+        )
+    )
+    calls = [{"name": "lookup", "arguments": {"key": f"k{i}"}} for i in range(6)]
+    calls.insert(2, {"name": "fail"})
+    calls.insert(4, {"name": "missing", "arguments": {}})
+    calls.append({"name": "batch_call", "arguments": {"calls": []}})
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("batch_call", {"calls": calls})
+
+    results = result.structured_content["results"]
+    assert [r["name"] for r in results] == [c["name"] for c in calls]
+    assert [r["is_error"] for r in results] == [
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert results[0]["structured_content"] == {"key": "k0", "value": "K0"}
+    assert results[7]["structured_content"] == {"key": "k5", "value": "K5"}
+    assert "lookup failed" in results[2]["error"]
+    assert "missing" in results[4]["error"]
+    assert "cannot be nested" in results[8]["error"]
+    assert result.structured_content["failed"] == 3
+    assert result.structured_content["succeeded"] == 6
+    # The per-tool limit applies to the invocations of the batch
+    assert state["max_active"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_call_size_limit_and_disabled() -> None:
+    """Test oversized batches are rejected, and the tool can be disabled."""
+    mcp, _ = _server(UserAppConfig(MCP_SERVER_BATCH_MAX_CALLS=2))
+    async with Client(mcp) as client:
+        with pytest.raises(ToolError, match="at most 2 calls"):
+            await client.call_tool("batch_call", {"calls": [{"name": "lookup"}] * 3})
+
+    mcp, _ = _server(UserAppConfig(MCP_SERVER_BATCH_TOOL_ENABLED=False))
+    async with Client(mcp) as client:
+        assert "batch_call" not in [tool.name for tool in await client.list_tools()]
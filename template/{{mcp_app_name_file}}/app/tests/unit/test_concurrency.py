@@ -0,0 +1,144 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from app.core.concurrency import (
+    ConcurrencyLimitMiddleware,
+    concurrency_limit,
+    parse_concurrency_limits,
+)
+from app.core.user_config import UserAppConfig
+
+
+def test_parse_concurrency_limits() -> None:
+    """Test tool and tag limits are parsed, and invalid entries rejected."""
+    assert parse_concurrency_limits("") == {}
+    assert parse_concurrency_limits(" predict=4, tag:user=16,tool:other=1 ") == {
+        "tool:predict": 4,
+        "tag:user": 16,
+        "tool:other": 1,
+    }
+    for spec in ("predict", "predict=0", "predict=many", "=3"):
+        with pytest.raises(ValueError):
+            parse_concurrency_limits(spec)
+
+
+def _server(config: UserAppConfig) -> tuple[FastMCP, ConcurrencyLimitMiddleware]:
+    release = asyncio.Event()
+    mcp = FastMCP("test")
+
+    @mcp.tool(tags={"user", "slow"})
+    async def slow() -> str:
+        await release.wait()
+        return "done"
+
+    @mcp.tool(tags={"user"})
+    async def fast() -> str:
+        return "done"
+
+    @mcp.tool
+    async def untagged() -> str:
+        return "done"
+
+    middleware = ConcurrencyLimitMiddleware(config)
+    mcp.add_middleware(middleware)
+    mcp.release = release  # type: ignore[attr-defined]
+    return mcp, middleware
+
+
+@pytest.mark.asyncio
+async def test_queue_full_calls_are_rejected_with_retry_after() -> None:
+    """Test calls over the limit queue, and are rejected once the queue is full."""
+    mcp, middleware = _server(
+        UserAppConfig(
+            MCP_SERVER_TOOL_CONCURRENCY_LIMITS="slow=2",
+            MCP_SERVER_TOOL_QUEUE_SIZE=1,
+        )
+    )
+    async with Client(mcp) as client:
+        calls = [asyncio.create_task(client.call_tool("slow", {})) for _ in range(3)]
+        await asyncio.sleep(0.1)
+        stats = middleware.stats()["tool:slow"]
+        assert stats["in_flight"] == 2
+        assert stats["waiting"] == 1
+
+        with pytest.raises(ToolError, match="at capacity.*retry after 1s"):
+            await client.call_tool("slow", {})
+        # Other tools are not limited
+        assert (await client.call_tool("untagged", {})).data == "done"
+
+        mcp.release.set()  # type: ignore[attr-defined]
+        results = await asyncio.gather(*calls)
+
+    assert [result.data for result in results] == ["done"] * 3
+    stats = middleware.stats()["tool:slow"]
+    assert stats["admitted"] == 3
+    assert stats["queued"] == 1
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
+    assert "tool:untagged" not in middleware.stats()
+
+
+@pytest.mark.asyncio
+async def test_tag_limit_and_queue_timeout() -> None:
+    """Test tag limits are shared by tools, and queued calls time out."""
+    mcp, middleware = _server(
+        UserAppConfig(
+            MCP_SERVER_TOOL_CONCURRENCY_LIMITS="tag:user=1",
+            MCP_SERVER_TOOL_QUEUE_TIMEOUT=0.1,
+        )
+    )
+    async with Client(mcp) as client:
+        blocked = asyncio.create_task(client.call_tool("slow", {}))
+        await asyncio.sleep(0.1)
+        with pytest.raises(ToolError, match="timed out waiting for a slot of tag:user"):
+            await client.call_tool("fast", {})
+        mcp.release.set()  # type: ignore[attr-defined]
+        await blocked
+        assert (await client.call_tool("fast", {})).data == "done"
+
+    stats = middleware.stats()["tag:user"]
+    assert stats["timed_out"] == 1
+    assert stats["admitted"] == 2
+    assert stats["total_wait_seconds"] >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_declared_limit_is_overridden_by_config() -> None:
+    """Test the concurrency_limit decorator applies unless configured."""
+    with patch("app.core.concurrency._declared_limits", {}):
+        concurrency_limit(5, name="slow")(lambda: None)
+        mcp, middleware = _server(UserAppConfig())
+        async with Client(mcp) as client:
+            await client.call_tool("fast", {})
+            mcp.release.set()  # type: ignore[attr-defined]
+            await client.call_tool("slow", {})
+        assert middleware.stats()["tool:slow"]["limit"] == 5
+
+        mcp, middleware = _server(
+            UserAppConfig(MCP_SERVER_TOOL_CONCURRENCY_LIMITS="slow=1")
+        )
+        async with Client(mcp) as client:
+            mcp.release.set()  # type: ignore[attr-defined]
+            await client.call_tool("slow", {})
+        assert middleware.stats()["tool:slow"]["limit"] == 1
+
+    with pytest.raises(ValueError):
+        concurrency_limit(0)
@@ -0,0 +1,152 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from datarobot_genai.drmcpbase.dynamic_tools.external_tool import (
+    ExternalToolRegistrationConfig,
+)
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools import Tool
+
+from app.core.deployment_proxy import DeploymentProxy, deployment_tool_callable
+from app.core.user_config import UserAppConfig
+
+
+def _proxy(handler: httpx.MockTransport, **settings: Any) -> DeploymentProxy:
+    config = UserAppConfig(MCP_SERVER_DEPLOYMENT_PROXY_BACKOFF=0, **settings)
+    return DeploymentProxy(config, client=httpx.AsyncClient(transport=handler))
+
+
+@pytest.mark.asyncio
+async def test_retries_and_circuit_breaker() -> None:
+    """Test transient errors are retried and a failing deployment fails fast."""
+    responses = [503, 429, 200]
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        status = responses.pop(0) if responses else 500
+        if status == 500:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(status, json={"ok": status == 200})
+
+    proxy = _proxy(
+        httpx.MockTransport(handler),
+        MCP_SERVER_DEPLOYMENT_PROXY_RETRIES=2,
+        MCP_SERVER_DEPLOYMENT_PROXY_BREAKER_THRESHOLD=2,
+    )
+    url = "https://example.com/predApi/v1.0/deployments/d/predictions"
+    response = await proxy.request("score", "d", "POST", url, json={"a": 1})
+    assert response.status_code == 200
+    assert len(requests) == 3
+
+    # Two calls failing after their retries open the circuit
+    for _ in range(2):
+        with pytest.raises(ToolError, match="ConnectError"):
+            await proxy.request("score", "d", "POST", url)
+    assert proxy.circuits() == {"d": "open"}
+    with pytest.raises(ToolError, match="calls are suspended"):
+        await proxy.request("score", "d", "POST", url)
+    assert len(requests) == 9
+
+    # After the reset timeout one trial call closes the circuit again
+    responses.append(200)
+    with patch.object(proxy._breakers["d"], "_reset_timeout", 0):
+        assert proxy.circuits() == {"d": "half_open"}
+        await proxy.request("score", "d", "POST", url)
+    assert proxy.circuits() == {"d": "closed"}
+
+    stats = proxy.stats()["score"]
+    assert stats | {"p50_seconds": None, "p99_seconds": None} == {
+        "calls": 4,
+        "failures": 2,
+        "retries": 6,
+        "rejected": 1,
+        "p50_seconds": None,
+        "p99_seconds": None,
+    }
+    assert 0 < stats["p50_seconds"] <= stats["p99_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_deployment_tool_calls_through_proxy() -> None:
+    """Test a proxied tool sends the same request as the library's tools."""
+    received: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        if request.url.path.endswith("/missing/predictions"):
+            return httpx.Response(404, text="Deployment not found")
+        return httpx.Response(
+            200,
+            content=b'{"data": [{"prediction": 1.5}]}',
+            headers={"content-type": "application/json; charset=utf-8"},
+        )
+
+    proxy = _proxy(httpx.MockTransport(handler))
+    spec = ExternalToolRegistrationConfig(
+        name="score",
+        description="Score rows",
+        method="POST",
+        base_url="https://example.com/predApi/v1.0/",
+        endpoint="deployments/{deployment_id}/predictions",
+        headers={"datarobot-key": "key"},
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path_params": {
+                    "type": "object",
+                    "properties": {"deployment_id": {"type": "string"}},
+                    "required": ["deployment_id"],
+                },
+                "json": {
+                    "type": "object",
+                    "properties": {"rows": {"type": "array"}},
+                },
+            },
+        },
+    )
+    server = FastMCP("test")
+    server.add_tool(Tool.from_function(deployment_tool_callable(spec, "d", proxy)))
+
+    async with Client(server) as client:
+        result = await client.call_tool(
+            "call_deployment",
+            {
+                "inputs": {
+                    "path_params": {"deployment_id": "d"},
+                    "json": {"rows": [1]},
+                }
+            },
+        )
+        with pytest.raises(Exception, match="HTTP 404 error from deployment"):
+            await client.call_tool(
+                "call_deployment",
+                {"inputs": {"path_params": {"deployment_id": "missing"}}},
+            )
+
+    assert "1.5" in str(result.structured_content)
+    request = received[0]
+    assert str(request.url) == (
+        "https://example.com/predApi/v1.0/deployments/d/predictions"
+    )
+    assert request.headers["datarobot-key"] == "key"
+    assert json.loads(request.content) == {"rows": [1]}
+    assert proxy.stats()["score"]["calls"] == 2
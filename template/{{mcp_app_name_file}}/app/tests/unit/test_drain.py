@@ -0,0 +1,146 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import signal
+from collections.abc import Iterator
+from types import FrameType
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from mcp.shared.exceptions import McpError
+
+from app.core.drain import DrainManager, ToolCallDrainMiddleware, handle_sigterm
+
+
+@pytest.fixture(autouse=True)
+def mock_warmup_manager() -> Iterator[MagicMock]:
+    """Replace the warm-up manager marked as draining."""
+    manager = MagicMock()
+    with patch("app.core.drain.get_warmup_manager", return_value=manager):
+        yield manager
+
+
+@pytest.fixture
+def restore_signal_handlers() -> Iterator[None]:
+    """Restore the SIGTERM and SIGINT handlers after the test."""
+    previous = {s: signal.getsignal(s) for s in (signal.SIGTERM, signal.SIGINT)}
+    yield
+    for signum, handler in previous.items():
+        signal.signal(signum, handler)
+
+
+def _slow_server(drain_manager: DrainManager, release: asyncio.Event) -> FastMCP:
+    mcp = FastMCP("test")
+    mcp.add_middleware(ToolCallDrainMiddleware(drain_manager))
+
+    @mcp.tool
+    async def slow() -> str:
+        """Wait until released."""
+        await release.wait()
+        return "done"
+
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_in_flight_calls(mock_warmup_manager: MagicMock) -> None:
+    """Test in-flight calls complete while new sessions are refused."""
+    drain_manager = DrainManager()
+    release = asyncio.Event()
+    mcp = _slow_server(drain_manager, release)
+
+    async with Client(mcp) as client:
+        call = asyncio.create_task(client.call_tool("slow", {}))
+        while drain_manager.in_flight == 0:
+            await asyncio.sleep(0.01)
+
+        drain_manager.begin()
+        mock_warmup_manager.mark_draining.assert_called_once_with()
+        with pytest.raises(McpError, match="shutting down"):
+            async with Client(mcp):
+                pass
+        assert not await drain_manager.wait(timeout=0.05)
+
+        release.set()
+        assert (await call).data == "done"
+
+    assert await drain_manager.wait(timeout=1)
+    report = drain_manager.report()
+    assert report["waited_on"] == 1
+    assert report["completed"] == 1
+    assert report["cancelled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calls_are_reported() -> None:
+    """Test calls cut off by the drain deadline are counted as cancelled."""
+    drain_manager = DrainManager()
+
+    async def call() -> None:
+        with drain_manager.track_call():
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    drain_manager.begin()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert drain_manager.in_flight == 0
+    assert drain_manager.report()["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("restore_signal_handlers")
+async def test_signal_forwarded_after_drain() -> None:
+    """Test the server's SIGTERM handler only runs once the in-flight calls are done."""
+    forwarded: list[int] = []
+
+    def uvicorn_handler(signum: int, frame: Optional[FrameType]) -> None:
+        forwarded.append(signum)
+
+    signal.signal(signal.SIGTERM, uvicorn_handler)
+    drain_manager = DrainManager()
+    drain_manager.install_signal_handlers(timeout=5)
+    release = asyncio.Event()
+
+    async def call() -> None:
+        with drain_manager.track_call():
+            await release.wait()
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    signal.raise_signal(signal.SIGTERM)
+    await asyncio.sleep(0.05)
+    assert drain_manager.draining
+    assert forwarded == []
+
+    release.set()
+    await task
+    await asyncio.sleep(0.05)
+    assert forwarded == [signal.SIGTERM]
+
+
+def test_handle_sigterm() -> None:
+    """Test SIGTERM stops a starting server but is ignored once drained."""
+    drain_manager = DrainManager()
+    with patch("app.core.drain.get_drain_manager", return_value=drain_manager):
+        with pytest.raises(KeyboardInterrupt):
+            handle_sigterm(signal.SIGTERM, None)
+        drain_manager.begin()
+        handle_sigterm(signal.SIGTERM, None)
@@ -0,0 +1,111 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from app.core.executors import ExecutorManager, run_in_executor
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.user_config import UserAppConfig
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+def _worker_pid(value: int) -> tuple[int, int]:
+    return os.getpid(), value * 2
+
+
+@pytest.fixture
+def manager() -> Iterator[ExecutorManager]:
+    manager = ExecutorManager(
+        UserAppConfig(MCP_SERVER_EXECUTOR_THREADS=2, MCP_SERVER_EXECUTOR_PROCESSES=1)
+    )
+    with patch("app.core.executors._executor_manager", manager):
+        yield manager
+    manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_propagates_context(manager: ExecutorManager) -> None:
+    """Test blocking tools run off the loop thread with the caller's contextvars."""
+
+    @run_in_executor("thread")
+    def blocking(value: int) -> tuple[str, str, int]:
+        time.sleep(0.05)
+        return threading.current_thread().name, request_id.get(), value
+
+    request_id.set("abc")
+    thread_name, seen_request_id, value = await blocking(value=3)
+    assert thread_name.startswith("mcp-tool")
+    assert seen_request_id == "abc"
+    assert value == 3
+    assert manager.stats()["thread"] == {
+        "max_workers": 2,
+        "in_flight": 0,
+        "completed": 1,
+        "failed": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_does_not_block_the_loop(
+    manager: ExecutorManager,
+) -> None:
+    """Test the loop keeps running, and failures are counted, while tools block."""
+
+    @run_in_executor()
+    def blocking() -> None:
+        time.sleep(0.2)
+        raise ValueError("failed")
+
+    monitor = LoopLagMonitor()
+    monitor.start(0.01)
+    with pytest.raises(ValueError):
+        await blocking()
+    await monitor.stop()
+    assert monitor.stats()["samples"] >= 5
+    assert monitor.stats()["max_lag_seconds"] < 0.1
+    assert manager.stats()["thread"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_executor(manager: ExecutorManager) -> None:
+    """Test module level functions run in the spawned process pool."""
+    pid, value = await manager.run("process", _worker_pid, 21)
+    assert pid != os.getpid()
+    assert value == 42
+    assert manager.stats()["process"]["completed"] == 1
+
+
+def test_run_in_executor_rejects_unsupported_functions() -> None:
+    """Test async functions, local functions in processes and unknown kinds."""
+
+    async def coroutine() -> None:
+        pass
+
+    def local() -> None:
+        pass
+
+    with pytest.raises(TypeError):
+        run_in_executor()(coroutine)
+    with pytest.raises(TypeError):
+        run_in_executor("process")(local)
+    with pytest.raises(ValueError):
+        run_in_executor("fiber")  # type: ignore[arg-type]
@@ -0,0 +1,162 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import importlib
+import inspect
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from datarobot_genai.drtools.core.tool_metadata import _TOOL_REGISTRY
+
+from app.core.feature_metadata import (
+    DEPLOYMENT_INFO_MODULE,
+    FeatureMetadataCache,
+    register_feature_metadata_cache,
+)
+from app.core.user_config import UserAppConfig
+
+
+@pytest.fixture
+def deployments() -> Iterator[dict[str, str]]:
+    """Model served by each deployment, and the caller's token."""
+    state = {"d": "model_1", "token": "token_a"}
+    with (
+        patch(
+            "app.core.feature_metadata.get_datarobot_access_token",
+            side_effect=lambda **_: state["token"],
+        ),
+        patch(
+            "app.core.feature_metadata._current_model_id",
+            side_effect=lambda deployment_id: state[deployment_id],
+        ),
+    ):
+        yield state
+
+
+@pytest.mark.asyncio
+async def test_single_flight_and_model_replacement(deployments: dict[str, str]) -> None:
+    """Test concurrent lookups share a fetch, refetched when the model changes."""
+    cache = FeatureMetadataCache(
+        UserAppConfig(MCP_SERVER_FEATURE_METADATA_CHECK_INTERVAL=60)
+    )
+    loads = {"count": 0}
+
+    async def load() -> dict[str, Any]:
+        loads["count"] += 1
+        await asyncio.sleep(0.01)
+        return {"features": [{"name": "x", "version": loads["count"]}]}
+
+    results = await asyncio.gather(*(cache.get("d", load) for _ in range(4)))
+    assert loads["count"] == 1
+    assert all(result == results[0] for result in results)
+    # Callers get copies
+    results[0]["features"].clear()
+    assert (await cache.get("d", load))["features"][0]["version"] == 1
+
+    # Another caller never reuses the metadata fetched with other credentials
+    deployments["token"] = "token_b"
+    await cache.get("d", load)
+    assert loads["count"] == 2
+    deployments["token"] = "token_a"
+
+    # Past the check interval, only the deployed model is fetched
+    with patch.object(cache, "_check_interval", 0):
+        await cache.get("d", load)
+        assert loads["count"] == 2
+        deployments["d"] = "model_2"
+        assert (await cache.get("d", load))["features"][0]["version"] == 3
+
+    # A prediction served by another model drops the entries at once
+    cache.observe_model("d", "model_2")
+    await cache.get("d", load)
+    cache.observe_model("d", "model_3")
+    await cache.get("d", load)
+    assert loads["count"] == 4
+
+    async def fail() -> dict[str, Any]:
+        raise RuntimeError("DataRobot unavailable")
+
+    cache.invalidate("d")
+    with pytest.raises(RuntimeError):
+        await cache.get("d", fail)
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 5,
+        "shared": 3,
+        "checks": 1,
+        "invalidations": 2,
+        "entries": 0,
+    }
+
+
+@pytest.fixture
+def deployment_info() -> Iterator[Any]:
+    """The library's deployment info tools, restored after the test."""
+    module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+    original, registry = module.deployment_get_info, list(_TOOL_REGISTRY)
+    deployment = MagicMock(model={"id": "model_1", "project_id": None})
+    deployment.get_features.return_value = [
+        {"name": "temperature", "feature_type": "numeric", "importance": 0.8},
+        {"name": "promotion", "feature_type": "categorical", "importance": 0.2},
+    ]
+    with (
+        patch.object(module, "dr") as dr,
+        patch.object(module, "ThreadSafeDataRobotClient"),
+    ):
+        dr.Deployment.get.return_value = deployment
+        yield module
+    module.deployment_get_info = original
+    _TOOL_REGISTRY[:] = registry
+
+
+@pytest.mark.asyncio
+async def test_deployment_info_tools_share_one_fetch(
+    deployment_info: Any, deployments: dict[str, str]
+) -> None:
+    """Test the agent workflow of docs/deployment_info_tools.md fetches once."""
+    tool = next(f for f, _ in _TOOL_REGISTRY if f.__name__ == "deployment_get_info")
+    with (
+        patch(
+            "app.core.feature_metadata.get_config",
+            return_value=MagicMock(),
+        ),
+        patch("app.core.feature_metadata.is_tool_enabled", return_value=True),
+    ):
+        cache = register_feature_metadata_cache(UserAppConfig())
+        assert register_feature_metadata_cache() is cache
+    registered = next(
+        f for f, _ in _TOOL_REGISTRY if f.__name__ == "deployment_get_info"
+    )
+    assert registered is not tool
+    assert inspect.signature(registered) == inspect.signature(tool)
+
+    with patch("app.core.feature_metadata._current_model_id") as current_model_id:
+        info = await registered(deployment_id="d")
+        features = await deployment_info.deployment_get_features(deployment_id="d")
+        sample = await deployment_info.deployment_generate_prediction_sample(
+            deployment_id="d"
+        )
+        report = await deployment_info.deployment_validate_prediction_data(
+            deployment_id="d", csv_string="temperature,promotion\n21.5,yes\n"
+        )
+
+    assert deployment_info.dr.Deployment.get.call_count == 1
+    current_model_id.assert_not_called()
+    assert [f["name"] for f in info["features"]] == ["temperature", "promotion"]
+    assert features["features"] == info["features"]
+    assert list(sample["template_data"][0]) == ["temperature", "promotion"]
+    assert report["status"] == "valid"
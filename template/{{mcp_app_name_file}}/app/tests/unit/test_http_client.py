@@ -0,0 +1,143 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.dependencies import Depends
+
+from app.core.http_client import (
+    HostLimitedTransport,
+    HttpClientPool,
+    get_http_client,
+    prime_http_client,
+)
+from app.core.user_config import UserAppConfig
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_and_saturation() -> None:
+    """Test concurrent requests to one host are capped and saturation counted."""
+    release = asyncio.Event()
+    active = 0
+    max_active = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await release.wait()
+        active -= 1
+        return httpx.Response(200)
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), per_host_limit=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        requests = [
+            asyncio.create_task(client.get("https://a.example.com/")) for _ in range(5)
+        ]
+        await asyncio.sleep(0.05)
+        stats = transport.stats()["a.example.com"]
+        assert stats.in_flight == 2
+        assert stats.waiting == 3
+        release.set()
+        await asyncio.gather(*requests)
+
+    stats = transport.stats()["a.example.com"]
+    assert max_active == 2
+    assert stats.requests == 5
+    assert stats.saturated_requests == 3
+    assert stats.in_flight == 0
+    assert stats.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_hosts_are_limited_independently() -> None:
+    """Test a saturated host does not block requests to another host."""
+    blocked = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.example.com":
+            await blocked.wait()
+        return httpx.Response(200)
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), per_host_limit=1)
+    async with httpx.AsyncClient(transport=transport) as client:
+        slow = asyncio.create_task(client.get("https://slow.example.com/"))
+        await asyncio.sleep(0)
+        response = await asyncio.wait_for(client.get("https://fast.example.com/"), 1)
+        assert response.status_code == 200
+        blocked.set()
+        await slow
+
+
+@pytest.mark.asyncio
+async def test_pool_lifecycle() -> None:
+    """Test the client is only available between start and aclose."""
+    pool = HttpClientPool()
+    with pytest.raises(RuntimeError):
+        pool.client
+
+    client = pool.start(UserAppConfig())
+    assert pool.started
+    assert pool.start() is client
+    assert pool.stats() == {}
+
+    await pool.aclose()
+    assert not pool.started
+    assert client.is_closed
+
+
+def test_http2_falls_back_without_h2() -> None:
+    """Test HTTP/2 is only enabled when the h2 package is installed."""
+    pool = HttpClientPool()
+    with (
+        patch("app.core.http_client._http2_available", return_value=False),
+        patch("app.core.http_client.httpx.AsyncHTTPTransport") as mock_transport,
+    ):
+        pool.start(UserAppConfig(MCP_SERVER_HTTP_CLIENT_HTTP2=True))
+    assert mock_transport.call_args.kwargs["http2"] is False
+
+
+@pytest.mark.asyncio
+async def test_prime_http_client_skipped_when_not_started() -> None:
+    """Test the warm-up task does nothing without a started client."""
+    with patch(
+        "app.core.http_client.get_http_client_pool", return_value=HttpClientPool()
+    ):
+        await prime_http_client(MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_dependency_keeps_client_open() -> None:
+    """Test tools injecting the shared client do not close it after the call."""
+    pool = HttpClientPool()
+    client = pool.start(UserAppConfig())
+    mcp = FastMCP("test")
+
+    @mcp.tool
+    async def uses_client(
+        http: httpx.AsyncClient = Depends(get_http_client),
+    ) -> bool:
+        return http is client
+
+    with patch("app.core.http_client.get_http_client_pool", return_value=pool):
+        async with Client(mcp) as mcp_client:
+            result = await mcp_client.call_tool("uses_client", {})
+            assert result.data is True
+            await mcp_client.call_tool("uses_client", {})
+    assert not client.is_closed
+    await pool.aclose()
@@ -0,0 +1,194 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp import FastMCP
+
+from app.core.lazy_tools import (
+    LazyTool,
+    ToolManifest,
+    ToolModule,
+    build_tool_manifest,
+    discover_tool_modules,
+    load_tool_manifest,
+    load_valid_tool_manifest,
+    register_lazy_tools,
+    save_tool_manifest,
+)
+
+_SERVER_MODULE = "lazy_tools_test_server"
+_TOOLS_MODULE = "lazy_tools_test_tools"
+
+
+@pytest.fixture
+def tool_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[FastMCP]:
+    """Write a tool module registering on a test server, without importing it."""
+    (tmp_path / f"{_SERVER_MODULE}.py").write_text(
+        "from fastmcp import FastMCP\nmcp = FastMCP('lazy-tools-test')\n"
+    )
+    (tmp_path / f"{_TOOLS_MODULE}.py").write_text(
+        textwrap.dedent(
+            f"""
+            import os
+
+            from {_SERVER_MODULE} import mcp
+
+            @mcp.tool(tags={{"example"}})
+            def add(a: int, b: int) -> int:
+                '''Add two numbers.'''
+                return a + b
+
+            @mcp.tool
+            def echo(text: str) -> str:
+                '''Return the text.'''
+                return text
+
+            if os.environ.get("LAZY_TOOLS_TEST_IMPORT_ERROR"):
+                raise RuntimeError("import failed")
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    server = __import__(_SERVER_MODULE).mcp
+    yield server
+    for name in (_SERVER_MODULE, _TOOLS_MODULE):
+        sys.modules.pop(name, None)
+
+
+def _fresh_server() -> FastMCP:
+    # Replace the test server so that the tools module registers on an empty one
+    sys.modules.pop(_TOOLS_MODULE, None)
+    server = FastMCP("lazy-tools-test")
+    sys.modules[_SERVER_MODULE].mcp = server  # type: ignore[attr-defined]
+    return server
+
+
+@pytest.mark.asyncio
+async def test_build_tool_manifest(tool_module: FastMCP, tmp_path: Path) -> None:
+    """Test tools are attributed to the module that registers them."""
+    manifest = await build_tool_manifest(
+        tool_module, Mock(), [ToolModule(name=_TOOLS_MODULE)]
+    )
+
+    assert [(t.name, t.module) for t in manifest.tools] == [
+        ("add", _TOOLS_MODULE),
+        ("echo", _TOOLS_MODULE),
+    ]
+    assert manifest.tools[0].tags == ["example"]
+    assert manifest.tools[0].parameters["required"] == ["a", "b"]
+    assert manifest.import_seconds[_TOOLS_MODULE] >= 0
+
+    path = str(tmp_path / "manifest.json")
+    save_tool_manifest(manifest, path)
+    assert load_tool_manifest(path) == manifest
+
+
+@pytest.mark.asyncio
+async def test_lazy_tool_imports_module_on_first_call(tool_module: FastMCP) -> None:
+    """Test placeholders are listed without importing and resolved on first call."""
+    with patch("app.core.lazy_tools.get_enabled_tool_types", return_value=[]):
+        manifest = await build_tool_manifest(
+            tool_module, Mock(), [ToolModule(name=_TOOLS_MODULE)]
+        )
+    server = _fresh_server()
+
+    loader = register_lazy_tools(server, manifest)
+
+    tools = {tool.name: tool for tool in await server.list_tools()}
+    assert set(tools) == {"add", "echo"}
+    assert all(isinstance(tool, LazyTool) for tool in tools.values())
+    assert tools["add"].description == "Add two numbers."
+    assert _TOOLS_MODULE not in sys.modules
+
+    result = await server.call_tool("add", {"a": 1, "b": 2})
+
+    assert result.structured_content == {"result": 3}
+    assert loader.loaded_modules == {_TOOLS_MODULE}
+    tools = {tool.name: tool for tool in await server.list_tools()}
+    assert not any(isinstance(tool, LazyTool) for tool in tools.values())
+    echo = await server.call_tool("echo", {"text": "hi"})
+    assert echo.structured_content == {"result": "hi"}
+
+
+@pytest.mark.asyncio
+async def test_failed_import_restores_placeholders(
+    tool_module: FastMCP, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a failed import keeps the tools listed and is retried on next call."""
+    manifest = await build_tool_manifest(
+        tool_module, Mock(), [ToolModule(name=_TOOLS_MODULE)]
+    )
+    server = _fresh_server()
+    loader = register_lazy_tools(server, manifest)
+    monkeypatch.setenv("LAZY_TOOLS_TEST_IMPORT_ERROR", "1")
+
+    with pytest.raises(Exception, match="import failed"):
+        await server.call_tool("add", {"a": 1, "b": 2})
+
+    tools = {tool.name: tool for tool in await server.list_tools()}
+    assert set(tools) == {"add", "echo"}
+    assert all(isinstance(tool, LazyTool) for tool in tools.values())
+    assert loader.loaded_modules == set()
+
+    monkeypatch.delenv("LAZY_TOOLS_TEST_IMPORT_ERROR")
+    result = await server.call_tool("add", {"a": 1, "b": 2})
+    assert result.structured_content == {"result": 3}
+    assert loader.loaded_modules == {_TOOLS_MODULE}
+
+
+def test_load_valid_tool_manifest(tool_module: FastMCP, tmp_path: Path) -> None:
+    """Test a missing or stale manifest falls back to eager loading."""
+    path = str(tmp_path / "manifest.json")
+    tool_directories = [(str(tmp_path), "lazy")]
+    with (
+        patch("app.core.lazy_tools.is_tool_enabled", return_value=False),
+        patch("app.core.lazy_tools.get_enabled_tool_types", return_value=[]),
+    ):
+        assert load_valid_tool_manifest(path, Mock(), tool_directories) is None
+
+        modules = discover_tool_modules(Mock(), tool_directories)
+        manifest = ToolManifest(
+            enabled_tool_types=[],
+            modules={module.name: module for module in modules},
+            import_seconds={},
+            tools=[],
+        )
+        save_tool_manifest(manifest, path)
+        assert load_valid_tool_manifest(path, Mock(), tool_directories) == manifest
+
+        # A tool module changed after the manifest was generated
+        with open(tmp_path / f"{_TOOLS_MODULE}.py", "a") as f:
+            f.write("\n# changed\n")
+        assert load_valid_tool_manifest(path, Mock(), tool_directories) is None
+
+        # A tool module was added
+        manifest.modules = {
+            module.name: module
+            for module in discover_tool_modules(Mock(), tool_directories)
+        }
+        save_tool_manifest(manifest, path)
+        (tmp_path / "new_tools.py").write_text("")
+        assert load_valid_tool_manifest(path, Mock(), tool_directories) is None
+
+    with (
+        patch("app.core.lazy_tools.is_tool_enabled", return_value=False),
+        patch("app.core.lazy_tools.get_enabled_tool_types", return_value=["jira"]),
+    ):
+        assert load_valid_tool_manifest(path, Mock(), tool_directories) is None
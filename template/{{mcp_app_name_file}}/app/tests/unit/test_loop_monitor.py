@@ -0,0 +1,83 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+from fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from app.core.loop_monitor import LoopLagMonitor, SlowCallback, register_debug_routes
+
+
+def _blocking_tool() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_measures_blocking_callbacks() -> None:
+    """Test the lag and the task and stack of a callback blocking the loop."""
+    monitor = LoopLagMonitor()
+    monitor.start(0.01, slow_callback_threshold=0.1, sample_stacks=True)
+
+    async def handler() -> None:
+        _blocking_tool()
+
+    await asyncio.sleep(0.05)
+    await asyncio.create_task(handler(), name="tools/call")
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert not monitor.running
+    stats = monitor.stats()
+    assert stats["max_lag_seconds"] >= 0.2
+    assert stats["slow_callbacks"] == 1
+    [slow_callback] = monitor.slow_callbacks()
+    assert slow_callback["blocked_seconds"] >= 0.2
+    assert "tools/call" in slow_callback["task"]
+    assert "handler" in slow_callback["task"]
+    assert "_blocking_tool" in "".join(slow_callback["stack"])
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_without_watchdog() -> None:
+    """Test slow callbacks are not tracked with a zero threshold."""
+    monitor = LoopLagMonitor()
+    monitor.start(0.01)
+    await asyncio.sleep(0.02)
+    time.sleep(0.15)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+    assert monitor.stats()["max_lag_seconds"] >= 0.1
+    assert monitor.stats()["slow_callbacks"] == 0
+
+
+def test_debug_loop_route_is_local_only() -> None:
+    """Test /debug/loop serves the monitor data to local clients only."""
+    monitor = LoopLagMonitor()
+    monitor.record(0.5)
+    monitor.record_slow_callback(
+        SlowCallback(detected_at=1.0, blocked_seconds=0.5, task="t", stack=None)
+    )
+    mcp = FastMCP("test")
+    register_debug_routes(mcp, monitor)
+
+    response = TestClient(mcp.http_app(), client=("127.0.0.1", 5000)).get("/debug/loop")
+    assert response.status_code == 200
+    assert response.json()["max_lag_seconds"] == 0.5
+    assert response.json()["recent_slow_callbacks"][0]["task"] == "t"
+
+    response = TestClient(mcp.http_app(), client=("10.1.2.3", 5000)).get("/debug/loop")
+    assert response.status_code == 403
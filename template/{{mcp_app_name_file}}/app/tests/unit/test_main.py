@@ -0,0 +1,174 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.sockets import bind_listening_socket
+from app.main import (
+    CustomEventLoopPolicy,
+    _open_listening_socket,
+    _parse_args,
+    _serve_worker,
+    handle_asyncio_exception,
+    main,
+)
+
+
+@pytest.fixture
+def user_config() -> Iterator[MagicMock]:
+    """Replace the user and server configuration read by app.main."""
+    config = MagicMock(
+        mcp_server_socket_fd=None,
+        mcp_server_socket_backlog=16,
+        mcp_server_socket_reuse_port=False,
+        mcp_server_workers=1,
+    )
+    server_config = MagicMock(mcp_server_host="127.0.0.1", mcp_server_port=0)
+    with (
+        patch("app.main.get_user_config", return_value=config),
+        patch("app.main.get_config", return_value=server_config),
+    ):
+        yield config
+
+
+def test_event_loop_policy_defaults_to_asyncio() -> None:
+    """Test the default policy creates asyncio loops with the exception handler."""
+    policy = CustomEventLoopPolicy()
+    loop = policy.new_event_loop()
+    try:
+        assert policy.loop_type == "asyncio"
+        assert isinstance(loop, asyncio.AbstractEventLoop)
+        assert loop.get_exception_handler() is handle_asyncio_exception
+    finally:
+        loop.close()
+
+
+def test_event_loop_policy_uses_uvloop_factory() -> None:
+    """Test loops come from uvloop when requested and installed."""
+    uvloop_loop = MagicMock(spec=asyncio.AbstractEventLoop)
+    with patch("app.main._get_uvloop_factory", return_value=lambda: uvloop_loop):
+        policy = CustomEventLoopPolicy("uvloop")
+
+    assert policy.loop_type == "uvloop"
+    assert policy.new_event_loop() is uvloop_loop
+    uvloop_loop.set_exception_handler.assert_called_once_with(handle_asyncio_exception)
+
+
+def test_event_loop_policy_falls_back_without_uvloop() -> None:
+    """Test the asyncio loop is used when uvloop is not installed."""
+    with patch("app.main._get_uvloop_factory", return_value=None):
+        policy = CustomEventLoopPolicy("uvloop")
+    loop = policy.new_event_loop()
+    try:
+        assert policy.loop_type == "asyncio"
+        assert loop.get_exception_handler() is handle_asyncio_exception
+    finally:
+        loop.close()
+
+
+def test_parse_args_workers() -> None:
+    """Test --workers is optional and must be at least 1."""
+    assert _parse_args([]).workers is None
+    assert _parse_args(["--workers", "3"]).workers == 3
+    for value in ("0", "-2", "many"):
+        with pytest.raises(SystemExit):
+            _parse_args(["--workers", value])
+
+
+def test_open_listening_socket_port_in_use(
+    user_config: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a port already in use exits with code 1 and the friendly message."""
+    with bind_listening_socket("127.0.0.1", 0) as taken:
+        port = taken.getsockname()[1]
+        with caplog.at_level(logging.ERROR), pytest.raises(SystemExit) as exc_info:
+            _open_listening_socket(port)
+
+    assert exc_info.value.code == 1
+    assert f"Port {port} is already in use" in caplog.text
+
+
+def test_open_listening_socket_prefers_inherited_fd(user_config: MagicMock) -> None:
+    """Test an inherited listening socket is used instead of binding a new one."""
+    with bind_listening_socket("127.0.0.1", 0) as listening:
+        user_config.mcp_server_socket_fd = os.dup(listening.fileno())
+        with patch("app.main.bind_listening_socket") as bind:
+            with _open_listening_socket(1) as sock:
+                assert sock.getsockname() == listening.getsockname()
+        bind.assert_not_called()
+
+
+@pytest.fixture
+def server_startup() -> Iterator[dict[str, MagicMock]]:
+    """Replace everything main() calls to build and run the server."""
+    names = (
+        "_load_config",
+        "_install_exception_handlers",
+        "_enable_startup_profile",
+        "MCPLogging",
+        "serve_on_sockets",
+        "_create_server",
+        "_run_server",
+        "WorkerSupervisor",
+    )
+    patchers = {name: patch(f"app.main.{name}") for name in names}
+    mocks = {name: patcher.start() for name, patcher in patchers.items()}
+    yield mocks
+    for patcher in patchers.values():
+        patcher.stop()
+
+
+def test_main_single_process(
+    user_config: MagicMock, server_startup: dict[str, MagicMock]
+) -> None:
+    """Test one worker serves in the main process, without a supervisor."""
+    main([])
+
+    server_startup["serve_on_sockets"].assert_called_once()
+    server_startup["_run_server"].assert_called_once()
+    assert server_startup["_run_server"].call_args.kwargs["show_banner"] is True
+    server_startup["WorkerSupervisor"].assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("argv", "config_workers", "workers"),
+    [(["--workers", "3"], 1, 3), ([], 4, 4)],
+)
+def test_main_worker_pool(
+    user_config: MagicMock,
+    server_startup: dict[str, MagicMock],
+    argv: list[str],
+    config_workers: int,
+    workers: int,
+) -> None:
+    """Test more than one worker starts the supervisor and exits with its code."""
+    user_config.mcp_server_workers = config_workers
+    supervisor = server_startup["WorkerSupervisor"]
+    supervisor.return_value.run.return_value = 2
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(argv)
+
+    assert exc_info.value.code == 2
+    target, sock, count = supervisor.call_args.args
+    assert target is _serve_worker
+    assert count == workers
+    server_startup["_create_server"].assert_not_called()
+    server_startup["_run_server"].assert_not_called()
@@ -0,0 +1,134 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import csv
+import io
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.deployment_proxy import DeploymentProxy
+from app.core.prediction_batch import PredictionBatcher, is_row_prediction
+from app.core.user_config import UserAppConfig
+
+URL = "https://example.com/predApi/v1.0/deployments/d/predictions"
+HEADERS = {"Authorization": "Bearer token", "Content-Type": "text/csv"}
+
+
+def _score(request: httpx.Request) -> httpx.Response:
+    """Fake prediction server doubling ``x``, failing rows without a value."""
+    records = list(csv.DictReader(io.StringIO(request.content.decode())))
+    if any(not record["x"] for record in records):
+        return httpx.Response(422, json={"message": "x is required"})
+    return httpx.Response(
+        200,
+        json={
+            "data": [
+                {"rowId": i, "prediction": float(record["x"]) * 2}
+                for i, record in enumerate(records)
+            ]
+        },
+    )
+
+
+def _setup(
+    handler: httpx.MockTransport, **settings: Any
+) -> tuple[PredictionBatcher, DeploymentProxy]:
+    settings = {
+        "MCP_SERVER_PREDICTION_BATCHING_ENABLED": True,
+        "MCP_SERVER_PREDICTION_BATCH_WINDOW": 0.05,
+        "MCP_SERVER_DEPLOYMENT_PROXY_BACKOFF": 0,
+        **settings,
+    }
+    config = UserAppConfig(**settings)
+    proxy = DeploymentProxy(config, client=httpx.AsyncClient(transport=handler))
+    return PredictionBatcher(config), proxy
+
+
+@pytest.mark.asyncio
+async def test_concurrent_predictions_share_one_request() -> None:
+    """Test concurrent calls are sent as one request and get their own rows."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _score(request)
+
+    batcher, proxy = _setup(httpx.MockTransport(handler))
+    bodies = ["x,y\n1,a\n", "x,y\n2,b\n3,c\n", "x,y\n4,d\n"]
+    responses = await asyncio.gather(
+        *(
+            batcher.submit(proxy, "score", "d", URL, HEADERS, None, body)
+            for body in bodies
+        )
+    )
+
+    assert len(requests) == 1
+    assert requests[0].content == b"x,y\n1,a\n2,b\n3,c\n4,d\n"
+    assert [response.json()["data"] for response in responses] == [
+        [{"rowId": 0, "prediction": 2.0}],
+        [{"rowId": 0, "prediction": 4.0}, {"rowId": 1, "prediction": 6.0}],
+        [{"rowId": 0, "prediction": 8.0}],
+    ]
+    assert batcher.stats() == {
+        "batches": 1,
+        "calls": 3,
+        "rows": 4,
+        "fallbacks": 0,
+        "pending": 0,
+    }
+
+    # Other credentials or columns are never mixed into a batch
+    other_headers = {**HEADERS, "Authorization": "Bearer other"}
+    await asyncio.gather(
+        batcher.submit(proxy, "score", "d", URL, HEADERS, None, "x,y\n1,a\n"),
+        batcher.submit(proxy, "score", "d", URL, other_headers, None, "x,y\n1,a\n"),
+        batcher.submit(proxy, "score", "d", URL, HEADERS, None, "x,z\n1,a\n"),
+    )
+    assert len(requests) == 4
+    assert is_row_prediction("POST", URL, {"content-type": "text/csv"}, "x\n1\n")
+    assert not is_row_prediction("POST", URL, {}, "x\n1\n")
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_sent_call_by_call() -> None:
+    """Test a bad row only fails its own call, and full batches do not wait."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _score(request)
+
+    batcher, proxy = _setup(
+        httpx.MockTransport(handler),
+        MCP_SERVER_PREDICTION_BATCH_WINDOW=60,
+        MCP_SERVER_PREDICTION_BATCH_MAX_ROWS=3,
+    )
+    good, bad, other = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.submit(proxy, "score", "d", URL, HEADERS, None, "x,y\n1,a\n"),
+            batcher.submit(proxy, "score", "d", URL, HEADERS, None, "x,y\n,b\n"),
+            batcher.submit(proxy, "score", "d", URL, HEADERS, None, "x,y\n5,c\n"),
+        ),
+        timeout=5,
+    )
+
+    # One batch request, then one request per call
+    assert len(requests) == 4
+    assert good.json()["data"] == [{"rowId": 0, "prediction": 2.0}]
+    assert bad.status_code == 422
+    assert other.json()["data"] == [{"rowId": 0, "prediction": 10.0}]
+    assert batcher.stats()["fallbacks"] == 1
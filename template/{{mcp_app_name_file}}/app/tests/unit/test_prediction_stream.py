@@ -0,0 +1,133 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import csv
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+
+from app.core.deployment_proxy import DeploymentProxy
+from app.core.prediction_stream import (
+    PredictionStreamer,
+    register_prediction_file_tool,
+)
+from app.core.user_config import UserAppConfig
+
+URL = "https://example.com/predApi/v1.0/deployments/d/predictions"
+
+
+@pytest.fixture(autouse=True)
+def prediction_target() -> Iterator[None]:
+    with patch(
+        "app.core.prediction_stream._prediction_target",
+        return_value=(URL, {"Content-Type": "text/csv", "Accept": "text/csv"}),
+    ):
+        yield
+
+
+def _setup(
+    tmp_path: Path, handler: httpx.MockTransport
+) -> tuple[UserAppConfig, PredictionStreamer]:
+    config = UserAppConfig(
+        MCP_SERVER_PREDICTION_FILES_DIR=str(tmp_path),
+        MCP_SERVER_PREDICTION_STREAM_CHUNK_ROWS=1000,
+        MCP_SERVER_PREDICTION_STREAM_CONCURRENCY=2,
+        MCP_SERVER_DEPLOYMENT_PROXY_BACKOFF=0,
+    )
+    proxy = DeploymentProxy(config, client=httpx.AsyncClient(transport=handler))
+    return config, PredictionStreamer(config, proxy)
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_scored_concurrently_and_written_in_order(
+    tmp_path: Path,
+) -> None:
+    """Test a file is scored in a bounded window and reassembled in order."""
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        records = list(csv.DictReader(io.StringIO(request.content.decode())))
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        # Earlier chunks answer last
+        await asyncio.sleep(0.05 if records[0]["x"] == "0" else 0.01)
+        in_flight["now"] -= 1
+        body = "x,label,prediction\n" + "".join(
+            f'{r["x"]},"{r["label"]}",{int(r["x"]) * 2}\n' for r in records
+        )
+        return httpx.Response(200, text=body, headers={"content-type": "text/csv"})
+
+    (tmp_path / "rows.csv").write_text(
+        "x,label\n" + "".join(f'{i},"row {i}, quoted"\n' for i in range(2500))
+    )
+    _, streamer = _setup(tmp_path, httpx.MockTransport(handler))
+    result = await streamer.score_file("d", "rows.csv")
+
+    assert result | {"seconds": 0} == {
+        "deployment_id": "d",
+        "rows": 2500,
+        "chunks": 3,
+        "output": str(tmp_path / "rows.predictions.csv"),
+        "seconds": 0,
+    }
+    assert in_flight["max"] == 2
+    output = list(csv.DictReader(open(result["output"])))
+    assert [row["prediction"] for row in output] == [str(i * 2) for i in range(2500)]
+    assert output[7]["label"] == "row 7, quoted"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "rows.csv",
+        "rows.predictions.csv",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_leaves_no_output(tmp_path: Path) -> None:
+    """Test the tool fails without partial output, and stays in its directory."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        records = list(csv.DictReader(io.StringIO(request.content.decode())))
+        if any(record["x"] == "1500" for record in records):
+            return httpx.Response(422, text="Column x is invalid")
+        return httpx.Response(200, text="prediction\n1\n")
+
+    (tmp_path / "rows.csv").write_text(
+        "x\n" + "".join(f"{i}\n" for i in range(1000, 4000))
+    )
+    config, streamer = _setup(tmp_path, httpx.MockTransport(handler))
+    mcp = FastMCP("test")
+    with (
+        patch("app.core.prediction_stream.PredictionStreamer", return_value=streamer),
+        patch("app.core.prediction_stream.get_config", return_value=MagicMock()),
+        patch("app.core.prediction_stream.is_tool_enabled", return_value=True),
+    ):
+        register_prediction_file_tool(mcp, config)
+
+    async with Client(mcp) as client:
+        with pytest.raises(Exception, match="HTTP 422 error .* rows chunk 1"):
+            await client.call_tool(
+                "predict_score_file_realtime",
+                {"deployment_id": "d", "file_path": "rows.csv"},
+            )
+        with pytest.raises(Exception, match="outside of the prediction files"):
+            await client.call_tool(
+                "predict_score_file_realtime",
+                {"deployment_id": "d", "file_path": "../rows.csv"},
+            )
+    assert [p.name for p in tmp_path.iterdir()] == ["rows.csv"]
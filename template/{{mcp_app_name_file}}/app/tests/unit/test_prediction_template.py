@@ -0,0 +1,131 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import importlib
+import inspect
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from datarobot_genai.drtools.core.tool_metadata import _TOOL_REGISTRY
+
+from app.core.feature_metadata import DEPLOYMENT_INFO_MODULE
+from app.core.prediction_template import (
+    compile_column_plan,
+    register_prediction_template,
+)
+from app.core.user_config import UserAppConfig
+
+FEATURES: dict[str, Any] = {
+    "features": [
+        {"name": "temperature", "feature_type": "Numeric", "importance": 0.6},
+        {"name": "opened", "feature_type": "Date", "importance": 0.5},
+        {
+            "name": "store",
+            "feature_type": "Categorical",
+            "frequent_values": ["north", "south"],
+        },
+        {"name": "notes", "feature_type": "Text", "frequent_values": []},
+        {"name": "units", "feature_type": "Numeric", "frequent_values": [3]},
+    ],
+    "total_features": 5,
+    "model_type": "Regression",
+    "target": "sales",
+    "target_type": "Regression",
+    "time_series_config": {
+        "datetime_column": "date",
+        "series_id_columns": ["store", "region"],
+    },
+}
+
+
+class _Now(datetime):
+    @classmethod
+    def now(cls, tz: Any = None) -> "_Now":
+        return cls(2024, 2, 27, 9, 30, 0, 250)
+
+
+@pytest.fixture
+def deployment_info() -> Iterator[tuple[Any, AsyncMock]]:
+    """The library's template tool, restored after the test."""
+    module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+    original, registry = (
+        module.deployment_generate_prediction_sample,
+        list(_TOOL_REGISTRY),
+    )
+    library_tool = next(f for f, _ in _TOOL_REGISTRY if f is original.__wrapped__)
+    get_features = AsyncMock(side_effect=lambda **_: copy.deepcopy(FEATURES))
+    with (
+        patch.object(module, "deployment_get_features", get_features),
+        patch.object(module, "datetime", _Now),
+        patch("app.core.prediction_template.datetime", _Now),
+        patch("app.core.prediction_template.get_config", return_value=MagicMock()),
+        patch("app.core.prediction_template.is_tool_enabled", return_value=True),
+    ):
+        yield library_tool, get_features
+    module.deployment_generate_prediction_sample = original
+    _TOOL_REGISTRY[:] = registry
+
+
+@pytest.mark.asyncio
+async def test_same_template_as_library(deployment_info: Any) -> None:
+    """Test templates from column plans are the library tool's templates."""
+    library_tool, _ = deployment_info
+    assert register_prediction_template(UserAppConfig())
+    registered = next(
+        f
+        for f, _ in _TOOL_REGISTRY
+        if f.__name__ == "deployment_generate_prediction_sample"
+    )
+    assert registered is not library_tool
+    assert inspect.signature(registered) == inspect.signature(library_tool)
+
+    for n_rows in (0, 1, 3, 400):
+        expected = await library_tool(deployment_id="d", n_rows=n_rows)
+        template = await registered(deployment_id="d", n_rows=n_rows)
+        assert template == expected
+        assert list(template) == list(expected)
+        assert [list(row) for row in template["template_data"]] == [
+            list(row) for row in expected["template_data"]
+        ]
+    assert template["template_data"][399]["date"] == "2025-04-01T09:30:00.000250"
+
+
+@pytest.mark.asyncio
+async def test_plans_are_reused_until_features_change(deployment_info: Any) -> None:
+    """Test a plan is compiled once per deployment and features."""
+    _, get_features = deployment_info
+    module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+    with patch(
+        "app.core.prediction_template.compile_column_plan",
+        wraps=compile_column_plan,
+    ) as compile_plan:
+        config = UserAppConfig(MCP_SERVER_PREDICTION_TEMPLATE_MAX_PLANS=1)
+        assert register_prediction_template(config)
+        assert register_prediction_template(config)
+        tool = module.deployment_generate_prediction_sample
+        await tool(deployment_id="d", n_rows=2)
+        await tool(deployment_id="d", n_rows=50)
+        assert compile_plan.call_count == 1
+
+        get_features.side_effect = lambda **_: FEATURES | {"target": "units"}
+        retrained = await tool(deployment_id="d", n_rows=1)
+        await tool(deployment_id="e", n_rows=1)
+        await tool(deployment_id="d", n_rows=1)
+    assert retrained["target"] == "units"
+    assert compile_plan.call_count == 4
+    assert len(tool._column_plan) == 1
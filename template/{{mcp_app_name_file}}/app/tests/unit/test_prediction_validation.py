@@ -0,0 +1,127 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import inspect
+import re
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from datarobot_genai.drtools.core.exceptions import ToolError
+from datarobot_genai.drtools.core.tool_metadata import _TOOL_REGISTRY
+
+from app.core.feature_metadata import DEPLOYMENT_INFO_MODULE
+from app.core.prediction_validation import (
+    register_prediction_validation,
+    validate_prediction_csv,
+)
+from app.core.user_config import UserAppConfig
+
+FEATURES: dict[str, Any] = {
+    "features": [
+        {"name": "date", "feature_type": "Date", "importance": 0.9},
+        {"name": "store", "feature_type": "Categorical", "importance": 0.7},
+        {"name": "temperature", "feature_type": "numeric", "importance": 0.6},
+        {"feature_name": "units", "feature_type": "numeric", "importance": 0.05},
+        {"name": "promotion", "feature_type": "Categorical", "importance": None},
+    ],
+    "model_type": "Regression",
+    "time_series_config": {"datetime_column": "date", "series_id_columns": ["store"]},
+}
+
+
+@pytest.fixture
+def deployment_info() -> Iterator[Any]:
+    """The library's deployment info tools, restored after the test."""
+    module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+    original, registry = (
+        module.deployment_validate_prediction_data,
+        list(_TOOL_REGISTRY),
+    )
+    library_tool = next(f for f, _ in _TOOL_REGISTRY if f is original.__wrapped__)
+    with patch.object(
+        module, "deployment_get_features", AsyncMock(return_value=FEATURES)
+    ):
+        yield library_tool
+    module.deployment_validate_prediction_data = original
+    _TOOL_REGISTRY[:] = registry
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "csv_string",
+    [
+        " date , store,temperature,units,promotion\n"
+        "2024-01-01,a,21.5,3,yes\n2024-01-02,b,1e3,,\n,,,,\n",
+        "date,store,temperature,notes\n2024-01-01,a,warm,x\n2024-01-02,b,-4,\n",
+        "date,temperature,units\n2024-01-01,,1\nyesterday,,2\n",
+        "store,units\na,1.5\n",
+    ],
+)
+async def test_same_report_as_library(deployment_info: Any, csv_string: str) -> None:
+    """Test the columnar engine reports what the library tool reports."""
+    expected = await deployment_info(deployment_id="d", csv_string=csv_string)
+    report = validate_prediction_csv(
+        csv_string.strip().encode(), FEATURES, deployment_id="d"
+    )
+
+    column_stats = report.pop("column_stats")
+    # Warnings also give how many values were affected
+    report["warnings"] = [
+        re.sub(r" \(\d+ of \d+ values\)$", "", w) for w in report["warnings"]
+    ]
+    assert report == expected
+    assert set(column_stats) <= {f.get("name", "units") for f in FEATURES["features"]}
+
+
+@pytest.mark.asyncio
+async def test_registered_tool_streams_blocks(deployment_info: Any) -> None:
+    """Test the replaced tool keeps its signature and counts across blocks."""
+    with (
+        patch("app.core.prediction_validation.get_config", return_value=MagicMock()),
+        patch("app.core.prediction_validation.is_tool_enabled", return_value=True),
+    ):
+        config = UserAppConfig(MCP_SERVER_PREDICTION_VALIDATION_BLOCK_SIZE=64)
+        assert register_prediction_validation(config)
+        assert register_prediction_validation(config)
+    registered = next(
+        f
+        for f, _ in _TOOL_REGISTRY
+        if f.__name__ == "deployment_validate_prediction_data"
+    )
+    assert registered is not deployment_info
+    assert inspect.signature(registered) == inspect.signature(deployment_info)
+
+    rows = [f"2024-01-{day % 28 + 1:02d},s{day % 3},{day}.5," for day in range(500)]
+    rows[7] = "2024-01-08,s1,n/a,"
+    rows[300] = "2024-01-08,,,"
+    report = await registered(
+        deployment_id="d",
+        csv_string="date,store,temperature,promotion\n" + "\n".join(rows),
+    )
+
+    assert report["status"] == "valid"
+    assert report["summary"]["rows"] == 500
+    assert report["warnings"] == [
+        "Feature temperature should be numeric but is string (1 of 499 values)",
+        "Missing feature column: units (column will be treated as missing values)",
+    ]
+    assert report["info"] == [
+        "Feature promotion is entirely missing or empty (this is allowed)"
+    ]
+    assert report["column_stats"]["store"] == {"missing": 1, "type_violations": 0}
+    with pytest.raises(ToolError, match="cannot be empty"):
+        await registered(deployment_id="d", csv_string="  ")
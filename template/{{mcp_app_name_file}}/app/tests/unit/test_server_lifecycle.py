@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import MagicMock
+import threading
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from mcp.server.fastmcp import FastMCP
@@ -27,6 +29,33 @@ def mock_mcp() -> MagicMock:
     return mock
 
 
+@pytest.fixture(autouse=True)
+def mock_warmup_manager() -> Iterator[MagicMock]:
+    """Replace the warm-up manager so that no warm-up task reaches DataRobot."""
+    manager = MagicMock()
+    manager.run = AsyncMock()
+    with patch("app.core.server_lifecycle.get_warmup_manager", return_value=manager):
+        yield manager
+
+
+@pytest.fixture(autouse=True)
+def mock_http_client_pool() -> Iterator[MagicMock]:
+    """Replace the shared HTTP client pool."""
+    pool = MagicMock()
+    pool.aclose = AsyncMock()
+    with patch("app.core.server_lifecycle.get_http_client_pool", return_value=pool):
+        yield pool
+
+
+@pytest.fixture(autouse=True)
+def mock_loop_monitor() -> Iterator[MagicMock]:
+    """Replace the loop lag monitor so that no background task is left running."""
+    monitor = MagicMock()
+    monitor.stop = AsyncMock()
+    with patch("app.core.server_lifecycle.get_loop_monitor", return_value=monitor):
+        yield monitor
+
+
 @pytest.fixture
 def lifecycle() -> ServerLifecycle:
     """Create a ServerLifecycle instance."""
@@ -50,6 +79,32 @@ async def test_pre_server_start(
     assert lifecycle._mcp == mock_mcp
 
 
+@pytest.mark.asyncio
+async def test_shared_http_client_lifecycle(
+    lifecycle: ServerLifecycle, mock_mcp: MagicMock, mock_http_client_pool: MagicMock
+) -> None:
+    """Test the shared HTTP client is started before and closed at shutdown."""
+    await lifecycle.pre_server_start(mock_mcp)
+    mock_http_client_pool.start.assert_called_once_with()
+    await lifecycle.pre_server_shutdown(mock_mcp)
+    mock_http_client_pool.aclose.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_and_executors_lifecycle(
+    lifecycle: ServerLifecycle, mock_mcp: MagicMock, mock_loop_monitor: MagicMock
+) -> None:
+    """Test the loop monitor runs while serving and the executors are shut down."""
+    await lifecycle.post_server_start(mock_mcp)
+    mock_loop_monitor.start.assert_called_once_with(
+        0.5, slow_callback_threshold=0.25, sample_stacks=True
+    )
+    with patch("app.core.server_lifecycle.get_executor_manager") as mock_executors:
+        await lifecycle.pre_server_shutdown(mock_mcp)
+    mock_executors.return_value.shutdown.assert_called_once_with()
+    mock_loop_monitor.stop.assert_awaited_once_with()
+
+
 @pytest.mark.asyncio
 async def test_post_server_start(
     lifecycle: ServerLifecycle, mock_mcp: MagicMock
@@ -60,6 +115,26 @@ async def test_post_server_start(
     # Add more assertions when post_server_start has actual implementation
 
 
+@pytest.mark.asyncio
+async def test_post_server_start_runs_warmup(
+    lifecycle: ServerLifecycle, mock_mcp: MagicMock, mock_warmup_manager: MagicMock
+) -> None:
+    """Test post_server_start runs the warm-up tasks with the configured deadline."""
+    await lifecycle.post_server_start(mock_mcp)
+    mock_warmup_manager.run.assert_awaited_once_with(mock_mcp, timeout=30.0)
+
+
+@pytest.mark.asyncio
+async def test_post_server_start_signals_worker_started(mock_mcp: MagicMock) -> None:
+    """Test post_server_start tells the worker supervisor that startup succeeded."""
+    started = threading.Event()
+    lifecycle = ServerLifecycle(worker_id=1, started=started)  # type: ignore[arg-type]
+    await lifecycle.pre_server_start(mock_mcp)
+    assert not started.is_set()
+    await lifecycle.post_server_start(mock_mcp)
+    assert started.is_set()
+
+
 @pytest.mark.asyncio
 async def test_lifecycle_sequence(
     lifecycle: ServerLifecycle, mock_mcp: MagicMock
@@ -0,0 +1,131 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import errno
+import os
+import socket
+from typing import Any
+
+import pytest
+
+from app.core.sockets import (
+    bind_listening_socket,
+    get_inherited_socket,
+    serve_on_sockets,
+)
+
+
+class _FakeMCP:
+    def __init__(self) -> None:
+        self.kwargs: dict[str, Any] = {}
+
+    async def run_http_async(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+
+def test_bind_listening_socket() -> None:
+    """Test the socket is bound, listening and inheritable."""
+    with bind_listening_socket("127.0.0.1", 0, backlog=16) as sock:
+        assert sock.getsockname()[1] > 0
+        assert sock.get_inheritable()
+        with socket.create_connection(sock.getsockname(), timeout=1):
+            pass
+
+
+def test_bind_listening_socket_port_in_use() -> None:
+    """Test EADDRINUSE is surfaced to the caller."""
+    with bind_listening_socket("127.0.0.1", 0) as sock:
+        with pytest.raises(OSError) as exc_info:
+            bind_listening_socket("127.0.0.1", sock.getsockname()[1])
+        assert exc_info.value.errno == errno.EADDRINUSE
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="No SO_REUSEPORT")
+def test_bind_listening_socket_reuse_port() -> None:
+    """Test two sockets with SO_REUSEPORT can share a port."""
+    with bind_listening_socket("127.0.0.1", 0, reuse_port=True) as first:
+        port = first.getsockname()[1]
+        with bind_listening_socket("127.0.0.1", port, reuse_port=True) as second:
+            assert second.getsockname()[1] == port
+            assert second.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+
+
+def test_get_inherited_socket_from_fd() -> None:
+    """Test an explicit file descriptor is wrapped into a socket."""
+    with bind_listening_socket("127.0.0.1", 0) as listening:
+        fd = os.dup(listening.fileno())
+        inherited = get_inherited_socket(fd)
+        assert inherited is not None
+        with inherited:
+            assert inherited.getsockname() == listening.getsockname()
+            assert inherited.get_inheritable()
+
+
+def test_get_inherited_socket_rejects_datagram_socket() -> None:
+    """Test a non-stream file descriptor is rejected."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp:
+        with pytest.raises(OSError):
+            get_inherited_socket(udp.fileno())
+
+
+def test_get_inherited_socket_without_activation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test no socket is returned when nothing was inherited."""
+    monkeypatch.delenv("LISTEN_FDS", raising=False)
+    assert get_inherited_socket() is None
+
+    # Sockets activated for another process are ignored
+    monkeypatch.setenv("LISTEN_FDS", "1")
+    monkeypatch.setenv("LISTEN_PID", str(os.getpid() + 1))
+    assert get_inherited_socket() is None
+
+
+def test_get_inherited_socket_systemd_activation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test systemd socket activation uses fd 3 and clears the variables."""
+    monkeypatch.setenv("LISTEN_FDS", "1")
+    monkeypatch.setenv("LISTEN_PID", str(os.getpid()))
+    captured: dict[str, Any] = {}
+
+    class _Sock:
+        type = socket.SOCK_STREAM
+
+        def __init__(self, fileno: int) -> None:
+            captured["fd"] = fileno
+
+        def set_inheritable(self, value: bool) -> None:
+            captured["inheritable"] = value
+
+        def getsockname(self) -> tuple[str, int]:
+            return ("0.0.0.0", 8080)
+
+    monkeypatch.setattr("app.core.sockets.socket.socket", _Sock)
+    sock = get_inherited_socket()
+
+    assert isinstance(sock, _Sock)
+    assert captured == {"fd": 3, "inheritable": True}
+    assert "LISTEN_FDS" not in os.environ
+    assert "LISTEN_PID" not in os.environ
+
+
+@pytest.mark.asyncio
+async def test_serve_on_sockets() -> None:
+    """Test pre-bound sockets are injected into run_http_async."""
+    mcp = _FakeMCP()
+    sockets = [object()]
+    serve_on_sockets(mcp, sockets)  # type: ignore[arg-type]
+    await mcp.run_http_async(port=8080)
+    assert mcp.kwargs == {"port": 8080, "sockets": sockets}
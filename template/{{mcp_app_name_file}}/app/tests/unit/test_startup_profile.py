@@ -0,0 +1,176 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import pstats
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from datarobot_genai.drmcp import BaseServerLifecycle
+from datarobot_genai.drmcp.core import dr_mcp_server
+from fastmcp import Client, FastMCP
+
+from app.core.startup_profile import (
+    FirstRequestMiddleware,
+    StartupProfiler,
+    get_process_start_time,
+)
+
+
+def test_phase_records_duration() -> None:
+    """Test phases are recorded in start order, including failed ones."""
+    profiler = StartupProfiler()
+
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            pass
+    with pytest.raises(ValueError):
+        with profiler.phase("failing"):
+            raise ValueError()
+
+    assert [p.name for p in profiler.phases] == ["inner", "outer", "failing"]
+    assert [p["name"] for p in profiler.report()["phases"]] == [
+        "outer",
+        "inner",
+        "failing",
+    ]
+    assert all(p.duration_seconds >= 0 for p in profiler.phases)
+
+
+@pytest.mark.asyncio
+async def test_wrap() -> None:
+    """Test wrapped sync and async callables are timed and keep their result."""
+    profiler = StartupProfiler()
+
+    async def load() -> int:
+        return 2
+
+    assert profiler.wrap("sync", lambda x: x + 1)(1) == 2
+    assert await profiler.wrap_async("async", load)() == 2
+    assert [p.name for p in profiler.phases] == ["sync", "async"]
+
+
+@pytest.mark.asyncio
+async def test_report_emitted_after_post_server_start(tmp_path: Path) -> None:
+    """Test the report and cProfile dump are written once the server started."""
+    report_path = tmp_path / "startup.json"
+    cprofile_path = tmp_path / "startup.prof"
+    profiler = StartupProfiler(worker_id=1)
+    profiler.enable(report_path=str(report_path), cprofile_path=str(cprofile_path))
+    lifecycle = BaseServerLifecycle()
+    profiler.instrument_lifecycle(lifecycle)
+    mcp = FastMCP("test")
+
+    await lifecycle.pre_server_start(mcp)
+    assert not (tmp_path / "startup.worker1.json").exists()
+    await lifecycle.post_server_start(mcp)
+
+    report = json.loads((tmp_path / "startup.worker1.json").read_text())
+    assert report["worker_id"] == 1
+    assert report["startup_seconds"] > 0
+    assert report["first_request_seconds"] is None
+    assert [p["name"] for p in report["phases"]] == [
+        "pre_server_start",
+        "post_server_start",
+    ]
+    pstats.Stats(str(tmp_path / "startup.worker1.prof"))
+
+    profiler.mark_first_request()
+    report = json.loads((tmp_path / "startup.worker1.json").read_text())
+    assert report["first_request_seconds"] >= report["startup_seconds"]
+
+
+def test_record_from_process_start() -> None:
+    """Test phases recorded from timestamps are relative to the process start."""
+    started = time.monotonic() - 2
+    profiler = StartupProfiler(started=started)
+
+    profiler.record("import:app.main", started + 0.5, started + 1.25)
+
+    assert profiler.report()["phases"] == [
+        {"name": "import:app.main", "start_seconds": 0.5, "duration_seconds": 0.75}
+    ]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads /proc")
+def test_get_process_start_time() -> None:
+    """Test the process start time is read from /proc, before the test started."""
+    started = get_process_start_time()
+    assert started is not None
+    assert 0 <= time.monotonic() - started < 3600
+
+
+def test_report_write_failure_is_logged(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an unwritable report path is logged instead of failing startup."""
+    profiler = StartupProfiler()
+    profiler.enable(
+        report_path=str(tmp_path / "missing" / "startup.json"),
+        cprofile_path=str(tmp_path / "missing" / "startup.prof"),
+    )
+
+    with caplog.at_level(logging.WARNING):
+        profiler.finish()
+
+    assert "Could not save the startup cProfile dump" in caplog.text
+    assert "Could not write the startup profile report" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_first_request_ignores_server_internal_calls() -> None:
+    """Test only requests from a client session count as the first request."""
+    profiler = StartupProfiler()
+    mcp = FastMCP("test")
+    mcp.add_middleware(FirstRequestMiddleware(profiler))
+
+    await mcp.list_tools()
+    assert profiler.report()["first_request_seconds"] is None
+
+    async with Client(mcp) as client:
+        await client.list_tools()
+    assert profiler.report()["first_request_seconds"] is not None
+
+
+def test_disabled_profiler_writes_nothing(tmp_path: Path) -> None:
+    """Test no report is produced unless profiling is enabled."""
+    profiler = StartupProfiler()
+    profiler.finish()
+    profiler.mark_first_request()
+    assert profiler.report()["startup_seconds"] is not None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_instrument_server(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test module imports run by the server are timed per package prefix."""
+    for attr in (
+        "_import_modules_from_dir",
+        "get_credentials",
+        "initialize_telemetry",
+        "initialize_oauth_middleware",
+        "register_routes",
+        "register_tools_of_datarobot_deployments",
+        "register_prompts_from_datarobot_prompt_management",
+    ):
+        # Restore the server module namespace after the test
+        monkeypatch.setattr(dr_mcp_server, attr, getattr(dr_mcp_server, attr))
+    profiler = StartupProfiler()
+
+    profiler.instrument_server()
+    dr_mcp_server._import_modules_from_dir(str(tmp_path), "app.missing")
+
+    assert [p.name for p in profiler.phases] == ["import_modules:app.missing"]
@@ -0,0 +1,164 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+
+from app.core.streaming import _rechunk, streaming_tool
+from app.core.user_config import UserAppConfig
+
+ROWS = 100
+
+
+@pytest.fixture
+def stream_state() -> dict[str, int]:
+    return {"produced": 0, "max_ahead": 0, "sent": 0, "closed": 0}
+
+
+@pytest.fixture
+def mcp(stream_state: dict[str, int]) -> Iterator[FastMCP]:
+    config = UserAppConfig(
+        MCP_SERVER_TOOL_STREAM_CHUNK_SIZE=16,
+        MCP_SERVER_TOOL_STREAM_BUFFER_CHUNKS=2,
+        MCP_SERVER_TOOL_STREAM_MAX_INLINE_SIZE=100,
+    )
+    mcp = FastMCP("test")
+
+    @mcp.tool
+    @streaming_tool()
+    async def export_rows(
+        rows: int, fail_at: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Export rows as CSV."""
+        try:
+            for i in range(rows):
+                if i == fail_at:
+                    raise ValueError("export failed")
+                stream_state["produced"] += 1
+                stream_state["max_ahead"] = max(
+                    stream_state["max_ahead"],
+                    stream_state["produced"] - stream_state["sent"],
+                )
+                yield f"{i:07d}\n"
+        finally:
+            stream_state["closed"] += 1
+
+    with patch("app.core.streaming.get_user_config", return_value=config):
+        yield mcp
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_streamed_as_progress_notifications(
+    mcp: FastMCP, stream_state: dict[str, int]
+) -> None:
+    """Test chunks are sent as notifications with a bounded read-ahead."""
+    messages: list[str] = []
+
+    async def on_progress(
+        progress: float, total: Optional[float], message: Optional[str]
+    ) -> None:
+        assert message is not None
+        messages.append(message)
+        stream_state["sent"] += len(message) // 8
+
+    async with Client(mcp) as client:
+        tools = await client.list_tools()
+        assert list(tools[0].inputSchema["properties"]) == ["rows", "fail_at"]
+        result = await client.call_tool(
+            "export_rows", {"rows": ROWS}, progress_handler=on_progress
+        )
+
+    assert "".join(messages) == "".join(f"{i:07d}\n" for i in range(ROWS))
+    assert result.structured_content == {
+        "streamed": True,
+        "chunks": ROWS // 2,
+        "size": ROWS * 8,
+        "truncated": False,
+    }
+    # Rows are coalesced in chunks of 2, and at most 2 chunks are queued while
+    # one is being sent and one is being produced
+    assert set(map(len, messages)) == {16}
+    assert stream_state["max_ahead"] <= 8
+    assert stream_state["closed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_output_is_inlined_and_truncated_without_progress(
+    mcp: FastMCP, stream_state: dict[str, int]
+) -> None:
+    """Test calls without a progress token get the truncated output."""
+    result = await mcp.call_tool("export_rows", {"rows": ROWS})
+
+    assert isinstance(result, ToolResult)
+    assert isinstance(result.content[0], TextContent)
+    assert result.content[0].text == "".join(f"{i:07d}\n" for i in range(13))[:100]
+    assert result.structured_content == {
+        "streamed": False,
+        "chunks": 7,
+        "size": 100,
+        "truncated": True,
+    }
+    # The generator is not consumed past the limit
+    assert stream_state["produced"] == 14
+    assert stream_state["closed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generator_errors_fail_the_call(
+    mcp: FastMCP, stream_state: dict[str, int]
+) -> None:
+    """Test an error raised while streaming is returned as a tool error."""
+
+    async def on_progress(
+        progress: float, total: Optional[float], message: Optional[str]
+    ) -> None:
+        pass
+
+    async with Client(mcp) as client:
+        with pytest.raises(ToolError, match="export failed"):
+            await client.call_tool(
+                "export_rows",
+                {"rows": ROWS, "fail_at": 5},
+                progress_handler=on_progress,
+            )
+    assert stream_state["closed"] == 1
+
+
+def test_streaming_tool_requires_async_generator() -> None:
+    """Test regular functions are rejected."""
+
+    async def not_a_generator() -> str:
+        return ""
+
+    with pytest.raises(TypeError):
+        streaming_tool()(not_a_generator)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_rechunk_bytes_across_character_boundaries() -> None:
+    """Test UTF-8 characters split across bytes chunks are decoded once whole."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        data = "héllo wörld".encode()
+        for i in range(len(data)):
+            yield data[i : i + 1]
+
+    assert [piece async for piece in _rechunk(chunks(), 4)] == ["héll", "o wö", "rld"]
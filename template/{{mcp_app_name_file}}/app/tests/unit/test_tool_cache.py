@@ -0,0 +1,187 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Context
+from fastmcp.dependencies import Depends
+from fastmcp.tools.tool import ToolResult
+
+from app.core.tool_cache import ToolResultCache, cached_tool
+from app.core.user_config import UserAppConfig
+
+
+@pytest.fixture
+def cache() -> Iterator[ToolResultCache]:
+    cache = ToolResultCache(UserAppConfig())
+    with patch("app.core.tool_cache._tool_cache", cache):
+        yield cache
+
+
+def _client() -> str:
+    return "client"
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_keys_on_canonical_arguments(cache: ToolResultCache) -> None:
+    """Test results are reused for equal arguments, ignoring injected parameters."""
+    calls = []
+
+    @cached_tool(ttl=60)
+    async def search(
+        query: str,
+        filters: dict[str, Any] | None = None,
+        limit: int = 10,
+        client: str = Depends(_client),
+        ctx: Context | None = None,
+    ) -> ToolResult:
+        calls.append((query, filters, limit))
+        return ToolResult(structured_content={"query": query})
+
+    first = await search("a", {"x": 1, "y": 2}, client="c1")
+    assert await search(query="a", filters={"y": 2, "x": 1}, limit=10) is first
+    await search("a", {"x": 1, "y": 2}, limit=5)
+    await search("b")
+
+    assert len(calls) == 3
+    assert cache.stats()["search"] == {
+        "hits": 1,
+        "misses": 3,
+        "shared": 0,
+        "evictions": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution(
+    cache: ToolResultCache,
+) -> None:
+    """Test single-flight deduplication, and that errors are not cached."""
+    release = asyncio.Event()
+    calls = 0
+
+    @cached_tool()
+    async def slow(value: int) -> ToolResult:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        if value < 0:
+            raise ValueError("negative")
+        return ToolResult(structured_content={"value": value})
+
+    tasks = [asyncio.create_task(slow(1)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["slow"]["shared"] == 4
+
+    release.clear()
+    failing = [asyncio.create_task(slow(-1)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    outcomes = await asyncio.gather(*failing, return_exceptions=True)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    with pytest.raises(ValueError):
+        await slow(-1)
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_size_bounds() -> None:
+    """Test expired results are refreshed and the LRU respects its bounds."""
+    cache = ToolResultCache(
+        UserAppConfig(
+            MCP_SERVER_TOOL_CACHE_MAX_ENTRIES=2, MCP_SERVER_TOOL_CACHE_MAX_BYTES=1000
+        )
+    )
+
+    async def result(size: int) -> ToolResult:
+        return ToolResult(structured_content={"data": "x" * size})
+
+    with patch("app.core.tool_cache.time.monotonic", return_value=0.0):
+        await cache.get_or_call("t", "a", 10, lambda: result(10))
+        await cache.get_or_call("t", "b", 10, lambda: result(10))
+        await cache.get_or_call("t", "a", 10, lambda: result(10))
+        await cache.get_or_call("t", "c", 10, lambda: result(10))
+        # Larger than the whole cache: returned but not stored
+        await cache.get_or_call("t", "big", 10, lambda: result(2000))
+    assert len(cache) == 2
+    assert cache.stats()["t"]["evictions"] == 1
+    assert cache.stats()["t"]["hits"] == 1
+
+    with patch("app.core.tool_cache.time.monotonic", return_value=0.0):
+        await cache.get_or_call("t", "a", 10, lambda: result(10))
+    with patch("app.core.tool_cache.time.monotonic", return_value=11.0):
+        await cache.get_or_call("t", "a", 10, lambda: result(10))
+    assert cache.stats()["t"]["hits"] == 2
+    assert cache.stats()["t"]["misses"] == 5
+
+    cache.clear("t")
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_error_results_and_disabled_cache() -> None:
+    """Test is_error results are not cached, and the cache can be switched off."""
+    calls = 0
+
+    @cached_tool()
+    async def tool() -> ToolResult:
+        nonlocal calls
+        calls += 1
+        return ToolResult(structured_content={"error": "boom"}, is_error=True)
+
+    cache = ToolResultCache(UserAppConfig())
+    with patch("app.core.tool_cache._tool_cache", cache):
+        await tool()
+        await tool()
+    assert calls == 2
+
+    disabled = ToolResultCache(UserAppConfig(MCP_SERVER_TOOL_CACHE_ENABLED=False))
+    with patch("app.core.tool_cache._tool_cache", disabled):
+        await tool()
+    assert calls == 3
+    assert disabled.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_results_are_not_shared_between_callers(cache: ToolResultCache) -> None:
+    """Test a result is only reused for the caller it was computed for."""
+    calls = []
+
+    @cached_tool(ttl=60)
+    async def private(query: str) -> str:
+        calls.append(query)
+        return query
+
+    @cached_tool(ttl=60, shared=True)
+    async def public(query: str) -> str:
+        calls.append(query)
+        return query
+
+    for token in ("alice", "bob", "alice", None):
+        with patch("app.core.tool_cache.resolve_datarobot_token", return_value=token):
+            await private("a")
+            await public("b")
+
+    assert calls == ["a", "b", "a", "a"]
+    assert cache.stats()["private"]["hits"] == 1
+    assert cache.stats()["public"]["hits"] == 3
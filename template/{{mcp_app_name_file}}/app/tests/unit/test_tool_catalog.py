@@ -0,0 +1,128 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+import pytest
+from datarobot_genai.drmcpbase.fastmcp_transforms import register_mcp_catalog_transform
+from fastmcp import Client, FastMCP
+from fastmcp.tools import Tool
+from mcp.types import ToolListChangedNotification
+from starlette.testclient import TestClient
+
+from app.core.tool_catalog import ToolCatalogMiddleware, register_tool_catalog
+from app.core.user_config import UserAppConfig
+
+
+async def lookup(key: str) -> str:
+    """Look up a key."""
+    return key
+
+
+async def predict(rows: list[dict[str, float]]) -> list[float]:
+    """Score rows."""
+    return [0.5 for _ in rows]
+
+
+def _server() -> tuple[FastMCP, ToolCatalogMiddleware]:
+    mcp = FastMCP("test")
+    mcp.tool(lookup)
+    catalog = register_tool_catalog(mcp, UserAppConfig())
+    assert catalog is not None
+    return mcp, catalog
+
+
+@pytest.mark.asyncio
+async def test_tools_list_is_cached_until_the_registry_changes() -> None:
+    """Test listings are served from the snapshot and changes are notified once."""
+    mcp, catalog = _server()
+    notifications: list[Any] = []
+
+    async def on_message(message: Any) -> None:
+        if isinstance(getattr(message, "root", None), ToolListChangedNotification):
+            notifications.append(message.root)
+
+    async with Client(mcp, message_handler=on_message) as client:
+        assert [t.name for t in await client.list_tools()] == ["lookup"]
+        assert [t.name for t in await client.list_tools()] == ["lookup"]
+        assert catalog.stats()["hits"] == 1
+        assert catalog.stats()["rebuilds"] == 1
+
+        # Re-registering the same definition is not a change
+        mcp.add_tool(Tool.from_function(lookup))
+        await client.list_tools()
+        assert catalog.stats()["rebuilds"] == 2
+        assert notifications == []
+
+        mcp.add_tool(Tool.from_function(predict))
+        assert [t.name for t in await client.list_tools()] == ["lookup", "predict"]
+        assert len(notifications) == 1
+
+        # A call after a change notifies without waiting for a tools/list
+        mcp.local_provider.remove_tool("predict")
+        assert (await client.call_tool("lookup", {"key": "a"})).data == "a"
+        assert len(notifications) == 2
+        assert [t.name for t in await client.list_tools()] == ["lookup"]
+
+    assert catalog.stats()["changes"] == 2
+
+
+def test_tools_route_revalidates_with_etag() -> None:
+    """Test /tools answers 304 for the current ETag and a new body on changes."""
+    mcp, _ = _server()
+    client = TestClient(mcp.http_app())
+
+    response = client.get("/tools")
+    assert response.status_code == 200
+    assert [t["name"] for t in response.json()["tools"]] == ["lookup"]
+    etag = response.headers["etag"]
+
+    response = client.get("/tools", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    mcp.add_tool(Tool.from_function(predict))
+    response = client.get("/tools", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [t["name"] for t in response.json()["tools"]] == ["lookup", "predict"]
+
+
+def test_each_request_gets_the_catalog_of_its_view() -> None:
+    """Test the tools of an allowlist are not served to other requests."""
+    mcp, catalog = _server()
+    mcp.add_tool(Tool.from_function(predict))
+    register_mcp_catalog_transform(mcp)
+    client = TestClient(mcp.http_app())
+    allowlist = {"x-datarobot-mcp-tools": "predict"}
+
+    for _ in range(2):
+        response = client.get("/tools", headers=allowlist)
+        assert [t["name"] for t in response.json()["tools"]] == ["predict"]
+        response = client.get("/tools")
+        assert [t["name"] for t in response.json()["tools"]] == ["lookup", "predict"]
+    assert catalog.stats() == {
+        "hits": 2,
+        "rebuilds": 2,
+        "changes": 0,
+        "views": 2,
+    }
+
+
+def test_tool_catalog_can_be_disabled() -> None:
+    """Test nothing is installed when the cache is disabled."""
+    mcp = FastMCP("test")
+    config = UserAppConfig(MCP_SERVER_TOOL_LIST_CACHE_ENABLED=False)
+    assert register_tool_catalog(mcp, config) is None
+    assert not any(isinstance(m, ToolCatalogMiddleware) for m in mcp.middleware)
@@ -0,0 +1,222 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import os
+import stat
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from datarobot.errors import ClientError
+from datarobot_genai.drmcp.core.mcp_instance import mcp
+from datarobot_genai.drmcpbase.dynamic_tools.external_tool import (
+    ExternalToolRegistrationConfig,
+)
+
+from app.core.deployment_proxy import register_deployment_tool
+from app.core.tool_discovery import DeploymentToolDiscovery, DeploymentToolPlaceholder
+from app.core.tool_registry import ToolRegistryStore
+
+# DataRobot token of the request, None for the app credentials
+_caller_token: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "caller_token", default=None
+)
+
+
+def _config(
+    name: str, description: str = "Score rows"
+) -> ExternalToolRegistrationConfig:
+    return ExternalToolRegistrationConfig(
+        name=name,
+        description=description,
+        method="POST",
+        base_url="https://example.com/api/v2/deployments/d",
+        endpoint="/predictions",
+        headers={"Authorization": "Bearer secret", "datarobot-key": "key"},
+        input_schema={
+            "type": "object",
+            "properties": {"json": {"type": "object", "properties": {}}},
+        },
+        tags={"deployment", "tool"},
+    )
+
+
+@pytest.fixture
+async def discovery(tmp_path: Path) -> AsyncIterator[DeploymentToolDiscovery]:
+    discovery = DeploymentToolDiscovery()
+    discovery.open(str(tmp_path / "tools.sqlite3"))
+    yield discovery
+    await discovery.stop()
+    for deployment_id in list(discovery._known):
+        await mcp.remove_deployment_mapping(deployment_id)
+
+
+@pytest.mark.asyncio
+async def test_refresh_applies_only_changes(
+    discovery: DeploymentToolDiscovery,
+) -> None:
+    """Test new, changed and removed deployments are diffed, fetched concurrently."""
+    deployed = {"dep_a": _config("discovery_a"), "dep_b": _config("discovery_b")}
+    state = {"active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def fetch(deployment_id: str) -> ExternalToolRegistrationConfig:
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        if deployment_id == "dep_broken":
+            raise RuntimeError("deployment unavailable")
+        return deployed[deployment_id]
+
+    with (
+        patch(
+            "app.core.tool_discovery.get_datarobot_tool_deployments",
+            side_effect=lambda: list(deployed),
+        ),
+        patch("app.core.tool_discovery._fetch_tool_config", side_effect=fetch),
+    ):
+        await discovery.refresh(concurrency=2)
+        mapping = await mcp.get_deployment_mapping()
+        assert mapping["dep_a"] == "discovery_a"
+        assert mapping["dep_b"] == "discovery_b"
+        assert discovery.stats()["added"] == 2
+
+        # Unchanged deployments are fetched but not registered again
+        tool_a = await mcp.get_tool("discovery_a")
+        deployed["dep_c"] = _config("discovery_c")
+        deployed["dep_broken"] = _config("discovery_broken")
+        await discovery.refresh(concurrency=2)
+        assert await mcp.get_tool("discovery_a") is tool_a
+        assert state["max_active"] == 2
+
+        deployed["dep_a"] = _config("discovery_a", description="Score rows v2")
+        del deployed["dep_b"]
+        await discovery.refresh(concurrency=2)
+
+    mapping = await mcp.get_deployment_mapping()
+    assert "dep_b" not in mapping
+    assert "dep_broken" not in mapping
+    tool_a = await mcp.get_tool("discovery_a")
+    assert tool_a is not None
+    assert tool_a.description == "Score rows v2"
+    assert discovery.stats() | {"last_refresh_seconds": None} == {
+        "restored": 0,
+        "refreshes": 3,
+        "added": 3,
+        "updated": 1,
+        "removed": 1,
+        "failed": 2,
+        "revalidations": 0,
+        "last_refresh_seconds": None,
+        "deployments": 2,
+    }
+
+    # The registry is private and holds no credentials
+    assert stat.S_IMODE(os.stat(discovery.store.path).st_mode) == 0o600
+    entries = discovery.store.load()
+    assert sorted(entries) == ["dep_a", "dep_c"]
+    assert entries["dep_a"].config["headers"] == {"datarobot-key": "key"}
+    assert entries["dep_a"].config["description"] == "Score rows v2"
+
+
+@pytest.mark.asyncio
+async def test_restore_and_revalidate_on_use(
+    discovery: DeploymentToolDiscovery,
+) -> None:
+    """Test startup registers the registry tools, revalidated on first use."""
+    with (
+        patch(
+            "app.core.tool_discovery.get_datarobot_tool_deployments",
+            return_value=["dep_r"],
+        ),
+        patch(
+            "app.core.tool_discovery._fetch_tool_config",
+            return_value=_config("discovery_r"),
+        ),
+    ):
+        await discovery.refresh(concurrency=1)
+        # Recorded like a PUT /registeredDeployments/{id}
+        await discovery.adopt("dep_r")
+    registered = await mcp.get_tool("discovery_r")
+    assert registered is not None
+    await mcp.remove_deployment_mapping("dep_r")
+
+    restored = DeploymentToolDiscovery()
+    restored.open(discovery.store.path)
+    with patch(
+        "app.core.tool_discovery.get_datarobot_tool_deployments",
+        side_effect=RuntimeError("DataRobot unavailable"),
+    ):
+        await restored.restore()
+        # A failed listing keeps the restored tools
+        await restored.refresh(concurrency=1)
+    discovery._known = restored._known
+    assert (await mcp.get_deployment_mapping())["dep_r"] == "discovery_r"
+    assert restored.stats()["restored"] == 1
+
+    # A placeholder with the stored definition until the first call
+    placeholder = await mcp.get_tool("discovery_r")
+    assert isinstance(placeholder, DeploymentToolPlaceholder)
+    assert placeholder.parameters == registered.parameters
+    assert placeholder.annotations == registered.annotations
+    credentials = MagicMock()
+    credentials.datarobot.datarobot_api_token = "app"
+    with (
+        patch("app.core.tool_discovery.get_credentials", return_value=credentials),
+        patch(
+            "app.core.tool_discovery.register_deployment_tool",
+            wraps=register_deployment_tool,
+        ) as register,
+    ):
+        tool = await restored.materialize("dep_r")
+    # Shared by every caller, so built with the app credentials
+    assert register.call_args.args[0].headers["Authorization"] == "Bearer app"
+    assert not isinstance(tool, DeploymentToolPlaceholder)
+    assert await mcp.get_tool("discovery_r") is tool
+    assert tool.parameters == registered.parameters
+
+    # Fresh entries are not revalidated, stale ones are, once, in the background
+    not_found = ClientError("Not found", 404)
+    caller = _caller_token.set("caller")
+    with (
+        patch(
+            "app.core.tool_discovery._fetch_tool_config", side_effect=not_found
+        ) as fetch,
+        patch(
+            "app.core.tool_discovery.resolve_datarobot_token",
+            side_effect=_caller_token.get,
+        ),
+    ):
+        # A caller not seeing the deployment does not unregister it
+        await restored.revalidate("dep_r")
+        assert (await mcp.get_deployment_mapping())["dep_r"] == "discovery_r"
+
+        restored.revalidate_on_use("discovery_r", max_age=3600)
+        restored.revalidate_on_use("discovery_r", max_age=0)
+        restored.revalidate_on_use("discovery_r", max_age=0)
+        await asyncio.gather(*restored._revalidations.values())
+    _caller_token.reset(caller)
+    assert fetch.call_count == 2
+    # The runtime registration's deployment is gone
+    assert "dep_r" not in await mcp.get_deployment_mapping()
+    assert ToolRegistryStore(discovery.store.path).load() == {}
@@ -0,0 +1,115 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import io
+import os
+from collections import Counter
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.training_sample import (
+    MAX_STRATA,
+    TrainingSampler,
+    _TrainingData,
+    sample_csv,
+)
+from app.core.user_config import UserAppConfig
+
+
+def _csv(rows: int, classes: int = 10) -> bytes:
+    # One row in ten is of class "b", unless there are more classes
+    return (
+        "x,label\n"
+        + "".join(
+            f"{i},{'b' if i % 10 == 0 else 'a' if classes <= 2 else i % classes}\n"
+            for i in range(rows)
+        )
+    ).encode()
+
+
+def test_sample_is_uniform_and_stratified() -> None:
+    """Test samples are read in one pass, uniform, and in class proportions."""
+    sampler = sample_csv(io.BytesIO(_csv(10_000)), 1000, seed=1, block_size=4096)
+    sample = sampler.sample()
+    assert sampler.rows_seen == 10_000
+    assert sample is not None and sample.num_rows == 1000
+    x = [int(v) for v in sample["x"].to_pylist()]
+    assert len(set(x)) == 1000
+    assert 4500 < sum(x) / len(x) < 5500
+
+    sampler = sample_csv(io.BytesIO(_csv(10_000, 2)), 20, "label", 2, 4096)
+    sample = sampler.sample()
+    assert sample is not None
+    assert Counter(sample["label"].to_pylist()) == {"a": 18, "b": 2}
+    assert sampler.stratify_by == "label"
+
+    sampler = sample_csv(io.BytesIO(_csv(10_000, MAX_STRATA + 1)), 20, "label")
+    assert sampler.stratify_by is None
+    assert sampler.sample().num_rows == 20  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_samples_are_cached_in_memory_and_on_disk(tmp_path: Path) -> None:
+    """Test samples are downloaded once, then reused by model version."""
+    training_data = _TrainingData("m1", "ds", "v1", "label")
+    downloads = []
+
+    def get(url: str, stream: bool) -> MagicMock:
+        downloads.append(url)
+        return MagicMock(raw=io.BytesIO(_csv(1000, 2)))
+
+    config = UserAppConfig(MCP_SERVER_TRAINING_SAMPLE_CACHE_DIR=str(tmp_path))
+    with (
+        patch(
+            "app.core.training_sample.get_datarobot_access_token",
+            return_value="token",
+        ),
+        patch(
+            "app.core.training_sample.request_user_dr_sdk",
+            return_value=contextlib.nullcontext(),
+        ),
+        patch("app.core.training_sample._training_data", return_value=training_data),
+        patch(
+            "app.core.training_sample.dr.client.get_client",
+            return_value=MagicMock(get=get),
+        ),
+    ):
+        sampler = TrainingSampler(config)
+        first, shared = await asyncio.gather(
+            sampler.sample("d", 10), sampler.sample("d", 10)
+        )
+        again = await sampler.sample("d", 10)
+        restarted = await TrainingSampler(config).sample("d", 10)
+        training_data.model_id = "m2"
+        replaced = await sampler.sample("d", 10)
+
+    assert downloads == ["datasets/ds/versions/v1/file/"] * 2
+    assert [r["source"] for r in (first, shared, again, restarted, replaced)] == [
+        "dataset",
+        "dataset",
+        "memory",
+        "disk",
+        "dataset",
+    ]
+    assert first == shared == again | {"source": "dataset"}
+    assert first["rows"] == restarted["rows"]
+    assert first["rows_scanned"] == 1000 and first["stratified_by"] == "label"
+    assert Counter(row["label"] for row in first["rows"]) == {"a": 9, "b": 1}
+    assert replaced["model_id"] == "m2"
+    for path in tmp_path.iterdir():
+        assert os.stat(path).st_mode & 0o777 == 0o600
@@ -0,0 +1,106 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Annotated
+
+import httpx
+import pytest
+from fastmcp import Client, Context, FastMCP
+from fastmcp.dependencies import Depends
+from fastmcp.exceptions import ToolError
+from pydantic import Field, StringConstraints
+
+from app.core.concurrency import ConcurrencyLimitMiddleware
+from app.core.http_client import get_http_client
+from app.core.user_config import UserAppConfig
+from app.core.validation import (
+    ArgumentValidationMiddleware,
+    ArgumentValidator,
+    validated_tool,
+)
+
+Key = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+async def lookup(
+    key: Key,
+    ctx: Context,
+    limit: Annotated[int, Field(ge=1, le=100)] = 10,
+    client: httpx.AsyncClient = Depends(get_http_client),
+) -> str:
+    return key
+
+
+def test_validator_skips_injected_parameters() -> None:
+    """Test arguments are validated and defaulted, injected parameters left out."""
+    validator = ArgumentValidator(lookup)
+
+    assert validator.validate({"key": " a "}) == {"key": "a", "limit": 10}
+    for arguments, error in (
+        ({"key": "  "}, "'key': String should have at least 1 character"),
+        ({"key": "a", "limit": 0}, "'limit': Input should be greater than or equal"),
+        ({"key": "a", "ctx": None}, "'ctx': Unexpected keyword argument"),
+        ({}, "'key': Missing required argument"),
+    ):
+        with pytest.raises(ToolError, match=error):
+            validator.validate(arguments)
+
+
+@pytest.mark.asyncio
+async def test_invalid_calls_fail_before_taking_a_slot() -> None:
+    """Test invalid calls are rejected without waiting for a busy tool."""
+    release = asyncio.Event()
+    mcp = FastMCP("test")
+
+    @mcp.tool
+    @validated_tool()
+    async def slow_lookup(key: Key) -> str:
+        await release.wait()
+        return key
+
+    mcp.add_middleware(ArgumentValidationMiddleware())
+    mcp.add_middleware(
+        ConcurrencyLimitMiddleware(
+            UserAppConfig(MCP_SERVER_TOOL_CONCURRENCY_LIMITS="slow_lookup=1")
+        )
+    )
+    async with Client(mcp) as client:
+        busy = asyncio.create_task(client.call_tool("slow_lookup", {"key": "a"}))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ToolError, match="'key': String should have at least"):
+            await asyncio.wait_for(
+                client.call_tool("slow_lookup", {"key": " "}), timeout=1
+            )
+        release.set()
+        assert (await busy).data == "a"
+
+
+@pytest.mark.asyncio
+async def test_tools_are_validated_under_their_registered_name() -> None:
+    """Test a renamed tool is validated and gets the validated arguments."""
+    mcp = FastMCP("test")
+
+    @mcp.tool(name="find")
+    @validated_tool()
+    async def renamed_lookup(
+        key: Key, limit: Annotated[int, Field(ge=1, le=100)] = 10
+    ) -> str:
+        return f"{key!r} {limit}"
+
+    mcp.add_middleware(ArgumentValidationMiddleware())
+    async with Client(mcp) as client:
+        assert (await client.call_tool("find", {"key": " a "})).data == "'a' 10"
+        with pytest.raises(ToolError, match="'limit': Input should be less than"):
+            await client.call_tool("find", {"key": "a", "limit": 101})
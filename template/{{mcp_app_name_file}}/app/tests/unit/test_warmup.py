@@ -0,0 +1,131 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import multiprocessing
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from app.core.warmup import (
+    WarmupManager,
+    WarmupTask,
+    register_health_routes,
+)
+
+
+@pytest.mark.asyncio
+async def test_run_tasks_concurrently() -> None:
+    """Test warm-up tasks run concurrently and the server becomes ready."""
+    manager = WarmupManager()
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    def _task(name: str) -> WarmupTask:
+        async def task(mcp: FastMCP) -> None:
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+
+        return task
+
+    manager.register("first", _task("first"))
+    manager.register("second", _task("second"))
+    assert not manager.ready
+
+    results = await manager.run(MagicMock(), timeout=10)
+
+    assert manager.ready
+    assert {name: r.status for name, r in results.items()} == {
+        "first": "ok",
+        "second": "ok",
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_and_timed_out_tasks_do_not_block_readiness() -> None:
+    """Test failing and slow tasks are reported and the server becomes ready."""
+    manager = WarmupManager()
+
+    async def failing(mcp: FastMCP) -> None:
+        raise RuntimeError("no connection")
+
+    async def slow(mcp: FastMCP) -> None:
+        await asyncio.sleep(10)
+
+    manager.register("failing", failing)
+    manager.register("slow", slow)
+
+    results = await manager.run(MagicMock(), timeout=0.1)
+
+    assert manager.ready
+    assert results["failing"].status == "failed"
+    assert results["failing"].error == "no connection"
+    assert results["slow"].status == "timeout"
+
+
+def test_health_routes() -> None:
+    """Test /readyz is 503 until warm-up finishes while /healthz is always 200."""
+    mcp = FastMCP("test")
+    manager = WarmupManager()
+    register_health_routes(mcp, manager)
+    client = TestClient(mcp.http_app())
+
+    assert client.get("/healthz").json() == {"status": "alive"}
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json()["status"] == "pending"
+
+    manager.mark_ready()
+
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "warmup": {}}
+
+
+def test_readiness_shared_across_workers() -> None:
+    """Test /readyz reports the pool ready only once every worker is ready."""
+    flags = multiprocessing.get_context("spawn").Array("b", 2)
+    mcp = FastMCP("test")
+    manager = WarmupManager()
+    manager.share_readiness(flags, worker_id=0)
+    register_health_routes(mcp, manager)
+    client = TestClient(mcp.http_app())
+
+    manager.mark_ready()
+    assert flags[:] == [1, 0]
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json()["workers"] == {"ready": 1, "total": 2}
+
+    # Worker 1 finished its warm-up in another process
+    flags[1] = 1
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["workers"] == {"ready": 2, "total": 2}
+
+
+def test_draining_server_is_not_ready() -> None:
+    """Test a draining server stays unready, even if warm-up finishes afterwards."""
+    manager = WarmupManager()
+    manager.mark_ready()
+
+    manager.mark_draining()
+    manager.mark_ready()
+
+    assert not manager.ready
+    assert manager.readiness()["status"] == "draining"
@@ -0,0 +1,165 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import time
+from http import HTTPStatus
+from multiprocessing.sharedctypes import SynchronizedArray
+from multiprocessing.synchronize import Event
+from typing import Any
+
+import pytest
+from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.testclient import TestClient
+
+from app.core.sockets import bind_listening_socket
+from app.core.workers import WorkerSupervisor, disable_runtime_registration_routes
+
+
+def _idle_worker(
+    sock: socket.socket, worker_id: int, started: Event, ready: "SynchronizedArray[int]"
+) -> None:
+    """Worker target that starts and blocks until terminated."""
+    started.set()
+    while True:
+        time.sleep(0.1)
+
+
+def _failing_worker(
+    sock: socket.socket, worker_id: int, started: Event, ready: "SynchronizedArray[int]"
+) -> None:
+    """Worker target that fails during startup."""
+    raise SystemExit(3)
+
+
+def _crashing_worker(
+    sock: socket.socket, worker_id: int, started: Event, ready: "SynchronizedArray[int]"
+) -> None:
+    """Worker target that starts and then crashes."""
+    started.set()
+    raise SystemExit(1)
+
+
+def _slow_failing_worker(
+    sock: socket.socket, worker_id: int, started: Event, ready: "SynchronizedArray[int]"
+) -> None:
+    """Worker target whose startup takes a while and then fails."""
+    time.sleep(1)
+    raise SystemExit(4)
+
+
+def test_supervisor_rejects_zero_workers() -> None:
+    """Test at least one worker is required."""
+    with pytest.raises(ValueError):
+        WorkerSupervisor(_idle_worker, socket.socket(), workers=0)
+
+
+def test_supervisor_coordinated_shutdown() -> None:
+    """Test workers are spawned and all stopped on shutdown."""
+    with bind_listening_socket("127.0.0.1", 0) as sock:
+        supervisor = WorkerSupervisor(_idle_worker, sock, workers=2, shutdown_timeout=5)
+        processes: dict[int, Any] = {}
+
+        def _stop_when_started() -> None:
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                processes.update(supervisor.processes)
+                if len(processes) == 2 and all(
+                    p.is_alive() for p in processes.values()
+                ):
+                    break
+                time.sleep(0.1)
+            supervisor.shutdown()
+
+        thread = threading.Thread(target=_stop_when_started)
+        thread.start()
+        assert supervisor.run() == 0
+        thread.join()
+
+    assert len(processes) == 2
+    assert not any(p.is_alive() for p in processes.values())
+
+
+def test_supervisor_stops_on_startup_failure() -> None:
+    """Test a worker failing at startup stops the pool with its exit code."""
+    with bind_listening_socket("127.0.0.1", 0) as sock:
+        supervisor = WorkerSupervisor(_failing_worker, sock, workers=2)
+        assert supervisor.run() == 3
+        assert supervisor.processes == {}
+
+
+def test_supervisor_startup_failure_is_not_time_based() -> None:
+    """Test a worker exiting before signalling readiness is a startup failure."""
+    with bind_listening_socket("127.0.0.1", 0) as sock:
+        supervisor = WorkerSupervisor(_slow_failing_worker, sock, workers=1)
+        assert supervisor.run() == 4
+
+
+def test_supervisor_restarts_crashed_workers_with_backoff() -> None:
+    """Test a worker crashing after startup is respawned with a growing delay."""
+    spawned_at: list[float] = []
+
+    class _RecordingSupervisor(WorkerSupervisor):
+        def _spawn(self, worker_id: int) -> None:
+            spawned_at.append(time.monotonic())
+            super()._spawn(worker_id)
+            if len(spawned_at) == 3:
+                self.shutdown()
+
+    with bind_listening_socket("127.0.0.1", 0) as sock:
+        supervisor = _RecordingSupervisor(
+            _crashing_worker, sock, workers=1, restart_backoff=0.5
+        )
+        assert supervisor.run() == 0
+
+    assert len(spawned_at) == 3
+    # Restarted after 0.5s, then 1s (checks run every 0.5s)
+    assert spawned_at[1] - spawned_at[0] >= 0.5
+    assert spawned_at[2] - spawned_at[1] >= 1.0
+
+
+def test_supervisor_restart_delay() -> None:
+    """Test the restart delay doubles on every crash up to the maximum."""
+    supervisor = WorkerSupervisor(
+        _idle_worker, socket.socket(), workers=1, max_restart_backoff=5
+    )
+    assert [supervisor.restart_delay(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_disable_runtime_registration_routes() -> None:
+    """Test runtime (de)registration routes are refused while reads still work."""
+    mcp = FastMCP("test")
+
+    for path in ("/registeredDeployments/{deployment_id}", "/registeredPrompts"):
+
+        @mcp.custom_route(path, methods=["GET", "PUT", "DELETE"])
+        async def handler(_: Request) -> JSONResponse:
+            return JSONResponse({"ok": True})
+
+    @mcp.custom_route("/registeredPromptsList", methods=["GET"])
+    async def other(_: Request) -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    disable_runtime_registration_routes(mcp)
+
+    client = TestClient(mcp.http_app(transport="streamable-http"))
+    assert client.put("/registeredDeployments/123").status_code == HTTPStatus.CONFLICT
+    assert client.delete("/registeredDeployments/123").status_code == (
+        HTTPStatus.CONFLICT
+    )
+    assert client.put("/registeredPrompts").status_code == HTTPStatus.CONFLICT
+    assert client.get("/registeredPromptsList").status_code == HTTPStatus.OK
@@ -16,27 +16,43 @@ import logging
 from typing import Annotated
 
 from datarobot_genai.drmcp import dr_mcp_tool  # noqa: F401
-from fastmcp.exceptions import ToolError
 from fastmcp.tools.tool import ToolResult
+from pydantic import Field, StringConstraints
+
+from app.core.validation import validated_tool  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
 """
 Example of a user tool, use as a template for your own tools implementation.
-NOTE: uncomment the @dr_mcp_tool decorator to register the tool
+NOTE: uncomment the @dr_mcp_tool and @validated_tool decorators to register the tool
+For outbound HTTP calls, reuse the shared pooled client instead of opening a
+session per call: `client: httpx.AsyncClient = Depends(get_http_client)`
+(see app/core/http_client.py).
+To memoize results that depend only on the arguments, add `@cached_tool(ttl=...)`
+under the @dr_mcp_tool decorator (see app/core/tool_cache.py).
+Tools calling blocking code (the datarobot SDK, pandas) should be plain functions
+decorated with `@run_in_executor("thread")` (see app/core/executors.py).
+Tools returning large CSV or JSON payloads can yield them in chunks from an async
+generator decorated with `@streaming_tool()` (see app/core/streaming.py).
+Declare argument constraints in the annotations and add `@validated_tool()` under
+the @dr_mcp_tool decorator, so invalid calls are rejected before the tool is
+scheduled (see app/core/validation.py).
 """
 
 
 # @dr_mcp_tool(tags={"user", "tools", "example"})
+# @validated_tool()
 async def user_tool_example(
-    argument1: Annotated[str, "A user tool example argument."],
+    argument1: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1),
+        Field(description="A user tool example argument."),
+    ],
 ) -> ToolResult:
     """
     A user tool example description.
     """
 
-    if not argument1 or not argument1.strip():
-        raise ToolError("Argument validation error: 'argument1' cannot be empty.")
-
     logger.info(f"User tool example called with argument: {argument1}")
     return ToolResult(structured_content={"message": "user tool example"})
@@ -0,0 +1,74 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import Any
+
+import click
+
+from dev_tools.benchmarks.event_loop import run_event_loop_benchmark
+from dev_tools.benchmarks.prediction_validation import (
+    run_prediction_validation_benchmark,
+)
+from dev_tools.benchmarks.validation import run_validation_benchmark
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+@cli.command(name="event-loop")
+@click.option(
+    "--requests", default=500, show_default=True, help="Requests per operation."
+)
+@click.option(
+    "--concurrency", default=16, show_default=True, help="Concurrent requests."
+)
+def event_loop(requests: int, concurrency: int) -> None:
+    """Compare tools/list and tools/call latency on the asyncio and uvloop loops."""
+    results: list[dict[str, Any]] = []
+    for loop_type in ("asyncio", "uvloop"):
+        stats = run_event_loop_benchmark(
+            loop_type, requests=requests, concurrency=concurrency
+        )
+        if stats[0].event_loop != loop_type:
+            click.echo(f"Skipping {loop_type}: it is not installed", err=True)
+            continue
+        results.extend(s.to_dict() for s in stats)
+    click.echo(json.dumps(results, indent=2))
+
+
+@cli.command(name="validation")
+@click.option(
+    "--iterations", default=10000, show_default=True, help="Calls per operation."
+)
+def validation(iterations: int) -> None:
+    """Compare manual and compiled argument validation of a user tool."""
+    stats = run_validation_benchmark(iterations=iterations)
+    click.echo(json.dumps([s.to_dict() for s in stats], indent=2))
+
+
+@cli.command(name="prediction-validation")
+@click.option(
+    "--rows", default=1_000_000, show_default=True, help="Rows of the CSV file."
+)
+def prediction_validation(rows: int) -> None:
+    """Compare the polars and columnar validation of prediction data."""
+    stats = run_prediction_validation_benchmark(rows=rows)
+    click.echo(json.dumps([s.to_dict() for s in stats], indent=2))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,219 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Round-trip latency benchmark of the asyncio and uvloop event loops.
+
+A small FastMCP server is started in a child process with the event loop under
+test (through ``CustomEventLoopPolicy``). Its ``proxy`` tool forwards every
+call to an upstream HTTP endpoint served by the same process, mimicking the
+deployment-proxy tools. The parent process measures ``tools/list`` and
+``tools/call`` round trips over streamable HTTP.
+"""
+
+import asyncio
+import multiprocessing
+import socket
+import time
+from dataclasses import asdict, dataclass
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import httpx
+import uvicorn
+from fastmcp import FastMCP
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.user_config import EventLoopType
+from app.main import CustomEventLoopPolicy
+
+
+@dataclass
+class LatencyStats:
+    operation: str
+    event_loop: str
+    requests: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``samples`` (fraction in [0, 1])."""
+    if not samples:
+        raise ValueError("samples must not be empty")
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(operation: str, event_loop: str, samples: list[float]) -> LatencyStats:
+    """Summarize latency samples given in seconds."""
+    return LatencyStats(
+        operation=operation,
+        event_loop=event_loop,
+        requests=len(samples),
+        mean_ms=round(sum(samples) / len(samples) * 1000, 3),
+        p50_ms=round(percentile(samples, 0.5) * 1000, 3),
+        p90_ms=round(percentile(samples, 0.9) * 1000, 3),
+        p99_ms=round(percentile(samples, 0.99) * 1000, 3),
+    )
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _build_benchmark_server(upstream_url: str) -> FastMCP:
+    mcp = FastMCP("event-loop-benchmark")
+    client = httpx.AsyncClient(base_url=upstream_url)
+
+    @mcp.tool
+    async def echo(text: str) -> str:
+        """Return the given text."""
+        return text
+
+    @mcp.tool
+    async def proxy(payload: str) -> dict[str, Any]:
+        """Forward the payload to the upstream service."""
+        response = await client.post("/predict", json={"payload": payload})
+        return dict(response.json())
+
+    return mcp
+
+
+async def _upstream_predict(request: Request) -> JSONResponse:
+    body = await request.json()
+    return JSONResponse({"prediction": len(body.get("payload", ""))})
+
+
+async def _serve(port: int, upstream_port: int) -> None:
+    upstream = uvicorn.Server(
+        uvicorn.Config(
+            Starlette(routes=[Route("/predict", _upstream_predict, methods=["POST"])]),
+            host="127.0.0.1",
+            port=upstream_port,
+            log_level="error",
+        )
+    )
+    mcp = _build_benchmark_server(f"http://127.0.0.1:{upstream_port}")
+    await asyncio.gather(
+        upstream.serve(),
+        mcp.run_http_async(
+            transport="http",
+            host="127.0.0.1",
+            port=port,
+            show_banner=False,
+            log_level="error",
+            stateless_http=True,
+        ),
+    )
+
+
+def _serve_benchmark_server(
+    event_loop: EventLoopType, port: int, upstream_port: int
+) -> None:
+    policy = CustomEventLoopPolicy(event_loop)
+    asyncio.set_event_loop_policy(policy)
+    asyncio.run(_serve(port, upstream_port))
+
+
+async def _wait_until_ready(
+    url: str, process: BaseProcess, timeout: float = 60.0
+) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if not process.is_alive():
+                raise RuntimeError(
+                    f"Benchmark server exited with code {process.exitcode}"
+                )
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise TimeoutError(f"Benchmark server at {url} did not start in {timeout}s")
+
+
+async def _measure(
+    url: str, process: BaseProcess, event_loop: str, requests: int, concurrency: int
+) -> list[LatencyStats]:
+    await _wait_until_ready(url, process)
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def timed(operation: Any) -> float:
+                async with semaphore:
+                    started = time.perf_counter()
+                    await operation()
+                    return time.perf_counter() - started
+
+            # Warm up connections and caches before measuring
+            await session.list_tools()
+            await session.call_tool("proxy", {"payload": "warm-up"})
+
+            list_samples = await asyncio.gather(
+                *(timed(session.list_tools) for _ in range(requests))
+            )
+            call_samples = await asyncio.gather(
+                *(
+                    timed(lambda: session.call_tool("proxy", {"payload": "x" * 64}))
+                    for _ in range(requests)
+                )
+            )
+    return [
+        summarize("tools/list", event_loop, list(list_samples)),
+        summarize("tools/call", event_loop, list(call_samples)),
+    ]
+
+
+def run_event_loop_benchmark(
+    event_loop: EventLoopType, requests: int = 500, concurrency: int = 16
+) -> list[LatencyStats]:
+    """Benchmark tools/list and tools/call round trips against a server on ``event_loop``."""
+    loop_type = CustomEventLoopPolicy(event_loop).loop_type
+    port, upstream_port = _free_port(), _free_port()
+    process = multiprocessing.get_context("spawn").Process(
+        target=_serve_benchmark_server,
+        args=(event_loop, port, upstream_port),
+        daemon=True,
+    )
+    process.start()
+    try:
+        return asyncio.run(
+            _measure(
+                f"http://127.0.0.1:{port}/mcp/",
+                process,
+                loop_type,
+                requests,
+                concurrency,
+            )
+        )
+    finally:
+        process.terminate()
+        process.join()
@@ -0,0 +1,202 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of prediction data validation.
+
+Generates a time series CSV of ``rows`` rows, with a few values that are not
+numbers or dates, and validates it on three paths:
+
+* ``polars``: ``deployment_validate_prediction_data`` of ``datarobot-genai``,
+  loading the whole CSV string into a DataFrame;
+* ``columnar``: the engine of app/core/prediction_validation.py on the same
+  CSV string, as the tool replaced by ``register_prediction_validation`` does;
+* ``columnar_file``: the engine reading the file block by block.
+
+Each path runs in a fresh process. ``peak_rss_mb`` is the growth of its
+resident memory during the validation, sampled every millisecond, including
+the CSV string of the inline paths. Sampling reads ``/proc`` and is only
+available on Linux, elsewhere it is reported as null.
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import polars as pl
+
+from app.core.feature_metadata import DEPLOYMENT_INFO_MODULE
+from app.core.prediction_validation import validate_prediction_csv
+
+PATHS = ("polars", "columnar", "columnar_file")
+
+FEATURES: dict[str, Any] = {
+    "features": [
+        {"name": "date", "feature_type": "Date", "importance": 0.9},
+        {"name": "store", "feature_type": "Categorical", "importance": 0.7},
+        {"name": "temperature", "feature_type": "numeric", "importance": 0.6},
+        {"name": "units", "feature_type": "numeric", "importance": 0.5},
+        {"name": "promotion", "feature_type": "Categorical", "importance": 0.2},
+        {"name": "holiday", "feature_type": "Categorical", "importance": 0.05},
+    ],
+    "model_type": "Regression",
+    "time_series_config": {
+        "datetime_column": "date",
+        "series_id_columns": ["store"],
+    },
+}
+
+
+@dataclass
+class PredictionValidationStats:
+    path: str
+    rows: int
+    file_mb: float
+    seconds: float
+    peak_rss_mb: Optional[float]
+    status: str
+    warnings: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def write_prediction_csv(path: str, rows: int, seed: int = 0) -> None:
+    """Write a CSV of ``rows`` rows with the columns of ``FEATURES``."""
+    rng = np.random.default_rng(seed)
+    temperature = np.round(rng.normal(20, 8, rows), 2).astype(str).astype(object)
+    temperature[rng.random(rows) < 0.001] = "n/a"
+    temperature[rng.random(rows) < 0.01] = ""
+    dates = (
+        (
+            np.datetime64("2020-01-01")
+            + rng.integers(0, 2000, rows).astype("timedelta64[D]")
+        )
+        .astype(str)
+        .astype(object)
+    )
+    dates[rng.random(rows) < 0.0001] = "yesterday"
+    pl.DataFrame(
+        {
+            "date": dates.tolist(),
+            "store": [f"store_{i}" for i in rng.integers(0, 500, rows)],
+            "temperature": temperature.tolist(),
+            "units": rng.integers(0, 1000, rows),
+            "promotion": rng.choice(["yes", "no", ""], rows).tolist(),
+            "notes": rng.choice(["", "restocked", "closed early"], rows).tolist(),
+        }
+    ).write_csv(path)
+
+
+def _rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+class _PeakSampler(threading.Thread):
+    """Sample the resident memory of the process until stopped."""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.baseline = _rss_mb()
+        self.peak = self.baseline
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while self.peak is not None and not self.stopped.wait(0.001):
+            self.peak = max(self.peak, _rss_mb() or 0.0)
+
+    def growth(self) -> Optional[float]:
+        self.stopped.set()
+        self.join()
+        if self.peak is None or self.baseline is None:
+            return None
+        return round(self.peak - self.baseline, 1)
+
+
+def _validate(path: str, csv_file: str) -> dict[str, Any]:
+    if path == "columnar_file":
+        return validate_prediction_csv(csv_file, FEATURES)
+    with open(csv_file, encoding="utf-8") as f:
+        csv_string = f.read()
+    if path == "columnar":
+        return validate_prediction_csv(csv_string.strip().encode(), FEATURES)
+    module: Any = importlib.import_module(DEPLOYMENT_INFO_MODULE)
+    with patch.object(
+        module, "deployment_get_features", AsyncMock(return_value=FEATURES)
+    ):
+        report: dict[str, Any] = asyncio.run(
+            module.deployment_validate_prediction_data(
+                deployment_id="benchmark", csv_string=csv_string
+            )
+        )
+    return report
+
+
+def _measure(path: str, csv_file: str, results: Any) -> None:
+    sampler = _PeakSampler()
+    sampler.start()
+    started = time.perf_counter()
+    report = _validate(path, csv_file)
+    seconds = time.perf_counter() - started
+    results.put(
+        (
+            round(seconds, 3),
+            sampler.growth(),
+            report["status"],
+            len(report["warnings"]),
+        )
+    )
+
+
+def run_prediction_validation_benchmark(
+    rows: int = 1_000_000,
+) -> list[PredictionValidationStats]:
+    """Benchmark prediction data validation, one process per path."""
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, "predictions.csv")
+        write_prediction_csv(csv_file, rows)
+        file_mb = round(os.path.getsize(csv_file) / 1024 / 1024, 1)
+        stats = []
+        for path in PATHS:
+            results = context.Queue()
+            process = context.Process(target=_measure, args=(path, csv_file, results))
+            process.start()
+            seconds, peak_rss_mb, status, warnings = results.get()
+            process.join()
+            stats.append(
+                PredictionValidationStats(
+                    path=path,
+                    rows=rows,
+                    file_mb=file_mb,
+                    seconds=seconds,
+                    peak_rss_mb=peak_rss_mb,
+                    status=status,
+                    warnings=warnings,
+                )
+            )
+    return stats
@@ -0,0 +1,171 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmark of tool argument validation.
+
+Compares the validation of the ``user_tool_example`` arguments on two paths:
+
+* ``manual``: the previous template, ``Annotated[str, "..."]`` checked by hand
+  in the tool body, so the check runs after fastmcp validated the arguments and
+  the call went through the middleware chain;
+* ``compiled``: declarative constraints validated by the validator compiled by
+  ``validated_tool`` (app/core/validation.py).
+
+``validate`` measures validation alone, ``reject`` the time until an invalid
+call fails through ``FastMCP.call_tool`` with the server middleware installed.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Annotated, Any
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+from fastmcp.utilities.types import get_cached_typeadapter
+from pydantic import Field, StringConstraints
+from pydantic import ValidationError as PydanticValidationError
+
+from app.core.concurrency import ConcurrencyLimitMiddleware
+from app.core.user_config import UserAppConfig
+from app.core.validation import (
+    ArgumentValidationMiddleware,
+    ArgumentValidator,
+    validated_tool,
+)
+from dev_tools.benchmarks.event_loop import percentile
+
+VALID = {"argument1": "test"}
+INVALID = {"argument1": "   "}
+
+
+@dataclass
+class ValidationStats:
+    operation: str
+    path: str
+    calls: int
+    mean_us: float
+    p50_us: float
+    p99_us: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def summarize(operation: str, path: str, samples: list[float]) -> ValidationStats:
+    """Summarize timings given in seconds."""
+    return ValidationStats(
+        operation=operation,
+        path=path,
+        calls=len(samples),
+        mean_us=round(sum(samples) / len(samples) * 1e6, 3),
+        p50_us=round(percentile(samples, 0.5) * 1e6, 3),
+        p99_us=round(percentile(samples, 0.99) * 1e6, 3),
+    )
+
+
+async def manual_example(
+    argument1: Annotated[str, "A user tool example argument."],
+) -> ToolResult:
+    """The user tool example, with the argument checked in the body."""
+    if not argument1 or not argument1.strip():
+        raise ToolError("Argument validation error: 'argument1' cannot be empty.")
+    return ToolResult(structured_content={"message": "user tool example"})
+
+
+@validated_tool()
+async def compiled_example(
+    argument1: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1),
+        Field(description="A user tool example argument."),
+    ],
+) -> ToolResult:
+    """The user tool example, with declarative argument constraints."""
+    return ToolResult(structured_content={"message": "user tool example"})
+
+
+def _build_server() -> FastMCP:
+    mcp = FastMCP("validation-benchmark")
+    mcp.tool(manual_example)
+    mcp.tool(compiled_example)
+    mcp.add_middleware(ArgumentValidationMiddleware())
+    mcp.add_middleware(
+        ConcurrencyLimitMiddleware(
+            UserAppConfig(
+                MCP_SERVER_TOOL_CONCURRENCY_LIMITS="manual_example=16,compiled_example=16"
+            )
+        )
+    )
+    return mcp
+
+
+def _manual_validate(arguments: dict[str, Any]) -> None:
+    # What fastmcp and the tool body do for every call of manual_example
+    bound = get_cached_typeadapter(manual_example).validate_python(arguments)
+    bound.close()
+    argument1 = arguments.get("argument1")
+    if not argument1 or not argument1.strip():
+        raise ToolError("Argument validation error: 'argument1' cannot be empty.")
+
+
+async def _time(
+    operation: Callable[[], Awaitable[Any]], iterations: int
+) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        try:
+            await operation()
+        except (ToolError, PydanticValidationError):
+            pass
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _measure(iterations: int) -> list[ValidationStats]:
+    mcp = _build_server()
+    validator = ArgumentValidator(compiled_example)
+
+    async def manual_validate() -> None:
+        _manual_validate(VALID)
+
+    async def compiled_validate() -> None:
+        validator.validate(VALID)
+
+    async def manual_reject() -> None:
+        await mcp.call_tool("manual_example", INVALID)
+
+    async def compiled_reject() -> None:
+        await mcp.call_tool("compiled_example", INVALID)
+
+    results = []
+    for operation, path, call in (
+        ("validate", "manual", manual_validate),
+        ("validate", "compiled", compiled_validate),
+        ("reject", "manual", manual_reject),
+        ("reject", "compiled", compiled_reject),
+    ):
+        # Warm up caches before measuring
+        await _time(call, min(iterations, 100))
+        results.append(summarize(operation, path, await _time(call, iterations)))
+    return results
+
+
+def run_validation_benchmark(iterations: int = 10000) -> list[ValidationStats]:
+    """Benchmark argument validation of the manual and compiled paths."""
+    return asyncio.run(_measure(iterations))
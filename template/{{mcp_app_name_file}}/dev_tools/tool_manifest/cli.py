@@ -0,0 +1,54 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+from typing import Optional
+
+import click
+from datarobot_genai.drmcp import get_config
+from datarobot_genai.drmcp.core.mcp_instance import mcp
+
+from app.core.lazy_tools import (
+    ToolManifest,
+    generate_tool_manifest,
+    get_default_manifest_path,
+)
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+async def run_generate_tool_manifest(output: str) -> ToolManifest:
+    return await generate_tool_manifest(mcp, get_config(), output)
+
+
+@cli.command(name="generate")
+@click.option(
+    "--output",
+    default=None,
+    help="Manifest path (defaults to app/tool_manifest.json).",
+)
+def generate(output: Optional[str]) -> None:
+    """Import every tool module and record its tools and import time."""
+    output = output or get_default_manifest_path()
+    manifest = asyncio.run(run_generate_tool_manifest(output))
+    click.echo(
+        f"Saved {len(manifest.tools)} tools from {len(manifest.import_seconds)} "
+        f"modules ({sum(manifest.import_seconds.values()):.3f}s of imports) to {output}"
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,60 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from dev_tools.benchmarks.cli import event_loop
+from dev_tools.benchmarks.event_loop import LatencyStats, percentile, summarize
+
+
+class TestLatencyStats:
+    def test_percentile(self) -> None:
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 0.5) == 50.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile(samples, 0.0) == 1.0
+        assert percentile(samples, 1.0) == 100.0
+
+    def test_percentile_empty(self) -> None:
+        with pytest.raises(ValueError):
+            percentile([], 0.5)
+
+    def test_summarize(self) -> None:
+        stats = summarize("tools/list", "asyncio", [0.001, 0.002, 0.003])
+        assert stats.requests == 3
+        assert stats.mean_ms == 2.0
+        assert stats.p50_ms == 2.0
+        assert stats.p99_ms == 3.0
+
+
+class TestEventLoopCli:
+    def test_skips_missing_uvloop(self) -> None:
+        def fake_benchmark(loop_type: str, **kwargs: int) -> list[LatencyStats]:
+            # uvloop not installed: the server falls back to asyncio
+            return [summarize("tools/list", "asyncio", [0.001])]
+
+        with patch(
+            "dev_tools.benchmarks.cli.run_event_loop_benchmark",
+            side_effect=fake_benchmark,
+        ):
+            result = CliRunner().invoke(event_loop, ["--requests", "1"])
+
+        assert result.exit_code == 0
+        assert "Skipping uvloop" in result.output
+        payload = json.loads(result.output[result.output.index("[") :])
+        assert [r["event_loop"] for r in payload] == ["asyncio"]
@@ -0,0 +1,66 @@
+# Copyright 2026 DataRobot, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from app.core.lazy_tools import ToolManifest, ToolModule, load_tool_manifest
+from dev_tools.tool_manifest.cli import generate, run_generate_tool_manifest
+
+
+class TestGenerateToolManifest:
+    @pytest.mark.asyncio
+    async def test_run_generate_tool_manifest(self, tmp_path: Path) -> None:
+        manifest = ToolManifest(
+            enabled_tool_types=["predictive"],
+            modules={"app.tools.user_tools": ToolModule(name="app.tools.user_tools")},
+            import_seconds={"app.tools.user_tools": 0.01},
+            tools=[],
+        )
+        output = str(tmp_path / "tool_manifest.json")
+        with (
+            patch(
+                "app.core.lazy_tools.discover_tool_modules",
+                return_value=list(manifest.modules.values()),
+            ) as mock_discover,
+            patch(
+                "app.core.lazy_tools.build_tool_manifest",
+                new_callable=AsyncMock,
+                return_value=manifest,
+            ) as mock_build,
+        ):
+            assert await run_generate_tool_manifest(output) == manifest
+
+        mock_discover.assert_called_once()
+        assert mock_build.call_args.args[2] == list(manifest.modules.values())
+        assert load_tool_manifest(output) == manifest
+
+    def test_cli_invoke_run_generate_tool_manifest(self, tmp_path: Path) -> None:
+        output = str(tmp_path / "tool_manifest.json")
+        manifest = ToolManifest(
+            enabled_tool_types=[], modules={}, import_seconds={}, tools=[]
+        )
+        with patch(
+            "dev_tools.tool_manifest.cli.run_generate_tool_manifest",
+            new_callable=AsyncMock,
+            return_value=manifest,
+        ) as mock_run:
+            result = CliRunner().invoke(generate, ["--output", output])
+
+        assert result.exit_code == 0
+        mock_run.assert_awaited_once_with(output)
+        assert "Saved 0 tools from 0 modules" in result.output